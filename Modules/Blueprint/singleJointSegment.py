@@ -1,8 +1,8 @@
 import System.blueprint as blueprintMod
+import System.utils as utils
 import maya.cmds as cmds
 import os
-import importlib
-importlib.reload(blueprintMod)
+utils.reloadModule(blueprintMod)
 
 CLASS_NAME = "SingleJointSegment"
 MODULE_DESCRIPTION = "Creates 2 joints with control for 1st joint's orientation and rotation order. Ideal use: Clavicle/Shoulder"
@@ -56,7 +56,6 @@ class SingleJointSegment(blueprintMod.Blueprint):
 
         cleanParent = f'{self.moduleNamespace}:joints_grp'
         orientationInfo = self.orientationControlledJoint_getOrientation(joints[0], cleanParent)
-        cmds.delete(orientationInfo[1])
         jointOrientationValues.append(orientationInfo[0])
         jointOrientations = (jointOrientationValues, None)
 
@@ -12,16 +12,20 @@ import os
 from operator import contains
 
 import maya.cmds as cmds
+import maya.mel as mel
 from PySide6 import QtCore, QtWidgets
 import System.utils as utils
+import System.sceneIndex as sceneIndex
+import System.orientationSolver as orientationSolver
+import System.mirrorEngine as mirrorEngine
 import importlib
 
-importlib.reload(utils)  # Reload the utils module to ensure the latest version is used.
+utils.reloadModule(utils)  # Reload the utils module if its source changed (always in development mode).
 
 
 class Blueprint:
 
-    def __init__(self, moduleName, userSpecifiedName, jointInfo, hookObjectIn):
+    def __init__(self, moduleName, userSpecifiedName, jointInfo, hookObjectIn, useMatrixSegments = False):
         """
         Initializes a new instance of the Blueprint module.
 
@@ -31,6 +35,8 @@ class Blueprint:
             jointInfo (list): A list of tuples, each containing (joint_name, joint_position).
             hookObjectIn (str): The name of a potential hook object from the Maya selection.
                                 This is typically a translation control from another module.
+            useMatrixSegments (bool): Build the joint segments from aimMatrix/distanceBetween networks instead of
+                                      IK handles, see `setupMatrixJointSegment`.
         """
 
         # Module Identification Attributes
@@ -67,6 +73,8 @@ class Blueprint:
         self.canBeMirrored = True
         self.mirrored = False
 
+        self.useMatrixSegments = useMatrixSegments
+
     # Methods intended for overriding by derived class
     def install_custom(self, joints):
         """
@@ -122,7 +130,18 @@ class Blueprint:
 
         return None
 
-    def lockPhase2(self, moduleInfo):
+    def getMirrorInfo(self):
+        """
+        Returns the mirrorInfo value of the blueprint module group, or None if the module was not mirrored.
+        """
+        oldModuleGrp = f'{self.moduleNamespace}:module_grp'
+
+        if cmds.objExists(oldModuleGrp) and cmds.attributeQuery('mirrorInfo', node = oldModuleGrp, exists = True):
+            return cmds.getAttr(f'{oldModuleGrp}.mirrorInfo')
+
+        return None
+
+    def lockPhase2(self, moduleInfo, mirrorInfo = None):
         """
         Second phase of the locking process for a blueprint module.
 
@@ -132,6 +151,8 @@ class Blueprint:
         Args:
             moduleInfo (tuple): A tuple containing all necessary joint and module information
                                  as returned by `lockPhase1`.
+            mirrorInfo (int, optional): The module's mirrorInfo value. Only used when the blueprint container
+                                        was already deleted by the caller, otherwise it is read from the module group.
         """
 
         jointPositions = moduleInfo[0]
@@ -163,15 +184,12 @@ class Blueprint:
 
         rootTransform = moduleInfo[5]
 
-        mirrorInfo = None
-        oldModuleGrp = f'{self.moduleNamespace}:module_grp'
-
-        if cmds.attributeQuery('mirrorInfo', node = oldModuleGrp, exists = True):
-            mirrorInfo = cmds.getAttr(f'{oldModuleGrp}.mirrorInfo')
-
-        cmds.lockNode(self.containerName, lock = False, lockUnpublished = False)  # Delete blueprint controls and unlock the container.
+        # lockClicked deletes all blueprint containers in one call before phase 2, a single module deletes its own.
+        if cmds.objExists(self.containerName):
+            mirrorInfo = self.getMirrorInfo()
 
-        cmds.delete(self.containerName)
+            cmds.lockNode(self.containerName, lock = False, lockUnpublished = False)  # Delete blueprint controls and unlock the container.
+            cmds.delete(self.containerName)
 
         cmds.namespace(setNamespace = ':')  # Set current namespace to root.
 
@@ -180,54 +198,40 @@ class Blueprint:
         if numJoints == 1:
             jointRadius = 1.5
 
-        newJoints = []
-
-        # Create new joints based on the gathered information.
-        for i in range(numJoints):
-            newJoint = ''
-
-            cmds.select(clear = True)
-
-            if orientWithAxis:
+        # Axis information (orientJoint, secondaryAxisOrient) is turned into orients for the whole chain at once.
+        if orientWithAxis:
+            jointOrientations = orientationSolver.computeChainOrients(jointPositions, jointOrientations).tolist()
+            numOrientations = numJoints
 
-                # Create joint with specified position and default rotation order.
-                newJoint = cmds.joint(name = f'{self.moduleNamespace}:blueprint_{self.jointInfo[i][0]}', position = jointPositions[i], rotationOrder = 'xyz', radius = jointRadius)
-
-                if i != 0:
-                    cmds.parent(newJoint, newJoints[i - 1], absolute = True)  # Parent the joint to the previous one in the hierarchy.
-                    offsetIndex = i - 1
-
-                    if offsetIndex < numOrientations:
-                        # Apply joint orientation and secondary axis orientation.
-                        cmds.joint(newJoints[offsetIndex], edit = True, orientJoint = jointOrientations[offsetIndex][0], secondaryAxisOrient = jointOrientations[offsetIndex][1])
-
-                        # Freeze transformations to apply the orientation.
-                        cmds.makeIdentity(newJoint, rotate = True, apply = True)
+        newJoints = []
 
-            else:
-                if i != 0:
-                    cmds.select(newJoints[i - 1])
+        # Create new joints based on the gathered information. Each joint is created under the previous one, already oriented.
+        cmds.select(clear = True)
 
-                jointOrientation = [0.0, 0.0, 0.0]
+        for i in range(numJoints):
+            jointOrientation = [0.0, 0.0, 0.0]
 
-                if i < numOrientations:
-                    jointOrientation = [jointOrientations[i][0], jointOrientations[i][1], jointOrientations[i][2]]
+            if i < numOrientations:
+                jointOrientation = [jointOrientations[i][0], jointOrientations[i][1], jointOrientations[i][2]]
 
-                # Create joint with specified position and orientation.
-                newJoint = cmds.joint(name = f'{self.moduleNamespace}:blueprint_{self.jointInfo[i][0]}', position = jointPositions[i], orientation = jointOrientation, rotationOrder = 'xyz', radius = jointRadius)
+            # Create joint with specified position and orientation.
+            newJoint = cmds.joint(name = f'{self.moduleNamespace}:blueprint_{self.jointInfo[i][0]}', position = jointPositions[i], orientation = jointOrientation, rotationOrder = 'xyz', radius = jointRadius)
 
             newJoints.append(newJoint)
 
+        # Joint attributes and the utility network below are collected first and created in one batch.
+        network = utils.NodeNetwork()
 
+        for i, newJoint in enumerate(newJoints):
             if i < numRotationOrders:  # Apply rotation order if available.
-                cmds.setAttr(f'{newJoint}.rotateOrder', jointRotationOrders[i])
+                network.setAttr(f'{newJoint}.rotateOrder', jointRotationOrders[i])
 
             if i < numPreferredAngles:  # Apply preferred angles if available.
-                cmds.setAttr(f'{newJoint}.preferredAngleX', jointPreferredAngles[i][0])
-                cmds.setAttr(f'{newJoint}.preferredAngleY', jointPreferredAngles[i][1])
-                cmds.setAttr(f'{newJoint}.preferredAngleZ', jointPreferredAngles[i][2])
+                network.setAttr(f'{newJoint}.preferredAngle', *jointPreferredAngles[i][:3], type = 'double3')
 
-            cmds.setAttr(f'{newJoint}.segmentScaleCompensate', 0)  # Disable segment scale compensate for all new joints.
+            network.setAttr(f'{newJoint}.segmentScaleCompensate', 0)  # Disable segment scale compensate for all new joints.
+
+        network.build()
 
         blueprintGrp = cmds.group(empty = True, name = f'{self.moduleNamespace}:blueprint_joints_grp')  # Group the newly created blueprint joints.
         cmds.parent(newJoints[0], blueprintGrp, absolute = True)
@@ -237,9 +241,14 @@ class Blueprint:
 
         creationPoseGrpNodes.pop(0)
 
-        for index, node in enumerate(creationPoseGrpNodes):  # Rename and hide the duplicated joints.
-            renamedNode = cmds.rename(node, f'{self.moduleNamespace}:creationPose_{self.jointInfo[index][0]}')
-            cmds.setAttr(f'{renamedNode}.visibility', 0)
+        # Rename and hide the duplicated joints in one batch. The names from duplicate -renameChildren are unique, so the order does not matter.
+        renameStatements = []
+        for index, node in enumerate(creationPoseGrpNodes):
+            renamedNode = f'{self.moduleNamespace}:creationPose_{self.jointInfo[index][0]}'
+            renameStatements.append(f'rename "{node}" "{renamedNode}"; setAttr "{renamedNode}.visibility" 0;')
+
+        if renameStatements:
+            mel.eval('\n'.join(renameStatements))
 
         cmds.addAttr(blueprintGrp, attributeType = 'bool', defaultValue = 0, longName = 'controlModulesInstalled', keyable = False)  # Add a custom attribute to the blueprint group for installed modules.
 
@@ -253,84 +262,57 @@ class Blueprint:
         cmds.addAttr(settingsLocator, attributeType = 'enum', longName = 'activeModule', enumName = 'None:', keyable = False)  # Add attributes to the settings locator for active module and creation pose weight.
         cmds.addAttr(settingsLocator, attributeType = 'float', longName = 'creationPoseWeight', defaultValue = 1, keyable = False)
 
-        utilityNodes = []
+        # Read the creation pose values before the utility nodes drive the channels.
+        originalTxValues = [None] + utils.getTranslateXValues(newJoints[1:])
 
-        for index, joint in enumerate(newJoints):  # Create utility nodes for joint rotations and translations.
-            if index < (numJoints - 1) or numJoints == 1:
-                # Create plusMinusAverage node for joint rotations.
-                addNode = cmds.createNode('plusMinusAverage', name = f'{joint}_addRotations')
-                cmds.connectAttr(f'{addNode}.output3D', f'{joint}.rotate', force = True)
-                utilityNodes.append(addNode)
-
-                # Create multiplyDivide node for dummy rotations.
-                dummyRotationsMultiply = cmds.createNode('multiplyDivide', name = f'{joint}_dummyRotationsMultiply')
-                cmds.connectAttr(f'{dummyRotationsMultiply}.output', f'{addNode}.input3D[0]', force = True)
-                utilityNodes.append(dummyRotationsMultiply)
-
-            if index > 0:
+        if rootTransform:
+            originalTranslates = cmds.getAttr(f'{newJoints[0]}.translate')[0]
+            originalScales = cmds.getAttr(f'{newJoints[0]}.scale')[0]
 
-                # For child joints, handle translateX.
-                originalTx = cmds.getAttr(f'{joint}.tx')
-                addTxNode = cmds.createNode('plusMinusAverage', name = f'{joint}_addTx')
-                cmds.connectAttr(f'{addTxNode}.output1D', f'{joint}.translateX', force = True)
-                utilityNodes.append(addTxNode)
+        network = utils.NodeNetwork()
+        creationPoseWeight = f'{settingsLocator}.creationPoseWeight'
 
-                originalTxMultiply = cmds.createNode('multiplyDivide', name = f'{joint}_original_Tx')
-                cmds.setAttr(f'{originalTxMultiply}.input1X', originalTx, lock = True)
-                cmds.connectAttr(f'{settingsLocator}.creationPoseWeight', f'{originalTxMultiply}.input2X')
-                cmds.connectAttr(f'{originalTxMultiply}.outputX', f'{addTxNode}.input1D[0]', force = True)
-                utilityNodes.append(originalTxMultiply)
-
-            else:
-                # For the root joint, handle translation and scale if rootTransform is True.
-                if rootTransform:
+        # The creation pose drives the joints directly. Rotations stay constant, translations are scaled by creationPoseWeight.
+        # Control modules are switched in later through choice nodes (utils.registerControlModule), so no sum nodes are needed here.
+        for index, joint in enumerate(newJoints):
+            if index < (numJoints - 1) or numJoints == 1:
+                network.setAttr(f'{joint}.rotate', 0.0, 0.0, 0.0, type = 'double3')
 
-                    # Translation
-                    originalTranslates = cmds.getAttr(f'{joint}.translate')[0]
-                    addTranslateNode = cmds.createNode('plusMinusAverage', name = f'{joint}_addTranslate')
-                    cmds.connectAttr(f'{addTranslateNode}.output3D', f'{joint}.translate', force = True)
-                    utilityNodes.append(addTranslateNode)
+            if index > 0:
+                originalTxMultiply = network.createNode('multiplyDivide', f'{joint}_original_Tx')
+                network.setAttr(f'{originalTxMultiply}.input1X', originalTxValues[index], lock = True)
+                network.connectAttr(creationPoseWeight, f'{originalTxMultiply}.input2X', force = False)
+                network.connectAttr(f'{originalTxMultiply}.outputX', f'{joint}.translateX')
 
-                    originalTranslateMultiply = cmds.createNode('multiplyDivide', name = f'{joint}_original_translate')
-                    cmds.setAttr(f'{originalTranslateMultiply}.input1', originalTranslates[0], originalTranslates[1], originalTranslates[2], type = 'double3')
+            elif rootTransform:
+                # For the root joint, handle translation and scale.
+                for channel, originalValues in (('translate', originalTranslates), ('scale', originalScales)):
+                    originalChannelMultiply = network.createNode('multiplyDivide', f'{joint}_original_{channel}')
+                    network.setAttr(f'{originalChannelMultiply}.input1', *originalValues, type = 'double3')
 
                     for attr in ['X', 'Y', 'Z']:
-                        cmds.connectAttr(f'{settingsLocator}.creationPoseWeight', f'{originalTranslateMultiply}.input2{attr}')
+                        network.connectAttr(creationPoseWeight, f'{originalChannelMultiply}.input2{attr}', force = False)
 
-                    cmds.connectAttr(f'{originalTranslateMultiply}.output', f'{addTranslateNode}.input3D[0]', force = True)
-                    utilityNodes.append(originalTranslateMultiply)
+                    network.connectAttr(f'{originalChannelMultiply}.output', f'{joint}.{channel}')
 
-                    # Scale
-                    originalScales = cmds.getAttr(f'{joint}.scale')[0]
-                    addScaleNode = cmds.createNode('plusMinusAverage', name = f'{joint}_addScale')
-                    cmds.connectAttr(f'{addScaleNode}.output3D', f'{joint}.scale', force = True)
-                    utilityNodes.append(addScaleNode)
-
-                    originalScaleMultiply = cmds.createNode('multiplyDivide', name = f'{joint}_original_scale')
-                    cmds.setAttr(f'{originalScaleMultiply}.input1', originalScales[0], originalScales[1], originalScales[2], type = 'double3')
-
-                    for attr in ['X', 'Y', 'Z']:
-                        cmds.connectAttr(f'{settingsLocator}.creationPoseWeight', f'{originalScaleMultiply}.input2{attr}')
-
-                    cmds.connectAttr(f'{originalScaleMultiply}.output', f'{addScaleNode}.input3D[0]', force = True)
-                    utilityNodes.append(originalScaleMultiply)
+        utilityNodes = network.build()
 
         blueprintNodes = utilityNodes
         blueprintNodes.append(blueprintGrp)
         blueprintNodes.append(creationPoseGrp)
 
         # Create a container for the blueprint nodes.
-        blueprintContainer = utils.createContainer(name = f'{self.moduleNamespace}:blueprint_container', nodesIn = blueprintNodes, includeHierarchyBelow = True, includeShaders = True, includeTransform = True, includeShapes = True)
+        blueprintContainer = utils.createContainer(name = f'{self.moduleNamespace}:blueprint_container', nodesIn = blueprintNodes, includeHierarchyBelow = True, includeShaders = False, includeTransform = True, includeShapes = True)
 
         moduleGrp = cmds.group(empty = True, name = f'{self.moduleNamespace}:module_grp')  # Create a main group for the module.
         for obj in [hookGrp, settingsLocator]:
             cmds.parent(obj, moduleGrp, absolute = True)
 
         # Create the main module container and add relevant nodes.
-        moduleContainer = utils.createContainer(name = f'{self.moduleNamespace}:module_container', nodesIn = [moduleGrp, settingsLocator, hookGrp, blueprintContainer], includeHierarchyBelow = True, includeShaders = True, includeTransform = True, includeShapes = True)
+        moduleContainer = utils.createContainer(name = f'{self.moduleNamespace}:module_container', nodesIn = [moduleGrp, settingsLocator, hookGrp, blueprintContainer], includeHierarchyBelow = True, includeShaders = False, includeTransform = True, includeShapes = True)
 
-        cmds.container(moduleContainer, edit = True, publishAndBind = (f'{settingsLocator}.activeModule', 'activeModule'))  # Publish attributes from the settings locator to the module container.
-        cmds.container(moduleContainer, edit = True, publishAndBind = (f'{settingsLocator}.creationPoseWeight', 'creationPoseWeight'))
+        utils.publishAndBind(moduleContainer, f'{settingsLocator}.activeModule', 'activeModule')  # Publish attributes from the settings locator to the module container.
+        utils.publishAndBind(moduleContainer, f'{settingsLocator}.creationPoseWeight', 'creationPoseWeight')
 
         if mirrorInfo:
             enumNames = 'node:x:y:z'
@@ -367,57 +349,62 @@ class Blueprint:
 
         cmds.namespace(setNamespace = self.moduleNamespace)
 
-        self.createGroups()
-        self.createJoints()
-        # self.createModuleTransform()
-
-
-
-        # if self.mirrored:
-        #     mirrorXY = self.mirrorPlane == 'XY'
-        #     mirrorYZ = self.mirrorPlane == 'YZ'
-        #     mirrorXZ = self.mirrorPlane == 'XZ'
-        #     mirrorBehavior = self.rotationFunction == 'Behavior'
-        #
-        #     mirroredNodes = cmds.mirrorJoint(joints[0], mirrorXY = mirrorXY, mirrorYZ = mirrorYZ, mirrorXZ = mirrorXZ, mirrorBehavior = mirrorBehavior)
-        #
-        #     cmds.delete(joints)
-        #
-        #     mirroredJoints = []
-        #
-        #     for node in mirroredNodes:
-        #         if cmds.objectType(node, isType = 'joint'):
-        #             mirroredJoints.append(node)
-        #
-        #         else:
-        #             cmds.delete(node)
-        #
-        #     for index, joint in enumerate(mirroredJoints):
-        #         jointName = self.jointInfo[index][0]
-        #         newJointName = cmds.rename(joint, f'{self.moduleNamespace}:{jointName}')
-        #
-        #         self.jointInfo[index][1] = cmds.xform(newJointName, query = True, worldSpace = True, translation = True)
-
+        # Container additions and publishes are applied in a few batched edits when the transaction closes.
+        with utils.ContainerTransaction():
+            self.createGroups()
+            self.createJoints()
+            # self.createModuleTransform()
+
+
+
+            # if self.mirrored:
+            #     mirrorXY = self.mirrorPlane == 'XY'
+            #     mirrorYZ = self.mirrorPlane == 'YZ'
+            #     mirrorXZ = self.mirrorPlane == 'XZ'
+            #     mirrorBehavior = self.rotationFunction == 'Behavior'
+            #
+            #     mirroredNodes = cmds.mirrorJoint(joints[0], mirrorXY = mirrorXY, mirrorYZ = mirrorYZ, mirrorXZ = mirrorXZ, mirrorBehavior = mirrorBehavior)
+            #
+            #     cmds.delete(joints)
+            #
+            #     mirroredJoints = []
+            #
+            #     for node in mirroredNodes:
+            #         if cmds.objectType(node, isType = 'joint'):
+            #             mirroredJoints.append(node)
+            #
+            #         else:
+            #             cmds.delete(node)
+            #
+            #     for index, joint in enumerate(mirroredJoints):
+            #         jointName = self.jointInfo[index][0]
+            #         newJointName = cmds.rename(joint, f'{self.moduleNamespace}:{jointName}')
+            #
+            #         self.jointInfo[index][1] = cmds.xform(newJointName, query = True, worldSpace = True, translation = True)
+
+
+            # Parent the root joint (first joint created) under the joints group
 
-        # Parent the root joint (first joint created) under the joints group
-
-        return
-        self.initializeModuleTransform(self.jointInfo[0][1])
+            return
+            self.initializeModuleTransform(self.jointInfo[0][1])
 
-        translationControls = []
+            translationControls = []
 
-        for joint in joints:
-            translationControls.append(self.createTranslationControlAtJoint(joint))
+            for joint in joints:
+                translationControls.append(self.createTranslationControlAtJoint(joint))
 
-        rootJoint_pointConstraint = cmds.pointConstraint(translationControls[0], joints[0], maintainOffset = False, name = f'{joints[0]}_pointConstraint')
-        utils.addNodeToContainer(container = self.containerName, nodesIn = [rootJoint_pointConstraint])
+            rootJoint_pointConstraint = cmds.pointConstraint(translationControls[0], joints[0], maintainOffset = False, name = f'{joints[0]}_pointConstraint')
+            utils.addNodeToContainer(container = self.containerName, nodesIn = [rootJoint_pointConstraint])
 
-        self.initializeHook(translationControls[0])
+            self.initializeHook(translationControls[0])
 
-        for index in range(len(joints) - 1):
-            self.setupStretchyJointSegment(parentJoint = joints[index], childJoint = joints[index + 1])
+            for index in range(len(joints) - 1):
+                if self.useMatrixSegments:
+                    self.setupMatrixJointSegment(parentJoint = joints[index], childJoint = joints[index + 1])
+                else:
+                    self.setupStretchyJointSegment(parentJoint = joints[index], childJoint = joints[index + 1])
 
-        self.install_custom(joints)
+            self.install_custom(joints)
 
         cmds.lockNode(self.containerName, lock = True, lockUnpublished = True)
 
@@ -431,44 +418,34 @@ class Blueprint:
 
         # Create the main container for the module
         # Pass the top-level module group to the container
-        self.containerName = utils.createContainer('module_container', nodesIn = [self.moduleGrp], includeHierarchyBelow = True)
+        self.containerName = utils.createContainer('module_container', nodesIn = [self.moduleGrp], includeHierarchyBelow = True, includeShaders = False)
         # Parent subgroups under the main module group
         cmds.parent(self.jointsGrp, self.hierarchyConnectorsGrp, self.orientationConnectorsGrp, self.moduleGrp, absolute = True)
 
     def createJoints(self):
+        # Orients are solved for the whole chain up front (X aims at the child, Y up), so each joint is created
+        # already oriented. cmds.joint parents every new joint under the previous one.
+        jointPositions = [joint[1] for joint in self.jointInfo]  # ex: [4.0, 0.0, 0.0]
+        jointOrients = orientationSolver.computeChainOrients(jointPositions, ('xyz', 'yup')).tolist()
 
-        # List to store the full names of created joints
         cmds.select(clear = True)
 
         for index, joint in enumerate(self.jointInfo):
             jointName = joint[0]  # ex: 'root_joint', 'end_joint'
-            jointPos = joint[1]  # ex: [4.0, 0.0, 0.0]
-
-            parentJoint = ''
-
-            # Determine parent for the current joint
-            if index > 0:
-                # The parent is the previously created joint in the list
-                parentJoint = f'{self.moduleNamespace}:{self.jointInfo[index - 1][0]}'
-                cmds.select(parentJoint, replace = True)
 
             # Create the joint
-            jointName_full = cmds.joint(name = jointName, position = jointPos)  # example: ModuleName__UserSpecifiedName:JointName
+            jointName_full = cmds.joint(name = jointName, position = jointPositions[index], orientation = jointOrients[index])  # example: ModuleName__UserSpecifiedName:JointName
             self.joints.append(jointName_full)
             # cmds.setAttr(f'{jointName_full}.visibility', 0)
 
-            # Add joint to the module's container
-            utils.addNodeToContainer(container = self.containerName, nodesIn = [jointName_full])
-
             # Publish joint attributes to the container for external access
-            cmds.container(self.containerName, edit = True, publishAndBind = (f'{jointName_full}.rotate', f'{jointName}_Rotate'))
-            cmds.container(self.containerName, edit = True, publishAndBind = (f'{jointName_full}.rotateOrder', f'{jointName}_RotateOrder'))
+            utils.publishAndBind(self.containerName, f'{jointName_full}.rotate', f'{jointName}_Rotate')
+            utils.publishAndBind(self.containerName, f'{jointName_full}.rotateOrder', f'{jointName}_RotateOrder')
 
-            # Orient the parent joint towards its child
-            if index > 0:
-                cmds.joint(parentJoint, edit = True, orientJoint = 'xyz', secondaryAxisOrient = 'yup')
+        # Add the joints to the module's container
+        utils.addNodeToContainer(container = self.containerName, nodesIn = self.joints)
 
-            cmds.parent(self.joints[0], self.jointsGrp, absolute = True)
+        cmds.parent(self.joints[0], self.jointsGrp, absolute = True)
 
     def createModuleTransform(self):
         utils.createModuleTransformControl(name = f'{self.moduleNamespace}:module_transform')
@@ -498,8 +475,8 @@ class Blueprint:
         shortName = utils.stripLeadingNamespace(joint)[1]
         attrName = f'{shortName}_Translate'
 
-        cmds.container(container, edit = True, publishAndBind = (f'{control}.translate', attrName))
-        cmds.container(self.containerName, edit = True, publishAndBind = (f'{container}.{attrName}', attrName))
+        utils.publishAndBind(container, f'{control}.translate', attrName)
+        utils.publishAndBind(self.containerName, f'{container}.{attrName}', attrName)
 
         return control
 
@@ -525,7 +502,7 @@ class Blueprint:
         cmds.setAttr(f'{poleVectorLocator}.visibility', 0)
         cmds.setAttr(f'{poleVectorLocator}.translateY', -0.5)
 
-        ikNodes = utils.basicStretchyIK(rootJoint = parentJoint, endJoint = childJoint, container = self.containerName, lockMinimumLength = False, poleVectorObject = poleVectorLocator, scaleCorrectionAttribute = None)
+        ikNodes = utils.basicStretchyIK(rootJoint = parentJoint, endJoint = childJoint, container = self.containerName, lockMinimumLength = False, poleVectorObject = poleVectorLocator, scaleCorrectionAttribute = None, compactNetwork = True)
         ikHandle = ikNodes['ikHandle']
         rootLocator = ikNodes['rootLocator']
         endLocator = ikNodes['endLocator']
@@ -544,6 +521,39 @@ class Blueprint:
 
         self.createHierarchyConnector(parentJoint, childJoint)
 
+    def setupMatrixJointSegment(self, parentJoint, childJoint):
+        """
+        IK handle free alternative to `setupStretchyJointSegment`, with the same translation controls and pole vector locator.
+
+        The parent joint aims at the child translation control through an aimMatrix whose secondary axis follows the
+        pole vector locator, and the child's translateX follows the distance between the two controls.
+        """
+
+        parentTranslationControl = self.getTranslationControl(parentJoint)
+        childTranslationControl = self.getTranslationControl(childJoint)
+
+        poleVectorLocator = cmds.spaceLocator(name = f'{parentTranslationControl}_poleVectorLocator')[0]
+        poleVectorLocatorGrp = cmds.group(poleVectorLocator, name = f'{poleVectorLocator}_parentConstraintGrp')
+
+        cmds.parent(poleVectorLocatorGrp, self.moduleGrp, absolute = True)
+        parentConstraint = cmds.parentConstraint(parentTranslationControl, poleVectorLocatorGrp, maintainOffset = False)[0]
+
+        cmds.setAttr(f'{poleVectorLocator}.visibility', 0)
+        cmds.setAttr(f'{poleVectorLocator}.translateY', -0.5)
+
+        # The IK version twists a mirrored XZ segment by 90 degrees, which turns the pole vector side from -Y to +Z.
+        secondaryAxis = (0.0, -1.0, 0.0)
+
+        if self.mirrored and self.mirrorPlane == 'XZ':
+            secondaryAxis = (0.0, 0.0, 1.0)
+
+        utils.matrixAimSegment(rootJoint = parentJoint, endJoint = childJoint, rootTarget = parentTranslationControl, endTarget = childTranslationControl,
+                               upObject = poleVectorLocator, container = self.containerName, secondaryAxis = secondaryAxis)
+
+        utils.addNodeToContainer(container = self.containerName, nodesIn = [poleVectorLocatorGrp, parentConstraint], includeHierarchyBelow = True)
+
+        self.createHierarchyConnector(parentJoint, childJoint)
+
     def initializeModuleTransform(self, rootPosition):
         """
         Creates and initializes the main transform for the module.
@@ -587,7 +597,7 @@ class Blueprint:
         #
         #     cmds.xform(self.moduleTransform, objectSpace = True, scale = (scale, scale, scale))
 
-        utils.addNodeToContainer(container = self.containerName, nodesIn = [self.moduleTransform], includeHierarchyBelow = True)
+        utils.addNodeToContainer(container = self.containerName, nodesIn = [self.moduleTransform], includeHierarchyBelow = True, includeShaders = False)
 
         # Setup global scaling
         cmds.connectAttr(f'{self.moduleTransform}.scaleY', f'{self.moduleTransform}.scaleX')
@@ -595,9 +605,9 @@ class Blueprint:
 
         cmds.aliasAttr('globalScale', f'{self.moduleTransform}.scaleY')
 
-        cmds.container(self.containerName, edit = True, publishAndBind = (f'{self.moduleTransform}.translate', 'moduleTransform_Translate'))
-        cmds.container(self.containerName, edit = True, publishAndBind = (f'{self.moduleTransform}.rotate', 'moduleTransform_Rotate'))
-        cmds.container(self.containerName, edit = True, publishAndBind = (f'{self.moduleTransform}.globalScale', 'moduleTransform_globalScale'))
+        utils.publishAndBind(self.containerName, f'{self.moduleTransform}.translate', 'moduleTransform_Translate')
+        utils.publishAndBind(self.containerName, f'{self.moduleTransform}.rotate', 'moduleTransform_Rotate')
+        utils.publishAndBind(self.containerName, f'{self.moduleTransform}.globalScale', 'moduleTransform_globalScale')
 
     def createHierarchyConnector(self, parentJoint, childJoint):
         container, connector, constrainedGrp = utils.createHierarchyConnector(parentJoint)
@@ -619,7 +629,7 @@ class Blueprint:
         return [container, connector, constrainedGrp]
 
     def createOrientationConnector(self, parentJoint, childJoint):
-        cmds.delete(self.hierarchyContainer)
+        utils.deleteContainer(self.hierarchyContainer)
 
         container, connector, constrainedGrp = utils.createOrientationConnector(parentJoint)
 
@@ -640,8 +650,8 @@ class Blueprint:
         shortName = utils.stripAllNamespaces(parentJoint)[1]
         attrName = f'{shortName}_orientation'
 
-        cmds.container(container, edit = True, publishAndBind = (f'{connector}.rotateX', attrName))
-        cmds.container(self.containerName, edit = True, publishAndBind = (f'{container}.{attrName}', attrName))
+        utils.publishAndBind(container, f'{connector}.rotateX', attrName)
+        utils.publishAndBind(self.containerName, f'{container}.{attrName}', attrName)
 
         return [container, connector, constrainedGrp]
 
@@ -654,7 +664,7 @@ class Blueprint:
 
         scaleConstraint = cmds.scaleConstraint(self.moduleTransform, constrainedGrp, skip = ['x'], maintainOffset = False)[0]
 
-        utils.addNodeToContainer(container = container, nodesIn = [parentConstraint, scaleConstraint, constrainedGrp], includeHierarchyBelow = True)
+        utils.addNodeToContainer(container = container, nodesIn = [parentConstraint, scaleConstraint, constrainedGrp], includeHierarchyBelow = True, includeShaders = False)
         utils.addNodeToContainer(container = self.containerName, nodesIn = [container])
 
         self.hookContainer = container
@@ -668,27 +678,19 @@ class Blueprint:
         return [f'{jointBaseName}{joint[0]}' for joint in self.jointInfo]
 
     def orientationControlledJoint_getOrientation(self, joint, cleanParent):
-        newCleanParent = cmds.duplicate(joint, parentOnly = True)[0]
-
-        currentParent = cmds.listRelatives(newCleanParent, parent = True)
-
-        if not cleanParent or cleanParent not in currentParent:
-            cmds.parent(newCleanParent, cleanParent, absolute = True)
+        """
+        Returns the joint orient of an orientation controlled joint, relative to cleanParent, with the
+        orientation control's rotateX applied. Computed from world matrices, no temporary joint is created.
 
-        cmds.makeIdentity(newCleanParent, apply = True, rotate = True, scale = False, translate = False)
+        Inside an active orientationSolver.OrientationBatch the values are filled in when the batch is solved.
 
+        Returns:
+            tuple: ([orientX, orientY, orientZ], None). The second item used to be the temporary joint.
+        """
         orientationControl = self.getOrientationControl(joint)
-        cmds.setAttr(f'{newCleanParent}.rotateX', cmds.getAttr(f'{orientationControl}.rotateX'))
-
-        cmds.makeIdentity(newCleanParent, apply = True, rotate = True, scale = False, translate = False)
-
-        orientX = cmds.getAttr(f'{newCleanParent}.jointOrientX')
-        orientY = cmds.getAttr(f'{newCleanParent}.jointOrientY')
-        orientZ = cmds.getAttr(f'{newCleanParent}.jointOrientZ')
-
-        orientationValues = (orientX, orientY, orientZ)
+        orientationValues = orientationSolver.getJointOrientation(joint, cleanParent, orientationControl)
 
-        return (orientationValues, newCleanParent)
+        return (orientationValues, None)
 
     def createRotationOrderUIControl(self, joint):
         layout = QtWidgets.QHBoxLayout()
@@ -742,8 +744,7 @@ class Blueprint:
 
         blueprintsFolder = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Blueprint')
 
-        validModules = [module for module in utils.loadAllModulesFromDirectory(blueprintsFolder).keys()]
-        validModuleNames = [module['name'] for module in utils.loadAllModulesFromDirectory(blueprintsFolder).values()]
+        loadedModules = utils.loadAllModulesFromDirectory(blueprintsFolder, importModules = False)
 
         hookedModules = set()
 
@@ -758,9 +759,8 @@ class Blueprint:
 
                 if moduleInstance:
                     moduleName, split, userSpecifiedName = moduleInstance[0].partition('__')
-                    if moduleInstance[0] != self.moduleNamespace and moduleName in validModuleNames:
-                        index = validModuleNames.index(moduleName)
-                        hookedModules.add((validModules[index], userSpecifiedName))
+                    if moduleInstance[0] != self.moduleNamespace and moduleName in loadedModules.byClassName:
+                        hookedModules.add((loadedModules.fileNameForClass(moduleName), userSpecifiedName))
 
         for module in hookedModules:
             mod = importlib.import_module(f'Blueprint.{module[0]}')
@@ -772,11 +772,10 @@ class Blueprint:
             mirrorLinks = cmds.getAttr(f'{self.moduleNamespace}:module_grp.mirrorLinks')
 
             linkedBlueprint = mirrorLinks.rpartition('__')[0]
-            cmds.lockNode(f'{linkedBlueprint}:module_container', lock = False, lockUnpublished = False)
 
-            cmds.deleteAttr(f'{linkedBlueprint}:module_grp.mirrorLinks')
-
-            cmds.lockNode(f'{linkedBlueprint}:module_container', lock = True, lockUnpublished = True)
+            with utils.unlockedContainers(f'{linkedBlueprint}:module_container'):
+                cmds.deleteAttr(f'{linkedBlueprint}:module_grp.mirrorLinks')
+                sceneIndex.getSceneIndex().invalidate(linkedBlueprint)
 
         moduleTransform = f'{self.moduleNamespace}:module_transform'
         moduleTransformParent = cmds.listRelatives(moduleTransform, parent = True)
@@ -795,7 +794,7 @@ class Blueprint:
             if len(children) == 0:
                 cmds.select(parentGroup, replace = True)
                 import System.groupSelected as groupSelected
-                importlib.reload(groupSelected)
+                utils.reloadModule(groupSelected)
 
                 groupSelected.UngroupSelected()
 
@@ -810,29 +809,28 @@ class Blueprint:
 
         else:
             newNamespace = f'{self.moduleName}__{newName}'
-            cmds.lockNode(self.containerName, lock = False, lockUnpublished = False)
-            cmds.namespace(setNamespace = ':')
-            cmds.namespace(addNamespace = newNamespace)
-            cmds.namespace(setNamespace = ':')
-
-            cmds.namespace(moveNamespace = [self.moduleNamespace, newNamespace])
-            cmds.namespace(removeNamespace = self.moduleNamespace)
 
-            if cmds.attributeQuery('mirrorLinks', node = f'{newNamespace}:module_grp', exists = True):
-                mirrorLinks = cmds.getAttr(f'{newNamespace}:module_grp.mirrorLinks')
-                nodeAndAxis = mirrorLinks.rpartition('__')
-                node = nodeAndAxis[0]
-                axis = nodeAndAxis[2]
+            # The lock manager tracks the container by UUID, so it is relocked under its new name.
+            with utils.unlockedContainers(self.containerName):
+                cmds.namespace(setNamespace = ':')
+                cmds.namespace(addNamespace = newNamespace)
+                cmds.namespace(setNamespace = ':')
 
-                cmds.lockNode(f'{node}:module_container', lock = False, lockUnpublished = False)
+                cmds.namespace(moveNamespace = [self.moduleNamespace, newNamespace])
+                cmds.namespace(removeNamespace = self.moduleNamespace)
 
-                cmds.setAttr(f'{node}:module_grp.mirrorLinks', f'{newNamespace}__{axis}', type = 'string')
+                if cmds.attributeQuery('mirrorLinks', node = f'{newNamespace}:module_grp', exists = True):
+                    mirrorLinks = cmds.getAttr(f'{newNamespace}:module_grp.mirrorLinks')
+                    nodeAndAxis = mirrorLinks.rpartition('__')
+                    node = nodeAndAxis[0]
+                    axis = nodeAndAxis[2]
 
-                cmds.lockNode(f'{node}:module_container', lock = True, lockUnpublished = True)
+                    with utils.unlockedContainers(f'{node}:module_container'):
+                        cmds.setAttr(f'{node}:module_grp.mirrorLinks', f'{newNamespace}__{axis}', type = 'string')
+                        sceneIndex.getSceneIndex().invalidate(node)
 
-            self.moduleNamespace = newNamespace
-            self.containerName = f'{newNamespace}:module_container'
-            cmds.lockNode(self.containerName, lock = True, lockUnpublished = True)
+                self.moduleNamespace = newNamespace
+                self.containerName = f'{newNamespace}:module_container'
 
             return True
 
@@ -860,14 +858,14 @@ class Blueprint:
         cmds.joint(rootJoint, edit = True, orientJoint = 'xyz', secondaryAxisOrient = 'yup')
 
         hookGrp = cmds.group([rootJoint, unhookedLocator], name = f'{self.moduleNamespace}:hook_grp', parent = self.moduleGrp)
-        hookContainer = utils.createContainer(name = f'{self.moduleNamespace}:hook_container', nodesIn = [hookGrp], includeHierarchyBelow = True)
+        hookContainer = utils.createContainer(name = f'{self.moduleNamespace}:hook_container', nodesIn = [hookGrp], includeHierarchyBelow = True, includeShaders = False)
         utils.addNodeToContainer(self.containerName, hookContainer)
 
         for joint in [rootJoint, targetJoint]:
             jointName = utils.stripAllNamespaces(joint)[1]
-            cmds.container(hookContainer, edit = True, publishAndBind = (f'{joint}.rotate', f'{jointName}_Rotate'))
+            utils.publishAndBind(hookContainer, f'{joint}.rotate', f'{jointName}_Rotate')
 
-        ikNodes = utils.basicStretchyIK(rootJoint = rootJoint, endJoint = targetJoint, container = hookContainer, lockMinimumLength = False)
+        ikNodes = utils.basicStretchyIK(rootJoint = rootJoint, endJoint = targetJoint, container = hookContainer, lockMinimumLength = False, compactNetwork = True)
         ikHandle = ikNodes['ikHandle']
         rootLocator = ikNodes['rootLocator']
         endLocator = ikNodes['endLocator']
@@ -885,7 +883,7 @@ class Blueprint:
         container, connector, constrainedGrp = self.createHookConnector(parentJoint = rootJoint, childJoint = targetJoint)
         cmds.parent(constrainedGrp, hookGrp, relative = True)
 
-        cmds.container(self.containerName, edit = True, removeNode = container)
+        utils.removeNodeFromContainer(self.containerName, container)
         utils.addNodeToContainer(hookContainer, container)
 
     def rehook(self, newHookObject):
@@ -903,17 +901,14 @@ class Blueprint:
         if self.hookObject == oldHookObject:
             return
 
-        self.unconstrainRootFromHook()
+        with utils.unlockedContainers(self.containerName):
+            self.unconstrainRootFromHook()
 
-        cmds.lockNode(self.containerName, lock = False, lockUnpublished = False)
-
-        hookConstraint = f'{self.moduleNamespace}:hook_pointConstraint'
-        cmds.connectAttr(f'{self.hookObject}.parentMatrix[0]', f'{hookConstraint}.target[0].targetParentMatrix', force = True)
-        cmds.connectAttr(f'{self.hookObject}.translate', f'{hookConstraint}.target[0].targetTranslate', force = True)
-        cmds.connectAttr(f'{self.hookObject}.rotatePivot', f'{hookConstraint}.target[0].targetRotatePivot', force = True)
-        cmds.connectAttr(f'{self.hookObject}.rotatePivotTranslate', f'{hookConstraint}.target[0].targetRotateTranslate', force = True)
-
-        cmds.lockNode(self.containerName, lock = True, lockUnpublished = True)
+            hookConstraint = f'{self.moduleNamespace}:hook_pointConstraint'
+            cmds.connectAttr(f'{self.hookObject}.parentMatrix[0]', f'{hookConstraint}.target[0].targetParentMatrix', force = True)
+            cmds.connectAttr(f'{self.hookObject}.translate', f'{hookConstraint}.target[0].targetTranslate', force = True)
+            cmds.connectAttr(f'{self.hookObject}.rotatePivot', f'{hookConstraint}.target[0].targetRotatePivot', force = True)
+            cmds.connectAttr(f'{self.hookObject}.rotatePivotTranslate', f'{hookConstraint}.target[0].targetRotateTranslate', force = True)
 
     def findHookObject(self):
         hookConstraint = f'{self.moduleNamespace}:hook_pointConstraint'
@@ -949,36 +944,30 @@ class Blueprint:
         if hookObject == f'{self.moduleNamespace}:unhookedTarget':
             return
 
-        cmds.lockNode(self.containerName, lock = False, lockUnpublished = False)
-
-        cmds.pointConstraint(hookObject, rootControl, maintainOffset = False, name = f'{rootControl}_hookConstraint')
-        cmds.setAttr(f'{rootControl}.translate', lock = True)
-        cmds.setAttr(f'{rootControl}.visibility', lock = False)
-        cmds.setAttr(f'{rootControl}.visibility', 0)
-        cmds.setAttr(f'{rootControl}.visibility', lock = True)
-
-        cmds.select(clear = True)
+        with utils.unlockedContainers(self.containerName):
+            cmds.pointConstraint(hookObject, rootControl, maintainOffset = False, name = f'{rootControl}_hookConstraint')
+            cmds.setAttr(f'{rootControl}.translate', lock = True)
+            cmds.setAttr(f'{rootControl}.visibility', lock = False)
+            cmds.setAttr(f'{rootControl}.visibility', 0)
+            cmds.setAttr(f'{rootControl}.visibility', lock = True)
 
-        cmds.lockNode(self.containerName, lock = True, lockUnpublished = True)
+            cmds.select(clear = True)
 
     def unconstrainRootFromHook(self):
-        cmds.lockNode(self.containerName, lock = False, lockUnpublished = False)
-
         rootControl = self.getTranslationControl(f'{self.moduleNamespace}:{self.jointInfo[0][0]}')
         rootControl_hookConstraint = f'{rootControl}_hookConstraint'
 
         if cmds.objExists(rootControl_hookConstraint):
-            cmds.delete(rootControl_hookConstraint)
-            cmds.setAttr(f'{rootControl}.translate', lock = False)
-            cmds.setAttr(f'{rootControl}.visibility', lock = False)
-            cmds.setAttr(f'{rootControl}.visibility', 1)
-            cmds.setAttr(f'{rootControl}.visibility', lock = True)
+            with utils.unlockedContainers(self.containerName):
+                cmds.delete(rootControl_hookConstraint)
+                cmds.setAttr(f'{rootControl}.translate', lock = False)
+                cmds.setAttr(f'{rootControl}.visibility', lock = False)
+                cmds.setAttr(f'{rootControl}.visibility', 1)
+                cmds.setAttr(f'{rootControl}.visibility', lock = True)
 
             cmds.select(rootControl, replace = True)
             cmds.setToolTo('moveSuperContext')
 
-        cmds.lockNode(self.containerName, lock = True, lockUnpublished = True)
-
     def isRootConstrained(self):
         rootControl = self.getTranslationControl(f'{self.moduleNamespace}:{self.jointInfo[0][0]}')
         rootControl_hookConstraint = f'{rootControl}_hookConstraint'
@@ -988,109 +977,96 @@ class Blueprint:
     def canModuleBeMirrored(self):
         return self.canBeMirrored
 
-    def mirror(self, originalModule, mirrorPlane, translationFunction, rotationFunction):
-        self.mirrored = True
-        self.originalModule = originalModule
-        self.mirrorPlane = mirrorPlane
-        self.rotationFunction = rotationFunction  # This will be 'Behavior' or 'Orientation' from UI
-
-        self.install()  # This creates the new module and its controls
-
-        cmds.lockNode(self.containerName, lock = False, lockUnpublished = False)
+    def getMirrorPairs(self, originalModule):
+        """
+        Returns the (original, new) translation controls and pole vector locators whose positions are mirrored.
+        """
+        pairs = []
 
-        for jointInfo in self.jointInfo:
+        for index, jointInfo in enumerate(self.jointInfo):
             jointName = jointInfo[0]
 
-            originalJoint = f'{self.originalModule}:{jointName}'
-            newJoint = f'{self.moduleNamespace}:{jointName}'
-
-            originalRotationOrder = cmds.getAttr(f'{originalJoint}.rotateOrder')
-            cmds.setAttr(f'{newJoint}.rotateOrder', originalRotationOrder)
+            originalTranslationControl = self.getTranslationControl(f'{originalModule}:{jointName}')
+            newTranslationControl = self.getTranslationControl(f'{self.moduleNamespace}:{jointName}')
+            pairs.append((originalTranslationControl, newTranslationControl))
 
-        index = 0
-        for jointInfo in self.jointInfo:
-            mirrorPoleVectorLocator = False
             if index < len(self.jointInfo) - 1:
-                mirrorPoleVectorLocator = True
+                pairs.append((f'{originalTranslationControl}_poleVectorLocator', f'{newTranslationControl}_poleVectorLocator'))
 
-            jointName = jointInfo[0]
+        return pairs
 
-            originalJoint = f'{self.originalModule}:{jointName}'
-            newJoint = f'{self.moduleNamespace}:{jointName}'
-
-            originalTranslationControl = self.getTranslationControl(originalJoint)
-            newTranslationControl = self.getTranslationControl(newJoint)
-
-            originalTranslationControlPosition = cmds.xform(originalTranslationControl, query = True, worldSpace = True, translation = True)
-
-            if self.mirrorPlane == 'YZ':
-                originalTranslationControlPosition[0] *= -1
-
-            elif self.mirrorPlane == 'XZ':
-                originalTranslationControlPosition[1] *= -1
-
-            elif self.mirrorPlane == 'XY':
-                originalTranslationControlPosition[2] *= -1
-
-            cmds.xform(newTranslationControl, worldSpace = True, absolute = True, translation = originalTranslationControlPosition)
-
-            if mirrorPoleVectorLocator:
-                originalPoleVectorLocator = f'{originalTranslationControl}_poleVectorLocator'
-                newPoleVectorLocator = f'{newTranslationControl}_poleVectorLocator'
-                originalPoleVectorLocatorPosition = cmds.xform(originalPoleVectorLocator, query = True, worldSpace = True, translation = True)
-
-                if self.mirrorPlane == 'YZ':
-                    originalPoleVectorLocatorPosition[0] *= -1
+    def mirror(self, originalModule, mirrorPlane, translationFunction, rotationFunction, engine = None):
+        """
+        Installs this module as the mirror of originalModule.
 
-                elif self.mirrorPlane == 'XZ':
-                    originalPoleVectorLocatorPosition[1] *= -1
+        Args:
+            originalModule (str): Namespace of the module being mirrored.
+            mirrorPlane (str): 'YZ', 'XZ' or 'XY'.
+            translationFunction (str): 'Mirrored' or 'World Space'.
+            rotationFunction (str): 'Behavior' or 'Orientation'.
+            engine (mirrorEngine.MirrorEngine, optional): Engine shared by several modules. The control positions are
+                                                         only queued and are written when the caller runs the engine.
+                                                         Without one, they are mirrored right away.
+        """
+        self.mirrored = True
+        self.originalModule = originalModule
+        self.mirrorPlane = mirrorPlane
+        self.rotationFunction = rotationFunction  # This will be 'Behavior' or 'Orientation' from UI
 
-                elif self.mirrorPlane == 'XY':
-                    originalPoleVectorLocatorPosition[2] *= -1
+        self.install()  # This creates the new module and its controls
 
-                cmds.xform(newPoleVectorLocator, worldSpace = True, absolute = True, translation = originalPoleVectorLocatorPosition)
+        with utils.unlockedContainers(self.containerName, f'{originalModule}:module_container'):
+            for jointInfo in self.jointInfo:
+                jointName = jointInfo[0]
 
-            index += 1
+                originalJoint = f'{self.originalModule}:{jointName}'
+                newJoint = f'{self.moduleNamespace}:{jointName}'
 
-        self.mirror_custom(originalModule)
+                originalRotationOrder = cmds.getAttr(f'{originalJoint}.rotateOrder')
+                cmds.setAttr(f'{newJoint}.rotateOrder', originalRotationOrder)
 
-        moduleGrp = f'{self.moduleNamespace}:module_grp'
-        cmds.select(moduleGrp, replace = True)
+            if engine is None:
+                moduleEngine = mirrorEngine.MirrorEngine()
+                moduleEngine.addPairs(self.getMirrorPairs(originalModule), mirrorPlane)
+                moduleEngine.run()
+            else:
+                engine.addPairs(self.getMirrorPairs(originalModule), mirrorPlane)
 
-        enumNames = 'none:x:y:z'
-        cmds.addAttr(attributeType = 'enum', enumName = enumNames, longName = 'mirrorInfo', keyable = False)
+            self.mirror_custom(originalModule)
 
-        enumValue = 0
-        if translationFunction == 'Mirrored':
-            if mirrorPlane == 'YZ':
-                enumValue = 1
-            elif mirrorPlane == 'XZ':
-                enumValue = 2
-            elif mirrorPlane == 'XY':
-                enumValue = 3
+            moduleGrp = f'{self.moduleNamespace}:module_grp'
+            cmds.select(moduleGrp, replace = True)
 
-        cmds.setAttr(f'{moduleGrp}.mirrorInfo', enumValue)
+            enumNames = 'none:x:y:z'
+            cmds.addAttr(attributeType = 'enum', enumName = enumNames, longName = 'mirrorInfo', keyable = False)
 
-        linkedAttribute = 'mirrorLinks'
+            enumValue = 0
+            if translationFunction == 'Mirrored':
+                if mirrorPlane == 'YZ':
+                    enumValue = 1
+                elif mirrorPlane == 'XZ':
+                    enumValue = 2
+                elif mirrorPlane == 'XY':
+                    enumValue = 3
 
-        cmds.lockNode(f'{originalModule}:module_container', lock = False, lockUnpublished = False)
+            cmds.setAttr(f'{moduleGrp}.mirrorInfo', enumValue)
 
-        for moduleLink in ((originalModule, self.moduleNamespace), (self.moduleNamespace, originalModule)):
-            moduleGroup = f'{moduleLink[0]}:module_grp'
-            attributeValue = f'{moduleLink[1]}__'
+            linkedAttribute = 'mirrorLinks'
 
-            if mirrorPlane == 'YZ':
-                attributeValue += 'X'
-            elif mirrorPlane == 'XZ':
-                attributeValue += 'Y'
-            elif mirrorPlane == 'XY':
-                attributeValue += 'Z'
+            for moduleLink in ((originalModule, self.moduleNamespace), (self.moduleNamespace, originalModule)):
+                moduleGroup = f'{moduleLink[0]}:module_grp'
+                attributeValue = f'{moduleLink[1]}__'
 
-            cmds.addAttr(moduleGroup, dataType = 'string', longName = linkedAttribute, keyable = False)
-            cmds.setAttr(f'{moduleGroup}.{linkedAttribute}', attributeValue, type = 'string')
+                if mirrorPlane == 'YZ':
+                    attributeValue += 'X'
+                elif mirrorPlane == 'XZ':
+                    attributeValue += 'Y'
+                elif mirrorPlane == 'XY':
+                    attributeValue += 'Z'
 
-        for container in [f'{originalModule}:module_container', self.containerName]:
-            cmds.lockNode(container, lock = True, lockUnpublished = True)
+                cmds.addAttr(moduleGroup, dataType = 'string', longName = linkedAttribute, keyable = False)
+                cmds.setAttr(f'{moduleGroup}.{linkedAttribute}', attributeValue, type = 'string')
+                sceneIndex.getSceneIndex().invalidate(moduleLink[0])
 
         cmds.select(clear = True)
 
@@ -19,8 +19,10 @@ import maya.cmds as cmds
 from functools import partial
 
 from . import utils
+from . import sceneIndex
+from . import orientationSolver
 
-importlib.reload(utils)
+utils.reloadModule(utils)
 
 projectRoot = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if projectRoot not in sys.path:
@@ -240,10 +242,16 @@ class ModuleWidget(QtWidgets.QWidget):
 class Blueprint_UI(QtWidgets.QDialog):
     ui_instance = None
 
+    # Bursts of SelectionChanged events, e.g. from a marquee selection, are handled once after this delay.
+    SELECTION_UPDATE_DELAY_MS = 50
+
     def __init__(self, modulesDir = None, parent = None):
         self.jobNum = None
 
         self.moduleInstance = None
+        self.selectedModuleNamespace = None
+        self.moduleInstances = {}  # {moduleNamespace: blueprint instance} of the modules selected so far
+        self.loadedModules = None
 
         if parent is None:
             try:
@@ -263,15 +271,20 @@ class Blueprint_UI(QtWidgets.QDialog):
         # SETUP UI
         self.setupUI()
 
-        self.modifySelected()
+        self.selectionTimer = QtCore.QTimer(self)
+        self.selectionTimer.setSingleShot(True)
+        self.selectionTimer.setInterval(self.SELECTION_UPDATE_DELAY_MS)
+        self.selectionTimer.timeout.connect(self.modifySelected)
 
         # LOAD MODULES
 
         if self.modulesDir:
-            self.loadedModules = utils.loadAllModulesFromDirectory(self.modulesDir)  # Load modules if directory is provided
+            self.loadedModules = utils.loadAllModulesFromDirectory(self.modulesDir, importModules = False)  # Read module metadata if directory is provided, classes are imported on install
 
             self.addModuleToUI()
 
+        self.modifySelected(force = True)
+
     def setupUI(self):
 
         # MAIN LAYOUT
@@ -519,7 +532,7 @@ class Blueprint_UI(QtWidgets.QDialog):
         self.moduleInstanceLineEdit.editingFinished.connect(self.renameModule)
         self.buttons['Rehook'].clicked.connect(self.rehookModuleSetup)
         self.buttons['Snap Root > Hook'].clicked.connect(self.snapRootToHook)
-        self.buttons['Constrain Root > Hook'].clicked.connect(self.constrainRookToHook)
+        self.buttons['Constrain Root > Hook'].clicked.connect(self.toggleRootConstraint)
         self.buttons['Group Selected'].clicked.connect(self.groupSelected)
         self.buttons['Ungroup'].clicked.connect(self.ungroupSelected)
         self.buttons['Mirror Module'].clicked.connect(self.mirrorSelection)
@@ -529,25 +542,27 @@ class Blueprint_UI(QtWidgets.QDialog):
         baseName = 'instance_'
 
         cmds.namespace(setNamespace = ":")
-        rawNamespaces = cmds.namespaceInfo(listOnlyNamespaces = True)
-
-        # Strip prefix before '__' if present
-        strippedNamespaces = [ns.partition('__')[2] if '__' in ns else ns for ns in rawNamespaces]
-
-        newSuffix = utils.findHighestTrailingNumber(strippedNamespaces, baseName) + 1
-
-        userSpecifiedName = f'{baseName}{newSuffix}'
+        index = sceneIndex.getSceneIndex()
+        userSpecifiedName = index.reserveUserSpecifiedName(baseName)
 
         hookObj = self.findHookObjectFromSelection()
 
-        if moduleObject and hasattr(moduleObject, moduleName):
-            moduleClass = getattr(moduleObject, moduleName)
-            moduleInstance = moduleClass(userSpecifiedName, hookObj)
-            moduleInstance.install()
+        if moduleObject is None:
+            moduleFile = self.loadedModules.fileNameForClass(moduleName)
+            moduleObject = utils.importBlueprintModule(self.modulesDir, moduleFile) if moduleFile else None
 
-            # moduleTransform = f'{moduleName}__{userSpecifiedName}:module_transform'
-            # cmds.select(moduleTransform)
-            # cmds.setToolTo('moveSuperContext')
+        try:
+            if moduleObject and hasattr(moduleObject, moduleName):
+                moduleClass = getattr(moduleObject, moduleName)
+                moduleInstance = moduleClass(userSpecifiedName, hookObj)
+                moduleInstance.install()
+
+                # moduleTransform = f'{moduleName}__{userSpecifiedName}:module_transform'
+                # cmds.select(moduleTransform)
+                # cmds.setToolTo('moveSuperContext')
+        finally:
+            # Installing the module consumes the reservation; release it in case no namespace was created.
+            index.releaseUserSpecifiedNames([userSpecifiedName])
 
     def findHookObjectFromSelection(self):
         selectedObjects = cmds.ls(selection = True, transforms = True)
@@ -599,81 +614,93 @@ class Blueprint_UI(QtWidgets.QDialog):
         self.deleteScriptJob()
 
     def createScriptJob(self):
-        self.jobNum = cmds.scriptJob(event = ['SelectionChanged', self.modifySelected], runOnce = True)
+        if self.jobNum is None:
+            self.jobNum = cmds.scriptJob(event = ['SelectionChanged', self.scheduleSelectionUpdate])
 
     def deleteScriptJob(self):
-        cmds.scriptJob(kill = self.jobNum, force = True)
+        self.selectionTimer.stop()
 
-    def modifySelected(self):
+        if self.jobNum is not None:
+            cmds.scriptJob(kill = self.jobNum, force = True)
+            self.jobNum = None
 
-        selectedNodes = cmds.ls(selection = True)
+    def scheduleSelectionUpdate(self):
+        """
+        Restarts the selection timer, so a burst of selection changes updates the panel once.
+        """
+        self.selectionTimer.start()
+
+    def getModuleInstance(self, namespace):
+        """
+        Returns the blueprint instance of a module namespace, creating it the first time the module is selected.
 
-        if len(selectedNodes) <= 1:
-            self.moduleInstance = None
-            selectedModuleNamespace = None
-            currentModuleFile = None
+        Returns:
+            Blueprint or None: The instance, or None if the namespace is not a blueprint module.
+        """
+        moduleInstance = self.moduleInstances.get(namespace)
 
-            self.buttons['Ungroup'].setEnabled(False)
-            self.buttons['Mirror Module'].setEnabled(False)
+        if moduleInstance and moduleInstance.moduleNamespace == namespace:
+            return moduleInstance
 
-            if len(selectedNodes) == 1:
-                lastSelected = selectedNodes[0]
+        moduleName, sep, userSpecifiedName = namespace.partition('__')
+        moduleFile = self.loadedModules.fileNameForClass(moduleName) if self.loadedModules else None
 
-                if lastSelected.startswith('Group__'):
-                    self.buttons['Ungroup'].setEnabled(True)
-                    self.buttons['Mirror Module'].setEnabled(True)
-                    self.buttons['Mirror Module'].setText('Mirror Group')
+        if not sep or not moduleFile:
+            return None
 
-                namespaceAndNode = utils.stripLeadingNamespace(lastSelected)
+        mod = importlib.import_module(f'Blueprint.{moduleFile}')
+        mod = utils.reloadModule(mod)
 
-                if namespaceAndNode:
-                    namespace = namespaceAndNode[0]
+        moduleClass = getattr(mod, mod.CLASS_NAME)
+        moduleInstance = moduleClass(userSpecifiedName, None)
+        self.moduleInstances[namespace] = moduleInstance
 
-                    validModules = [module for module in utils.loadAllModulesFromDirectory(self.modulesDir).keys()]
-                    validModuleNames = [module['name'] for module in utils.loadAllModulesFromDirectory(self.modulesDir).values()]
+        return moduleInstance
 
-                    for index, moduleName in enumerate(validModuleNames):
-                        moduleNameIncSuffix = f'{moduleName}__'
-                        if namespace.find(moduleNameIncSuffix) == 0:
-                            currentModuleFile = validModules[index]
-                            selectedModuleNamespace = namespace
-                            break
+    def modifySelected(self, force = False):
+        """
+        Updates the panel for the current selection.
 
-            controlEnable = False
-            userSpecifiedName = ''
-            constrainCommand = self.constrainRookToHook
-            constrainLabel = 'Constrain Root > Hook'
+        Args:
+            force (bool): Rebuild the module controls even if the selected module did not change.
+        """
+        selectedNodes = cmds.ls(selection = True)
 
-            if selectedModuleNamespace:
-                controlEnable = True
-                userSpecifiedName = selectedModuleNamespace.partition('__')[2]
+        if len(selectedNodes) > 1:
+            return
 
-                mod = importlib.import_module(f'Blueprint.{currentModuleFile}')
-                importlib.reload(mod)
+        lastSelected = selectedNodes[0] if selectedNodes else None
+        isGroup = bool(lastSelected and lastSelected.startswith('Group__'))
 
-                moduleClass = getattr(mod, mod.CLASS_NAME)
-                self.moduleInstance = moduleClass(userSpecifiedName, None)
+        selectedModuleNamespace = None
+        namespaceAndNode = utils.stripLeadingNamespace(lastSelected) if lastSelected else None
 
-                self.buttons['Mirror Module'].setEnabled(True)
-                self.buttons['Mirror Module'].setText('Mirror Module')
+        if namespaceAndNode and self.getModuleInstance(namespaceAndNode[0]):
+            selectedModuleNamespace = namespaceAndNode[0]
 
-                if self.moduleInstance.isRootConstrained():
-                    constrainCommand = self.unconstrainRookFromHook
-                    constrainLabel = 'Unconstrain Root'
+        self.buttons['Ungroup'].setEnabled(isGroup)
+        self.buttons['Mirror Module'].setEnabled(isGroup or bool(selectedModuleNamespace))
+        self.buttons['Mirror Module'].setText('Mirror Group' if isGroup else 'Mirror Module')
 
-            self.buttons['Rehook'].setEnabled(controlEnable)
-            self.buttons['Snap Root > Hook'].setEnabled(controlEnable)
-            self.buttons['Constrain Root > Hook'].setEnabled(controlEnable)
-            self.buttons['Constrain Root > Hook'].setText(constrainLabel)
-            self.buttons['Constrain Root > Hook'].clicked.connect(constrainCommand)
+        # Selecting another node of the same module keeps the panel as it is.
+        if selectedModuleNamespace == self.selectedModuleNamespace and not force:
+            return
 
-            self.buttons['Delete'].setEnabled(controlEnable)
-            self.moduleInstanceLineEdit.setEnabled(controlEnable)
-            self.moduleInstanceLineEdit.setText(userSpecifiedName)
+        self.selectedModuleNamespace = selectedModuleNamespace
+        self.moduleInstance = self.moduleInstances[selectedModuleNamespace] if selectedModuleNamespace else None
 
-            self.createModuleSpecificControls()
+        controlEnable = self.moduleInstance is not None
 
-        self.createScriptJob()
+        self.buttons['Rehook'].setEnabled(controlEnable)
+        self.buttons['Snap Root > Hook'].setEnabled(controlEnable)
+        self.buttons['Constrain Root > Hook'].setEnabled(controlEnable)
+        self.updateConstrainButton(controlEnable and self.moduleInstance.isRootConstrained())
+
+        self.buttons['Delete'].setEnabled(controlEnable)
+        self.moduleInstanceLineEdit.setEnabled(controlEnable)
+        self.moduleInstanceLineEdit.setText(selectedModuleNamespace.partition('__')[2] if controlEnable else '')
+
+        self.createModuleSpecificControls()
 
     def createModuleSpecificControls(self):
 
@@ -683,6 +710,7 @@ class Blueprint_UI(QtWidgets.QDialog):
             self.moduleInstance.UI(self, self.moduleControlScrollLayout)
 
     def deleteModule(self):
+        self.moduleInstances.pop(self.moduleInstance.moduleNamespace, None)
         self.moduleInstance.delete()
         cmds.select(clear = True)
 
@@ -710,35 +738,31 @@ class Blueprint_UI(QtWidgets.QDialog):
 
     def mirrorSelection(self):
         import System.mirrorModule as mirrorModule
-        importlib.reload(mirrorModule)
+        utils.reloadModule(mirrorModule)
         mirrorModule.MirrorModule(parentUI = self)
 
     def snapRootToHook(self):
         self.moduleInstance.snapRootToHook()
 
-    def constrainRookToHook(self):
-        self.moduleInstance.constrainRootToHook()
-
-        self.buttons['Constrain Root > Hook'].setText('Unconstrain Root')
+    def updateConstrainButton(self, constrained):
+        self.buttons['Constrain Root > Hook'].setText('Unconstrain Root' if constrained else 'Constrain Root > Hook')
 
-        try:
-            self.buttons['Constrain Root > Hook'].clicked.disconnect()
-        except:
-            pass
+    def toggleRootConstraint(self):
+        """
+        The single handler of the constrain button, it constrains or unconstrains depending on the module's current state.
+        """
+        if self.moduleInstance.isRootConstrained():
+            self.unconstrainRookFromHook()
+        else:
+            self.constrainRookToHook()
 
-        self.buttons['Constrain Root > Hook'].clicked.connect(self.unconstrainRookFromHook)
+    def constrainRookToHook(self):
+        self.moduleInstance.constrainRootToHook()
+        self.updateConstrainButton(True)
 
     def unconstrainRookFromHook(self):
         self.moduleInstance.unconstrainRootFromHook()
-
-        self.buttons['Constrain Root > Hook'].setText('Constraint Root > Hook')
-
-        try:
-            self.buttons['Constrain Root > Hook'].clicked.disconnect()
-        except:
-            pass
-
-        self.buttons['Constrain Root > Hook'].clicked.connect(self.constrainRookToHook)
+        self.updateConstrainButton(False)
 
     def lockClicked(self):
         msg = QtWidgets.QMessageBox()
@@ -753,20 +777,20 @@ class Blueprint_UI(QtWidgets.QDialog):
 
         self.deleteScriptJob()
 
+        # Locking replaces every blueprint module, none of the cached instances stay valid.
+        self.moduleInstances = {}
+        self.moduleInstance = None
+        self.selectedModuleNamespace = None
+
         moduleInfo = []
 
         cmds.namespace(setNamespace = ':')
-        namespaces = cmds.namespaceInfo(listOnlyNamespaces = True)
 
-        validModules = [module for module in utils.loadAllModulesFromDirectory(self.modulesDir).keys()]
-        validModuleNames = [module['name'] for module in utils.loadAllModulesFromDirectory(self.modulesDir).values()]
+        loadedModules = utils.loadAllModulesFromDirectory(self.modulesDir, importModules = False)
 
-        for namespace in namespaces:
-            moduleName, sep, userSpecifiedName = namespace.partition('__')
-
-            if sep and moduleName in validModuleNames:
-                index = validModuleNames.index(moduleName)
-                moduleInfo.append([validModules[index], userSpecifiedName])
+        for record in sceneIndex.getSceneIndex().getRecords():
+            if record.moduleType in loadedModules.byClassName:
+                moduleInfo.append([loadedModules.fileNameForClass(record.moduleType), record.userSpecifiedName])
 
         if len(moduleInfo) == 0:
             msg = QtWidgets.QMessageBox()
@@ -777,22 +801,32 @@ class Blueprint_UI(QtWidgets.QDialog):
 
         moduleInstances = []
 
-        for module, userSpecifiedName in moduleInfo:
-            mod = importlib.import_module(f'Blueprint.{module}')
-            importlib.reload(mod)
+        # Joint orientations requested during phase 1 are solved together when the batch closes.
+        with orientationSolver.OrientationBatch():
+            for module, userSpecifiedName in moduleInfo:
+                mod = importlib.import_module(f'Blueprint.{module}')
+                mod = utils.reloadModule(mod)
 
-            moduleClass = getattr(mod, mod.CLASS_NAME)
-            moduleInstance = moduleClass(userSpecifiedName, None)
-            moduleInfo = moduleInstance.lockPhase1() # [[positions]], ([(orientationValues)], parent), jointRotationOrders, jointPreferredAngles, hookObject, rootTransform
-            moduleInstances.append((moduleInstance, moduleInfo))
+                moduleClass = getattr(mod, mod.CLASS_NAME)
+                moduleInstance = moduleClass(userSpecifiedName, None)
+                moduleInfo = moduleInstance.lockPhase1() # [[positions]], ([(orientationValues)], parent), jointRotationOrders, jointPreferredAngles, hookObject, rootTransform
+                moduleInstances.append((moduleInstance, moduleInfo))
 
-        for module, moduleInfo in moduleInstances:
-            module.lockPhase2(moduleInfo)
+        # Read what phase 2 needs from the blueprint module groups, then delete every blueprint container in one call.
+        mirrorInfos = [module.getMirrorInfo() for module, _ in moduleInstances]
 
+        containers = [module.containerName for module, _ in moduleInstances]
         groupContainer = 'Group_container'
         if cmds.objExists(groupContainer):
-            cmds.lockNode(groupContainer, lock = False, lockUnpublished = False)
-            cmds.delete(groupContainer)
+            containers.append(groupContainer)
+
+        containers = cmds.ls(containers)
+        if containers:
+            cmds.lockNode(containers, lock = False, lockUnpublished = False)
+            cmds.delete(containers)
+
+        for (module, moduleInfo), mirrorInfo in zip(moduleInstances, mirrorInfos):
+            module.lockPhase2(moduleInfo, mirrorInfo)
 
         for module in moduleInstances:
             hookObject = module[1][4]
@@ -800,12 +834,12 @@ class Blueprint_UI(QtWidgets.QDialog):
 
     def groupSelected(self):
         import System.groupSelected as groupSelected
-        importlib.reload(groupSelected)
+        utils.reloadModule(groupSelected)
         groupSelected.GroupSelectedDialog.showUI(self)
 
     def ungroupSelected(self):
         import System.groupSelected as groupSelected
-        importlib.reload(groupSelected)
+        utils.reloadModule(groupSelected)
         groupSelected.UngroupSelected()
 
     def addModuleToUI(self):
@@ -850,8 +884,14 @@ class Blueprint_UI(QtWidgets.QDialog):
     def renameModule(self):
         newName = self.moduleInstanceLineEdit.text()
 
+        previousNamespace = self.moduleInstance.moduleNamespace
         self.moduleInstance.renameModuleInstance(newName)
 
+        # The instance now holds the new namespace, it stays cached and selected under it.
+        self.moduleInstances.pop(previousNamespace, None)
+        self.moduleInstances[self.moduleInstance.moduleNamespace] = self.moduleInstance
+        self.selectedModuleNamespace = self.moduleInstance.moduleNamespace
+
         previousSelection = cmds.ls(selection = True)
 
         if len(previousSelection) > 0:
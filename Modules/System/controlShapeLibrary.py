@@ -0,0 +1,726 @@
+"""
+Control Shape Library
+
+Reads the Maya ASCII control shapes in `ControlObjects/` without importing them as scenes.
+Each file is parsed once into compact arrays (vertex and CV positions, face connectivity,
+knots, colors). The arrays are cached next to the source in `__shapecache__/` as `.npy` files,
+keyed by the SHA-1 of the .ma file, and memory-mapped on later loads.
+
+A shape is rebuilt from the cached arrays with one `MFnMesh.create` call per mesh and one
+`setAttr .cc` call per NURBS curve or surface, instead of a `cmds.file(i = True)` import.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+
+import numpy as np
+
+import maya.cmds as cmds
+import maya.mel as mel
+import maya.api.OpenMaya as om
+
+import System.utils as utils
+
+
+CONTROL_OBJECTS_DIRECTORY = os.path.join(os.environ.get('RIGGING_TOOL_ROOT', os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))), 'ControlObjects')
+CACHE_DIRECTORY_NAME = '__shapecache__'
+CACHE_VERSION = 2
+
+SHAPE_TYPES = ('mesh', 'nurbsCurve', 'nurbsSurface')
+
+# Flags of the setAttr command that are followed by a value, and the ones that are not.
+_SETATTR_VALUE_FLAGS = {'-s', '-size', '-k', '-keyable', '-ch', '-capacityHint', '-type', '-l', '-lock', '-cb', '-channelBox'}
+_SETATTR_SWITCH_FLAGS = {'-av', '-alteredValue', '-c', '-clamp'}
+
+_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[^\s]+')
+_INDEXED_ATTRIBUTE = re.compile(r'^\.(\w+)(?:\[(\d+)(?::(\d+))?\])?$')
+_OBJECT_GROUP_COMPONENTS = re.compile(r'^\.iog\[0\]\.og\[(\d+)\]\.gcl$')  # Faces of a per-face shading assignment
+_SHADING_MEMBER = re.compile(r'^(?:iog|instObjGroups)(?:\[0\])?(?:\.(?:og|objectGroups)\[(\d+)\])?$')
+
+# {materialType: (colorAttribute, diffuseAttribute, defaultColor, defaultDiffuse)} of the surface shaders read from control files.
+MATERIAL_ATTRIBUTES = {
+    'lambert': ('c', 'dc', 0.5, 0.8),
+    'blinn': ('c', 'dc', 0.5, 0.8),
+    'phong': ('c', 'dc', 0.5, 0.8),
+    'phongE': ('c', 'dc', 0.5, 0.8),
+    'standardSurface': ('bc', 'b', 0.8, 1.0),
+    'aiStandardSurface': ('base_color', 'base', 0.8, 1.0),
+    'surfaceShader': ('oc', None, 0.0, 1.0),
+}
+
+# In-memory cache of loaded shape data: {filePath: (sourceHash, shapeData)}
+_loadedShapes = globals().get('_loadedShapes', {})
+
+
+# PARSING
+def _iterStatements(text):
+    """
+    Yields the MEL statements of a Maya ASCII file as token lists.
+    Statements end at a ';' outside double quotes and may span several lines.
+    """
+    text = '\n'.join(line for line in text.splitlines() if not line.startswith('//'))
+
+    inString = False
+    escaped = False
+    start = 0
+
+    for index, char in enumerate(text):
+        if inString:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                inString = False
+        elif char == '"':
+            inString = True
+        elif char == ';':
+            tokens = _TOKEN.findall(text[start:index])
+            start = index + 1
+
+            if tokens:
+                yield tokens
+
+
+def _unquote(token):
+    if len(token) >= 2 and token[0] == '"' and token[-1] == '"':
+        return token[1:-1]
+    return token
+
+
+def _shortName(name):
+    return _unquote(name).rpartition('|')[2]
+
+
+def _parseCreateNode(tokens):
+    """
+    Returns (nodeType, name, parent) for a createNode statement.
+    """
+    nodeType = tokens[1]
+    name = None
+    parent = None
+
+    index = 2
+    while index < len(tokens):
+        token = tokens[index]
+
+        if token in ('-n', '-name') and index + 1 < len(tokens):
+            name = _shortName(tokens[index + 1])
+            index += 2
+        elif token in ('-p', '-parent') and index + 1 < len(tokens):
+            parent = _shortName(tokens[index + 1])
+            index += 2
+        else:
+            index += 1
+
+    return nodeType, name, parent
+
+
+def _parseSetAttr(tokens):
+    """
+    Splits a setAttr statement into its attribute, its -type flag and its value tokens.
+
+    Returns:
+        tuple[str, str or None, list[str]] or None: (attribute, dataType, values), or None if there is no attribute.
+    """
+    index = 1
+    dataType = None
+
+    while index < len(tokens):
+        token = tokens[index]
+
+        if token in _SETATTR_VALUE_FLAGS:
+            if token == '-type':
+                dataType = _unquote(tokens[index + 1])
+            index += 2
+        elif token in _SETATTR_SWITCH_FLAGS:
+            index += 1
+        else:
+            break
+
+    if index >= len(tokens):
+        return None
+
+    attribute = _unquote(tokens[index])
+    values = tokens[index + 1:]
+
+    # A -type flag may also follow the attribute name.
+    if len(values) >= 2 and values[0] == '-type':
+        dataType = _unquote(values[1])
+        values = values[2:]
+
+    return attribute, dataType, values
+
+
+def _toBool(token):
+    return token in ('yes', 'on', 'true', '1')
+
+
+def _parsePolyFaces(tokens):
+    """
+    Parses polyFaces data into a list of faces, each a list of edge indices.
+    Only the 'f' entries are kept; uv ('mu'), color ('mc', 'fc') and hole ('h') entries are skipped.
+    """
+    faces = []
+    index = 0
+
+    while index < len(tokens):
+        token = tokens[index]
+
+        if token == 'f':
+            count = int(tokens[index + 1])
+            faces.append([int(value) for value in tokens[index + 2:index + 2 + count]])
+            index += 2 + count
+        elif token in ('mu', 'mc'):
+            count = int(tokens[index + 2])
+            index += 3 + count
+        elif token in ('h', 'fc'):
+            count = int(tokens[index + 1])
+            index += 2 + count
+        else:
+            index += 1
+
+    return faces
+
+
+def _parseNurbsCurve(tokens):
+    """
+    Parses nurbsCurve data: degree spans form rational dimension knotCount knots... cvCount cvs...
+    """
+    degree, spans, form = int(tokens[0]), int(tokens[1]), int(tokens[2])
+    rational = _toBool(tokens[3])
+    dimension = int(tokens[4])
+
+    knotCount = int(tokens[5])
+    knots = [float(value) for value in tokens[6:6 + knotCount]]
+
+    cvCount = int(tokens[6 + knotCount])
+    width = dimension + (1 if rational else 0)
+    cvStart = 7 + knotCount
+    cvs = [float(value) for value in tokens[cvStart:cvStart + cvCount * width]]
+
+    header = {'degree': degree, 'spans': spans, 'form': form, 'rational': rational, 'dimension': dimension}
+    arrays = {
+        'knots': np.array(knots, dtype = np.float64),
+        'cvs': np.array(cvs, dtype = np.float64).reshape(cvCount, width),
+    }
+
+    return header, arrays
+
+
+def _parseNurbsSurface(tokens):
+    """
+    Parses nurbsSurface data: degreeU degreeV formU formV rational knotCountU knotsU... knotCountV knotsV... cvCount cvs...
+    """
+    degreeU, degreeV, formU, formV = (int(value) for value in tokens[:4])
+    rational = _toBool(tokens[4])
+
+    index = 5
+    knotCountU = int(tokens[index])
+    knotsU = [float(value) for value in tokens[index + 1:index + 1 + knotCountU]]
+    index += 1 + knotCountU
+
+    knotCountV = int(tokens[index])
+    knotsV = [float(value) for value in tokens[index + 1:index + 1 + knotCountV]]
+    index += 1 + knotCountV
+
+    # Trimmed surfaces store a TRIM/NOTRIM keyword before the CVs.
+    if tokens[index].upper() in ('TRIM', 'NOTRIM'):
+        index += 1
+
+    cvCount = int(tokens[index])
+    width = 4 if rational else 3
+    cvs = [float(value) for value in tokens[index + 1:index + 1 + cvCount * width]]
+
+    header = {'degreeU': degreeU, 'degreeV': degreeV, 'formU': formU, 'formV': formV, 'rational': rational}
+    arrays = {
+        'knotsU': np.array(knotsU, dtype = np.float64),
+        'knotsV': np.array(knotsV, dtype = np.float64),
+        'cvs': np.array(cvs, dtype = np.float64).reshape(cvCount, width),
+    }
+
+    return header, arrays
+
+
+def _setIndexedValues(target, startIndex, values, width):
+    """
+    Writes a flat list of values into a {index: tuple} dictionary, `width` values per index.
+    """
+    for offset in range(len(values) // width):
+        target[startIndex + offset] = tuple(float(value) for value in values[offset * width:(offset + 1) * width])
+
+
+def _finalizeMesh(mesh):
+    """
+    Turns the parsed vt/pt/ed/fc data of a mesh into vertex positions and face vertex connectivity.
+    """
+    vertexCount = max(mesh['vt'], default = -1) + 1
+    vertices = np.zeros((vertexCount, 3), dtype = np.float64)
+
+    for index, position in mesh['vt'].items():
+        vertices[index] = position
+
+    # Tweaks (.pt) are offsets on top of the stored vertex positions, bake them in.
+    for index, offset in mesh['pt'].items():
+        if index < vertexCount:
+            vertices[index] += offset
+
+    edges = mesh['ed']
+    faceCounts = []
+    faceConnects = []
+
+    for faceEdges in mesh['fc']:
+        faceCounts.append(len(faceEdges))
+
+        for edgeIndex in faceEdges:
+            # A negative index -(e + 1) walks edge e backwards.
+            if edgeIndex >= 0:
+                faceConnects.append(edges[edgeIndex][0])
+            else:
+                faceConnects.append(edges[-edgeIndex - 1][1])
+
+    return {
+        'vertices': vertices,
+        'faceCounts': np.array(faceCounts, dtype = np.int32),
+        'faceConnects': np.array(faceConnects, dtype = np.int32),
+    }
+
+
+def parseMayaAsciiShapes(filePath):
+    """
+    Parses the transforms, shapes and colors of a Maya ASCII control file.
+
+    Cameras, light linkers, containers and all other nodes are ignored. Shading is reduced to the
+    color and diffuse value of the surface shaders assigned to each shape, or to each face group of
+    a shape with per-face assignments.
+
+    Args:
+        filePath (str): Path to the .ma file.
+
+    Returns:
+        tuple[dict, dict]: (metadata, arrays). The metadata is JSON serializable and lists the nodes
+            in creation order; the arrays are keyed '<nodeIndex>_<arrayName>'.
+    """
+    with open(filePath, 'r', encoding = 'utf-8', errors = 'replace') as fileHandle:
+        text = fileHandle.read()
+
+    nodes = []  # Transforms and shapes in creation order
+    nodesByName = {}
+    materials = {}  # {materialName: {'color': ..., 'diffuse': ...}}
+    meshData = {}  # {nodeName: {'vt': {}, 'pt': {}, 'ed': [], 'fc': []}}
+    nurbsData = {}  # {nodeName: (header, arrays)}
+    surfaceShaders = {}  # {shadingEngine: material}
+    shadingMembers = {}  # {shape: [(objectGroupIndex or None, shadingEngine)]}
+    objectGroups = {}  # {shape: {objectGroupIndex: [component]}}
+
+    current = None
+
+    for tokens in _iterStatements(text):
+        command = tokens[0]
+
+        if command == 'createNode':
+            nodeType, name, parent = _parseCreateNode(tokens)
+            current = None
+
+            if nodeType == 'transform' or nodeType in SHAPE_TYPES:
+                current = {'name': name, 'type': nodeType, 'parent': parent, 'attributes': {}}
+                nodes.append(current)
+                nodesByName[name] = current
+
+                if nodeType == 'mesh':
+                    meshData[name] = {'vt': {}, 'pt': {}, 'ed': [], 'fc': []}
+            elif nodeType in MATERIAL_ATTRIBUTES:
+                _, _, defaultColor, defaultDiffuse = MATERIAL_ATTRIBUTES[nodeType]
+                current = {'name': name, 'type': nodeType}
+                materials[name] = {'color': [defaultColor] * 3, 'diffuse': defaultDiffuse}
+
+        elif command == 'setAttr' and current is not None:
+            parsed = _parseSetAttr(tokens)
+            if not parsed:
+                continue
+
+            attribute, dataType, values = parsed
+            name = current['name']
+
+            groupMatch = _OBJECT_GROUP_COMPONENTS.match(attribute)
+            if groupMatch and dataType == 'componentList' and values:
+                objectGroups.setdefault(name, {})[int(groupMatch.group(1))] = [_unquote(value) for value in values[1:]]
+                continue
+
+            match = _INDEXED_ATTRIBUTE.match(attribute)
+            if not match:
+                continue
+
+            attributeName, startIndex, _ = match.groups()
+            startIndex = int(startIndex) if startIndex is not None else 0
+
+            if current['type'] in MATERIAL_ATTRIBUTES:
+                colorAttribute, diffuseAttribute, _, _ = MATERIAL_ATTRIBUTES[current['type']]
+
+                if attributeName == colorAttribute:
+                    materials[name]['color'] = [float(value) for value in values[:3]]
+                elif attributeName == diffuseAttribute:
+                    materials[name]['diffuse'] = float(values[0])
+
+            elif current['type'] == 'mesh' and attributeName in ('vt', 'pt', 'ed', 'fc'):
+                mesh = meshData[name]
+
+                if attributeName == 'vt':
+                    _setIndexedValues(mesh['vt'], startIndex, values, 3)
+                elif attributeName == 'pt':
+                    _setIndexedValues(mesh['pt'], startIndex, values, 3)
+                elif attributeName == 'ed':
+                    for offset in range(len(values) // 3):
+                        edgeIndex = startIndex + offset
+                        edge = (int(values[offset * 3]), int(values[offset * 3 + 1]))
+
+                        if edgeIndex >= len(mesh['ed']):
+                            mesh['ed'].extend([None] * (edgeIndex + 1 - len(mesh['ed'])))
+                        mesh['ed'][edgeIndex] = edge
+                elif attributeName == 'fc':
+                    mesh['fc'].extend(_parsePolyFaces(values))
+
+            elif attributeName == 'cc' and dataType == 'nurbsCurve':
+                nurbsData[name] = _parseNurbsCurve(values)
+
+            elif attributeName == 'cc' and dataType == 'nurbsSurface':
+                nurbsData[name] = _parseNurbsSurface(values)
+
+            elif attributeName in ('t', 'r', 's') and current['type'] == 'transform':
+                current['attributes'][attributeName] = [float(value) for value in values[:3]]
+
+            elif attributeName in ('ove', 'ovs', 'v') and values:
+                current['attributes'][attributeName] = _toBool(values[0])
+
+            elif attributeName in ('ovc', 'ovdt') and values:
+                current['attributes'][attributeName] = int(values[0])
+
+        elif command == 'connectAttr' and len(tokens) >= 3:
+            current = None
+            source = _unquote(tokens[1])
+            destination = _unquote(tokens[2])
+            sourceNode, _, sourceAttribute = source.partition('.')
+            destinationNode, _, destinationAttribute = destination.partition('.')
+
+            if destinationAttribute == 'ss' and sourceNode in materials:
+                surfaceShaders[destinationNode] = sourceNode
+            elif destinationAttribute.startswith('dsm'):
+                memberMatch = _SHADING_MEMBER.match(sourceAttribute)
+
+                # A shape can be a member of several shading engines, one per face group.
+                if memberMatch:
+                    groupIndex = memberMatch.group(1)
+                    shadingMembers.setdefault(sourceNode, []).append((int(groupIndex) if groupIndex is not None else None, destinationNode))
+
+        else:
+            # select, addAttr, rename etc. either change the current node or do not matter here.
+            if command == 'select':
+                current = None
+
+    # Keep only the transforms above a shape that can be rebuilt; this drops the default cameras.
+    keptTransforms = set()
+    for node in nodes:
+        if node['type'] == 'mesh' or node['name'] in nurbsData:
+            parent = node['parent']
+
+            while parent in nodesByName and parent not in keptTransforms:
+                keptTransforms.add(parent)
+                parent = nodesByName[parent]['parent']
+
+    metadata = {'version': CACHE_VERSION, 'nodes': []}
+    arrays = {}
+
+    for nodeIndex, node in enumerate(nodes):
+        if node['type'] == 'transform' and node['name'] not in keptTransforms:
+            continue
+
+        entry = {key: node[key] for key in ('name', 'type', 'parent', 'attributes')}
+        name = node['name']
+
+        if node['type'] == 'mesh':
+            for arrayName, array in _finalizeMesh(meshData[name]).items():
+                arrays[f'{nodeIndex}_{arrayName}'] = array
+        elif node['type'] in ('nurbsCurve', 'nurbsSurface'):
+            if name not in nurbsData:
+                # Curves saved without geometry (e.g. intermediate objects) cannot be rebuilt.
+                continue
+
+            header, nurbsArrays = nurbsData[name]
+            entry['nurbs'] = header
+
+            for arrayName, array in nurbsArrays.items():
+                arrays[f'{nodeIndex}_{arrayName}'] = array
+
+        shapeMaterials = []
+        for groupIndex, shadingEngine in shadingMembers.get(name, []):
+            material = surfaceShaders.get(shadingEngine)
+            if not material:
+                continue
+
+            shapeMaterial = dict(materials[material])
+            if groupIndex is not None:
+                faces = objectGroups.get(name, {}).get(groupIndex)
+                if not faces:
+                    continue
+                shapeMaterial['faces'] = faces
+
+            shapeMaterials.append(shapeMaterial)
+
+        if shapeMaterials:
+            entry['materials'] = shapeMaterials
+
+        entry['index'] = nodeIndex
+        metadata['nodes'].append(entry)
+
+    return metadata, arrays
+
+
+# CACHING
+def _hashFile(filePath):
+    sha1 = hashlib.sha1()
+
+    with open(filePath, 'rb') as fileHandle:
+        for chunk in iter(lambda: fileHandle.read(1 << 16), b''):
+            sha1.update(chunk)
+
+    return sha1.hexdigest()
+
+
+def _getCacheDirectory(filePath, sourceHash):
+    sourceDirectory, fileName = os.path.split(os.path.abspath(filePath))
+    stem = os.path.splitext(fileName)[0]
+
+    return os.path.join(sourceDirectory, CACHE_DIRECTORY_NAME, f'{stem}-{sourceHash}')
+
+
+def _readCache(cacheDirectory):
+    metadataPath = os.path.join(cacheDirectory, 'metadata.json')
+
+    if not os.path.isfile(metadataPath):
+        return None
+
+    try:
+        with open(metadataPath, 'r') as fileHandle:
+            metadata = json.load(fileHandle)
+
+        if metadata.get('version') != CACHE_VERSION:
+            return None
+
+        arrays = {arrayName: np.load(os.path.join(cacheDirectory, f'{arrayName}.npy'), mmap_mode = 'r') for arrayName in metadata['arrays']}
+    except (OSError, ValueError, KeyError):
+        return None
+
+    return metadata, arrays
+
+
+def _writeCache(cacheDirectory, metadata, arrays):
+    """
+    Writes the cache into a temporary directory and moves it into place, then removes
+    the caches of older versions of the same source file. Failing to write is not an error,
+    the shape is simply parsed again next time.
+    """
+    cacheRoot, cacheName = os.path.split(cacheDirectory)
+    stem = cacheName.rpartition('-')[0]
+    temporaryDirectory = f'{cacheDirectory}.{os.getpid()}.tmp'
+
+    try:
+        os.makedirs(temporaryDirectory, exist_ok = True)
+
+        for arrayName, array in arrays.items():
+            np.save(os.path.join(temporaryDirectory, f'{arrayName}.npy'), np.ascontiguousarray(array))
+
+        with open(os.path.join(temporaryDirectory, 'metadata.json'), 'w') as fileHandle:
+            json.dump(dict(metadata, arrays = sorted(arrays)), fileHandle)
+
+        if os.path.isdir(cacheDirectory):
+            shutil.rmtree(temporaryDirectory, ignore_errors = True)
+        else:
+            os.replace(temporaryDirectory, cacheDirectory)
+
+        for entry in os.listdir(cacheRoot):
+            if entry != cacheName and entry.rpartition('-')[0] == stem and not entry.endswith('.tmp'):
+                shutil.rmtree(os.path.join(cacheRoot, entry), ignore_errors = True)
+    except OSError as error:
+        shutil.rmtree(temporaryDirectory, ignore_errors = True)
+        print(f'Could not write the shape cache for {stem}: {error}')
+
+
+def loadShapeData(filePath):
+    """
+    Returns the parsed shape data of a Maya ASCII control file.
+
+    The source file is hashed on every call; the data is reused from memory or from the
+    `__shapecache__` directory as long as the hash matches, and parsed again otherwise.
+
+    Args:
+        filePath (str): Path to the .ma file, absolute or relative to `ControlObjects/`.
+
+    Returns:
+        tuple[dict, dict]: (metadata, arrays) as returned by `parseMayaAsciiShapes`. Cached arrays are read-only memory maps.
+    """
+    filePath = resolveShapePath(filePath)
+    sourceHash = _hashFile(filePath)
+
+    loaded = _loadedShapes.get(filePath)
+    if loaded and loaded[0] == sourceHash:
+        return loaded[1]
+
+    cacheDirectory = _getCacheDirectory(filePath, sourceHash)
+    shapeData = _readCache(cacheDirectory)
+
+    if shapeData is None:
+        shapeData = parseMayaAsciiShapes(filePath)
+        _writeCache(cacheDirectory, *shapeData)
+
+    _loadedShapes[filePath] = (sourceHash, shapeData)
+
+    return shapeData
+
+
+def resolveShapePath(filePath):
+    """
+    Resolves a control file name such as 'Blueprint/hook_representation' to the .ma file in `ControlObjects/`.
+    """
+    if not filePath.endswith('.ma'):
+        filePath = f'{filePath}.ma'
+
+    if not os.path.isabs(filePath):
+        filePath = os.path.join(CONTROL_OBJECTS_DIRECTORY, filePath)
+
+    if not os.path.isfile(filePath):
+        raise FileNotFoundError(f'Control shape file not found: {filePath}')
+
+    return os.path.normpath(filePath)
+
+
+# BUILDING
+def _createMesh(arrays, nodeIndex, parentObject):
+    vertices = arrays[f'{nodeIndex}_vertices']
+    points = om.MPointArray([om.MPoint(*position) for position in vertices.tolist()])
+
+    meshFn = om.MFnMesh()
+    meshFn.create(points, arrays[f'{nodeIndex}_faceCounts'].tolist(), arrays[f'{nodeIndex}_faceConnects'].tolist(), parent = parentObject)
+
+    # The function set is attached to the new mesh shape after create().
+    return meshFn.fullPathName()
+
+
+def _formatNurbsValues(entry, arrays, nodeIndex):
+    """
+    Formats the geometry of a NURBS node as the value list of a MEL `setAttr .cc` statement.
+    """
+    header = entry['nurbs']
+    rational = 'yes' if header['rational'] else 'no'
+    cvs = ' '.join(repr(value) for value in arrays[f'{nodeIndex}_cvs'].ravel().tolist())
+
+    def formatKnots(knots):
+        return f'{len(knots)} ' + ' '.join(repr(value) for value in knots.tolist())
+
+    if entry['type'] == 'nurbsCurve':
+        knots = formatKnots(arrays[f'{nodeIndex}_knots'])
+        cvCount = len(arrays[f'{nodeIndex}_cvs'])
+        return f'{header["degree"]} {header["spans"]} {header["form"]} {rational} {header["dimension"]} {knots} {cvCount} {cvs}'
+
+    knotsU = formatKnots(arrays[f'{nodeIndex}_knotsU'])
+    knotsV = formatKnots(arrays[f'{nodeIndex}_knotsV'])
+    cvCount = len(arrays[f'{nodeIndex}_cvs'])
+    return f'{header["degreeU"]} {header["degreeV"]} {header["formU"]} {header["formV"]} {rational} {knotsU} {knotsV} {cvCount} {cvs}'
+
+
+def createControlShape(filePath, name = None, parent = None, assignMaterials = True):
+    """
+    Builds the transforms and shapes of a control file in the scene from its cached arrays.
+
+    Args:
+        filePath (str): Path to the .ma file, absolute or relative to `ControlObjects/`.
+        name (str, optional): Name of the top transform. The other nodes are named after it, e.g.
+                              'orientation_controlShape' becomes '<name>Shape' and 'hierarchy_arrow_representation'
+                              becomes '<name>_hierarchy_arrow_representation'.
+        parent (str, optional): Node to parent the top transforms under.
+        assignMaterials (bool): Assign the pooled materials of the file's colors, per face group where the file
+                                assigns materials per face. The materials are not added to any container.
+
+    Returns:
+        list[str]: The top transforms that were created.
+    """
+    metadata, arrays = loadShapeData(filePath)
+
+    topName = next((entry['name'] for entry in metadata['nodes'] if entry['parent'] is None), None)
+
+    def sceneName(entryName):
+        if not name:
+            return entryName
+        if entryName.startswith(topName):
+            return f'{name}{entryName[len(topName):]}'
+        return f'{name}_{entryName}'
+
+    createdNodes = {}  # {nameInFile: full path in the scene}
+    topTransforms = []
+    curveStatements = []
+
+    for entry in metadata['nodes']:
+        entryName = entry['name']
+        parentPath = createdNodes.get(entry['parent'])
+
+        if entry['type'] == 'transform':
+            parentArgs = {'parent': parentPath} if parentPath else {}
+            node = cmds.createNode('transform', name = sceneName(entryName), skipSelect = True, **parentArgs)
+
+            for attribute, value in entry['attributes'].items():
+                if attribute in ('t', 'r', 's'):
+                    cmds.setAttr(f'{node}.{attribute}', *value, type = 'double3')
+                else:
+                    cmds.setAttr(f'{node}.{attribute}', value)
+
+            createdNodes[entryName] = cmds.ls(node, long = True)[0]
+            if not parentPath:
+                topTransforms.append(createdNodes[entryName])
+            continue
+
+        if not parentPath:
+            continue
+
+        if entry['type'] == 'mesh':
+            selectionList = om.MSelectionList()
+            selectionList.add(parentPath)
+            shape = _createMesh(arrays, entry['index'], selectionList.getDependNode(0))
+            shape = cmds.rename(shape, sceneName(entryName))
+        else:
+            shape = cmds.createNode(entry['type'], name = sceneName(entryName), parent = parentPath, skipSelect = True)
+            curveStatements.append(f'setAttr "{shape}.cc" -type "{entry["type"]}" {_formatNurbsValues(entry, arrays, entry["index"])};')
+
+        for attribute, value in entry['attributes'].items():
+            cmds.setAttr(f'{shape}.{attribute}', value)
+
+        createdNodes[entryName] = cmds.ls(shape, long = True)[0]
+
+        for material in entry.get('materials', []) if assignMaterials else []:
+            faces = material.get('faces')
+            members = [f'{createdNodes[entryName]}.{faceRange}' for faceRange in faces] if faces else createdNodes[entryName]
+
+            utils.assignMaterial(members, material['color'], material['diffuse'])
+
+    # All NURBS geometry goes in with a single MEL evaluation.
+    if curveStatements:
+        mel.eval('\n'.join(curveStatements))
+
+    if parent:
+        topTransforms = [cmds.parent(transform, parent)[0] for transform in topTransforms]
+        topTransforms = cmds.ls(topTransforms, long = True)
+
+    return topTransforms
+
+
+def clearShapeCache(directory = None):
+    """
+    Forgets the loaded shapes and deletes the `__shapecache__` directories under a directory, `ControlObjects/` by default.
+    """
+    _loadedShapes.clear()
+
+    for root, directories, _ in os.walk(directory or CONTROL_OBJECTS_DIRECTORY):
+        if CACHE_DIRECTORY_NAME in directories:
+            shutil.rmtree(os.path.join(root, CACHE_DIRECTORY_NAME), ignore_errors = True)
+            directories.remove(CACHE_DIRECTORY_NAME)
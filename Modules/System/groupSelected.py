@@ -1,12 +1,158 @@
 # System/groupSelected.py
 
+import numpy as np
+
 import maya.cmds as cmds
+import maya.mel as mel
 from PySide6 import QtWidgets, QtCore
 import System.utils as utils
-import importlib
+import System.mirrorEngine as mirrorEngine
+import System.orientationSolver as orientationSolver
 
 # Ensure the utils module is up-to-date
-importlib.reload(utils)
+utils.reloadModule(utils)
+
+GROUP_CONTAINER = 'Group_container'
+
+
+def createGroupTransform(name):
+    """
+    Creates a group transform from the module transform template, with globalScale driving all three scale axes.
+
+    Returns:
+        str: The group transform.
+    """
+    group = utils.createModuleTransformControl(name)
+
+    cmds.connectAttr(f'{group}.scaleY', f'{group}.scaleX')
+    cmds.connectAttr(f'{group}.scaleY', f'{group}.scaleZ')
+
+    for attr in ['scaleX', 'scaleZ', 'visibility']:
+        cmds.setAttr(f'{group}.{attr}', lock = True, keyable = False)
+
+    cmds.aliasAttr('globalScale', f'{group}.scaleY')
+
+    return group
+
+
+def ensureGroupContainer():
+    """
+    Creates the locked group container if the scene does not have one yet.
+    """
+    if not cmds.objExists(GROUP_CONTAINER):
+        utils.createContainer(name = GROUP_CONTAINER)
+        cmds.lockNode(GROUP_CONTAINER, lock = True, lockUnpublished = True)  # Locked like an existing container, unlockedContainers restores this state.
+
+
+def addGroupToContainer(group):
+    """
+    Adds a group to the group container and publishes its translate, rotate and globalScale.
+    """
+    utils.addNodeToContainer(container = GROUP_CONTAINER, nodesIn = [group])
+
+    groupName = group.partition('Group__')[2]
+
+    utils.publishAndBind(GROUP_CONTAINER, f'{group}.translate', f'{groupName}_t')
+    utils.publishAndBind(GROUP_CONTAINER, f'{group}.rotate', f'{groupName}_r')
+    utils.publishAndBind(GROUP_CONTAINER, f'{group}.globalScale', f'{groupName}_globalScale')
+
+
+def getGroupHierarchy(rootGroup):
+    """
+    Returns the groups of a nested group tree, parents before children.
+
+    Returns:
+        list[tuple[str, str]]: (group, parentGroup) pairs. The parent of the root group is None.
+    """
+    hierarchy = [(rootGroup, None)]
+
+    for group, _ in hierarchy:
+        children = cmds.listRelatives(group, children = True, type = 'transform') or []
+        hierarchy.extend((child, group) for child in children if child.startswith('Group__'))
+
+    return hierarchy
+
+
+def getMirroredGroupNames(rootGroup, suffix = '_mirror'):
+    """
+    Returns the names the groups of a nested group tree get when it is mirrored, and the names that are already taken.
+
+    Args:
+        rootGroup (str): The top group of the tree, e.g. 'Group__arms'.
+        suffix (str): Appended to each group name, 'Group__arms' becomes 'Group__arms_mirror'.
+
+    Returns:
+        tuple[dict, list[str]]: ({originalGroup: mirroredGroup} parents before children, existing mirrored names).
+    """
+    newNames = {group: f'{group}{suffix}' for group, _ in getGroupHierarchy(rootGroup)}
+    existing = [name for name in newNames.values() if cmds.objExists(name)]
+
+    return newNames, existing
+
+
+def mirrorGroupHierarchy(rootGroup, mirrorPlane, parent = None, suffix = '_mirror'):
+    """
+    Creates the mirror of a nested group tree without a dialog, duplicates or constraints.
+
+    The world matrices of all groups are read at once and reflected across the plane with
+    `mirrorEngine.reflectMatrices`. Each new group gets its local translate, rotate and globalScale
+    relative to its mirrored parent, all written with one MEL evaluation. Modules in the groups are not moved.
+
+    Args:
+        rootGroup (str): The top group of the tree, e.g. 'Group__arms'.
+        mirrorPlane (str): 'YZ', 'XZ' or 'XY'.
+        parent (str, optional): Transform the mirrored root group is parented under. Parented to the world if None.
+        suffix (str): Appended to each group name, 'Group__arms' becomes 'Group__arms_mirror'.
+
+    Returns:
+        dict: {originalGroup: mirroredGroup}, parents before children.
+
+    Raises:
+        RuntimeError: If a mirrored group name already exists.
+    """
+    hierarchy = getGroupHierarchy(rootGroup)
+    newNames, existing = getMirroredGroupNames(rootGroup, suffix)
+
+    # Callers that mirror modules as well check this up front, see `mirrorPlanner.planMirror()`.
+    if existing:
+        raise RuntimeError(f'Cannot mirror {rootGroup}, these groups already exist: {", ".join(existing)}')
+
+    worldMatrices = mirrorEngine.reflectMatrices(mirrorEngine.readWorldMatrices([group for group, _ in hierarchy]), mirrorPlane)
+    matrixIndices = {group: index for index, (group, _) in enumerate(hierarchy)}
+
+    rootParentMatrix = mirrorEngine.readWorldMatrices([parent])[0] if parent else np.identity(4)
+    parentMatrices = np.array([worldMatrices[matrixIndices[groupParent]] if groupParent else rootParentMatrix for _, groupParent in hierarchy])
+
+    localMatrices = worldMatrices @ np.linalg.inv(parentMatrices)
+    scales = np.linalg.norm(localMatrices[:, :3, :3], axis = 2)
+    rotations = orientationSolver.rotationsToEulerXYZ(localMatrices[:, :3, :3] / scales[:, :, None])
+
+    ensureGroupContainer()
+
+    mirroredGroups = {}
+    statements = []
+
+    with utils.unlockedContainers(GROUP_CONTAINER), utils.ContainerTransaction():
+        for index, (group, groupParent) in enumerate(hierarchy):
+            newGroup = createGroupTransform(newNames[group])
+            mirroredGroups[group] = newGroup
+
+            newParent = mirroredGroups[groupParent] if groupParent else parent
+            if newParent:
+                statements.append(f'parent -relative "{newGroup}" "{newParent}";')
+
+            translation = localMatrices[index, 3, :3].tolist()
+            rotation = rotations[index].tolist()
+
+            statements.append(f'setAttr "{newGroup}.translate" -type double3 {translation[0]!r} {translation[1]!r} {translation[2]!r};')
+            statements.append(f'setAttr "{newGroup}.rotate" -type double3 {rotation[0]!r} {rotation[1]!r} {rotation[2]!r};')
+            statements.append(f'setAttr "{newGroup}.globalScale" {float(scales[index].mean())!r};')
+
+            addGroupToContainer(newGroup)
+
+        mel.eval('\n'.join(statements))
+
+    return mirroredGroups
 
 
 class GroupSelectedDialog(QtWidgets.QDialog):
@@ -139,36 +285,27 @@ class GroupSelectedDialog(QtWidgets.QDialog):
         groupTransform = cmds.rename(self.tempGroupTransform, fullGroupName)
         self.tempGroupTransform = None  # Clear the temp attribute after renaming
 
-        groupContainer = 'Group_container'
-        if not cmds.objExists(groupContainer):
-            utils.createContainer(name = groupContainer)
+        ensureGroupContainer()
 
-        containers = [groupContainer]
+        containers = [GROUP_CONTAINER]
         for obj in self.objectsToGroup:
             if obj.startswith('Group__'):
                 continue
             objNamespace = utils.stripLeadingNamespace(obj)[0]
             containers.append(f'{objNamespace}:module_container')
 
-        for c in containers:
-            if cmds.objExists(c):
-                cmds.lockNode(c, lock = False, lockUnpublished = False)
-
-        if self.objectsToGroup:
-            tempGroup = cmds.group(self.objectsToGroup, absolute = True)
-            groupParent = cmds.listRelatives(tempGroup, parent = True)
-
-            if groupParent:
-                cmds.parent(groupTransform, groupParent[0], absolute = True)
+        with utils.unlockedContainers(containers):
+            if self.objectsToGroup:
+                tempGroup = cmds.group(self.objectsToGroup, absolute = True)
+                groupParent = cmds.listRelatives(tempGroup, parent = True)
 
-            cmds.parent(self.objectsToGroup, groupTransform, absolute = True)
-            cmds.delete(tempGroup)
+                if groupParent:
+                    cmds.parent(groupTransform, groupParent[0], absolute = True)
 
-        self.addGroupToContainer(groupTransform)
+                cmds.parent(self.objectsToGroup, groupTransform, absolute = True)
+                cmds.delete(tempGroup)
 
-        for c in containers:
-            if cmds.objExists(c):
-                cmds.lockNode(c, lock = True, lockUnpublished = True)
+            self.addGroupToContainer(groupTransform)
 
         cmds.setToolTo('moveSuperContext')
         cmds.select(groupTransform, replace = True)
@@ -179,14 +316,7 @@ class GroupSelectedDialog(QtWidgets.QDialog):
         """
         Adds the newly created group and its attributes to the main group container.
         """
-        groupContainer = 'Group_container'
-        utils.addNodeToContainer(container = groupContainer, nodesIn = [group])
-
-        groupName = group.partition('Group__')[2]
-
-        cmds.container(groupContainer, edit = True, publishAndBind = (f'{group}.translate', f'{groupName}_t'))
-        cmds.container(groupContainer, edit = True, publishAndBind = (f'{group}.rotate', f'{groupName}_r'))
-        cmds.container(groupContainer, edit = True, publishAndBind = (f'{group}.globalScale', f'{groupName}_globalScale'))
+        addGroupToContainer(group)
 
     def findSelectionToGroup(self):
         """
@@ -201,15 +331,7 @@ class GroupSelectedDialog(QtWidgets.QDialog):
         """
         Creates a temporary visual representation for the group being created.
         """
-        self.tempGroupTransform = utils.createModuleTransformControl('Group__tempGroupTransform__')
-
-        cmds.connectAttr(f'{self.tempGroupTransform}.scaleY', f'{self.tempGroupTransform}.scaleX')
-        cmds.connectAttr(f'{self.tempGroupTransform}.scaleY', f'{self.tempGroupTransform}.scaleZ')
-
-        for attr in ['scaleX', 'scaleZ', 'visibility']:
-            cmds.setAttr(f'{self.tempGroupTransform}.{attr}', lock = True, keyable = False)
-
-        cmds.aliasAttr('globalScale', f'{self.tempGroupTransform}.scaleY')
+        self.tempGroupTransform = createGroupTransform('Group__tempGroupTransform__')
 
     def createAtLastSelected(self):
         """
@@ -241,22 +363,6 @@ class GroupSelectedDialog(QtWidgets.QDialog):
 
         cmds.xform(self.tempGroupTransform, worldSpace = True, absolute = True, translation = controlPos)
 
-    def createGroupAtSpecified(self, name, targetGroup, parent):
-        self.createTemporaryGroupRepresentation()
-
-        parentConstraint = cmds.parentConstraint(targetGroup, self.tempGroupTransform ,maintainOffset = False)[0]
-        cmds.delete(parentConstraint)
-
-        scale = cmds.getAttr(f'{targetGroup}.globalScale')
-        cmds.setAttr(f'{self.tempGroupTransform}.globalScale', scale)
-
-        if parent:
-            cmds.parent(self.tempGroupTransform, parent, absolute = True)
-
-        newGroup = self.createGroup(name)
-
-        return newGroup
-
     @classmethod
     def showUI(cls, parent = None):
         """
@@ -306,37 +412,30 @@ class UngroupSelected:
             if cmds.objExists(moduleContainer):
                 moduleContainers.append(moduleContainer)
 
-        for container in moduleContainers:
-            if cmds.objExists(container):
-                cmds.lockNode(container, lock = False, lockUnpublished = False)
-
-        for group in filteredGroups:
-            children = cmds.listRelatives(group, children = True, fullPath = True) or []
-            if children:
-                cmds.ungroup(group, absolute = True)
-            else:
-                cmds.delete(group)
-
-            groupName = group.partition('__')[2]
-            for attr in ['t', 'r', 'globalScale']:
-                attr_name = f'{groupName}_{attr}'
-                if cmds.container(groupContainer, query = True, publishName = attr_name):
-                    cmds.container(groupContainer, edit = True, unbindAndUnpublish = f'{group}.{attr}')
-
-            parentGroup = cmds.listRelatives(group, parent = True)
-            if parentGroup:
-                parentGroup = parentGroup[0]
-                children = cmds.listRelatives(parentGroup, children = True, type = 'transform') or []
-                if not children:
-                    cmds.select(parentGroup, replace = True)
-                    UngroupSelected()  # Recursively ungroup empty parent
-
-        if cmds.objExists(groupContainer) and not cmds.container(groupContainer, query = True, nodeList = True):
-            cmds.delete(groupContainer)
-
-        for container in moduleContainers:
-            if cmds.objExists(container):
-                cmds.lockNode(container, lock = True, lockUnpublished = True)
+        with utils.unlockedContainers(moduleContainers):
+            for group in filteredGroups:
+                children = cmds.listRelatives(group, children = True, fullPath = True) or []
+                if children:
+                    cmds.ungroup(group, absolute = True)
+                else:
+                    cmds.delete(group)
+
+                groupName = group.partition('__')[2]
+                for attr in ['t', 'r', 'globalScale']:
+                    attr_name = f'{groupName}_{attr}'
+                    if cmds.container(groupContainer, query = True, publishName = attr_name):
+                        cmds.container(groupContainer, edit = True, unbindAndUnpublish = f'{group}.{attr}')
+
+                parentGroup = cmds.listRelatives(group, parent = True)
+                if parentGroup:
+                    parentGroup = parentGroup[0]
+                    children = cmds.listRelatives(parentGroup, children = True, type = 'transform') or []
+                    if not children:
+                        cmds.select(parentGroup, replace = True)
+                        UngroupSelected()  # Recursively ungroup empty parent
+
+            if cmds.objExists(groupContainer) and not cmds.container(groupContainer, query = True, nodeList = True):
+                cmds.delete(groupContainer)
 
     def findChildModules(self, group):
         """
@@ -0,0 +1,210 @@
+"""
+Mirror Engine
+
+Reflects the world positions of blueprint controls across a plane in one NumPy pass.
+
+Pairs of (source, target) nodes are collected for every module being mirrored. `MirrorEngine.run()`
+then reads all source positions through one OpenMaya selection list, reflects them with the
+Householder reflection H = I - 2nn^T about a plane through any pivot, and writes every target
+back with a single batched MEL evaluation.
+"""
+
+import numpy as np
+
+import maya.mel as mel
+import maya.api.OpenMaya as om
+
+
+# Normals of the mirror planes offered in the mirror UI.
+PLANE_NORMALS = {
+    'YZ': (1.0, 0.0, 0.0),
+    'XZ': (0.0, 1.0, 0.0),
+    'XY': (0.0, 0.0, 1.0),
+}
+
+
+def getPlaneNormal(plane):
+    """
+    Returns the unit normal of a mirror plane given by name ('YZ', 'XZ', 'XY') or as a normal vector.
+    """
+    normal = np.asarray(PLANE_NORMALS.get(plane, plane) if isinstance(plane, str) else plane, dtype = np.float64)
+    length = np.linalg.norm(normal)
+
+    if length < 1e-12:
+        raise ValueError(f'Invalid mirror plane normal: {plane}')
+
+    return normal / length
+
+
+def reflectionMatrix(plane, pivot = (0.0, 0.0, 0.0)):
+    """
+    Returns the 4x4 row-vector matrix that reflects points across a plane through a pivot.
+
+    Args:
+        plane (str or array-like): Plane name ('YZ', 'XZ', 'XY') or plane normal.
+        pivot (array-like): Any point on the plane.
+
+    Returns:
+        numpy.ndarray: (4, 4) reflection matrix, p' = [p, 1] * M.
+    """
+    normal = getPlaneNormal(plane)
+    pivot = np.asarray(pivot, dtype = np.float64)
+
+    matrix = np.identity(4)
+    matrix[:3, :3] -= 2.0 * np.outer(normal, normal)
+    matrix[3, :3] = 2.0 * np.dot(pivot, normal) * normal
+
+    return matrix
+
+
+def reflectPoints(points, normals, pivots):
+    """
+    Reflects points across per-point planes: p' = p - 2((p - c) . n) n.
+
+    Args:
+        points (array-like): (N, 3) points.
+        normals (array-like): (N, 3) unit plane normals, or one (3,) normal for all points.
+        pivots (array-like): (N, 3) points on the planes, or one (3,) pivot for all points.
+
+    Returns:
+        numpy.ndarray: (N, 3) reflected points.
+    """
+    points = np.asarray(points, dtype = np.float64).reshape(-1, 3)
+    normals = np.broadcast_to(np.asarray(normals, dtype = np.float64), points.shape)
+    pivots = np.broadcast_to(np.asarray(pivots, dtype = np.float64), points.shape)
+
+    distances = np.sum((points - pivots) * normals, axis = 1, keepdims = True)
+
+    return points - 2.0 * distances * normals
+
+
+def reflectMatrices(matrices, plane, pivot = (0.0, 0.0, 0.0)):
+    """
+    Reflects transform matrices across a plane and keeps them right-handed.
+
+    A reflection flips the handedness of a frame, which a transform without negative scale cannot
+    represent. The axis most aligned with the plane normal is negated back, so e.g. an identity frame
+    mirrored across YZ stays an identity frame at the mirrored position.
+
+    Args:
+        matrices (array-like): (N, 4, 4) row-vector world matrices.
+        plane (str or array-like): Plane name ('YZ', 'XZ', 'XY') or plane normal.
+        pivot (array-like): Any point on the plane.
+
+    Returns:
+        numpy.ndarray: (N, 4, 4) mirrored world matrices with a positive determinant.
+    """
+    matrices = np.asarray(matrices, dtype = np.float64).reshape(-1, 4, 4) @ reflectionMatrix(plane, pivot)
+
+    normal = getPlaneNormal(plane)
+    axes = matrices[:, :3, :3]
+    alignedAxes = np.argmax(np.abs(axes @ normal) / np.maximum(np.linalg.norm(axes, axis = 2), 1e-12), axis = 1)
+
+    matrices[np.arange(len(matrices)), alignedAxes, :3] *= -1.0
+
+    return matrices
+
+
+def readWorldMatrices(nodes):
+    """
+    Reads the world matrices of several transforms through one selection list.
+
+    Returns:
+        numpy.ndarray: (N, 4, 4) row-vector world matrices, in the order of `nodes`.
+    """
+    selection = om.MSelectionList()
+    selectionIndices = {}
+
+    # A selection list merges duplicates, so each node is added once.
+    for node in nodes:
+        if node not in selectionIndices:
+            selection.add(node)
+            selectionIndices[node] = len(selectionIndices)
+
+    matrices = [list(selection.getDagPath(index).inclusiveMatrix()) for index in range(selection.length())]
+
+    return np.array([matrices[selectionIndices[node]] for node in nodes], dtype = np.float64).reshape(-1, 4, 4)
+
+
+def readWorldPositions(nodes):
+    """
+    Reads the world translations of several transforms through one selection list.
+
+    Returns:
+        numpy.ndarray: (N, 3) world positions, in the order of `nodes`.
+    """
+    selection = om.MSelectionList()
+    selectionIndices = {}
+
+    # A selection list merges duplicates, so each node is added once.
+    for node in nodes:
+        if node not in selectionIndices:
+            selection.add(node)
+            selectionIndices[node] = len(selectionIndices)
+
+    positions = [om.MTransformationMatrix(selection.getDagPath(index).inclusiveMatrix()).translation(om.MSpace.kWorld) for index in range(selection.length())]
+
+    return np.array([[positions[selectionIndices[node]].x, positions[selectionIndices[node]].y, positions[selectionIndices[node]].z] for node in nodes], dtype = np.float64).reshape(-1, 3)
+
+
+def writeWorldPositions(nodes, positions):
+    """
+    Moves several transforms to world positions with one MEL evaluation, so the write is a single undoable step.
+    """
+    statements = [f'xform -worldSpace -absolute -translation {x!r} {y!r} {z!r} "{node}";' for node, (x, y, z) in zip(nodes, np.asarray(positions).tolist())]
+
+    if statements:
+        mel.eval('\n'.join(statements))
+
+
+class MirrorEngine:
+    """
+    Collects (source, target) node pairs and mirrors all of them in one read, reflect and write pass.
+
+    Example:
+        engine = mirrorEngine.MirrorEngine()
+        engine.add('left:hand_translation_control', 'right:hand_translation_control', 'YZ')
+        engine.run()
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.sources = []
+        self.targets = []
+        self.normals = []
+        self.pivots = []
+
+    def __len__(self):
+        return len(self.targets)
+
+    def add(self, source, target, plane = 'YZ', pivot = (0.0, 0.0, 0.0)):
+        """
+        Queues `target` to be moved to the reflection of `source` across `plane` through `pivot`.
+        """
+        self.sources.append(source)
+        self.targets.append(target)
+        self.normals.append(getPlaneNormal(plane))
+        self.pivots.append(np.asarray(pivot, dtype = np.float64))
+
+    def addPairs(self, pairs, plane = 'YZ', pivot = (0.0, 0.0, 0.0)):
+        for source, target in pairs:
+            self.add(source, target, plane, pivot)
+
+    def run(self):
+        """
+        Reads all source positions, reflects them and writes all targets, then clears the queue.
+
+        Returns:
+            numpy.ndarray: (N, 3) positions written to the targets.
+        """
+        if not self.targets:
+            return np.empty((0, 3))
+
+        positions = reflectPoints(readWorldPositions(self.sources), np.array(self.normals), np.array(self.pivots))
+        writeWorldPositions(self.targets, positions)
+
+        self.clear()
+
+        return positions
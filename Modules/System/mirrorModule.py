@@ -1,15 +1,27 @@
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
 from PySide6 import QtWidgets, QtCore
 from shiboken6 import wrapInstance
 import System.utils as utils
+import System.mirrorPlanner as mirrorPlanner
 import maya.OpenMayaUI as omui
 import os
 import importlib
 import time
 
-importlib.reload(utils)
+utils.reloadModule(utils)
 
 class MirrorProgressDialog(QtWidgets.QDialog):
+    """
+    Progress window for mirroring, split into weighted phases.
+
+    UI events are pumped at most every PROCESS_EVENTS_INTERVAL seconds, so the dialog stays responsive
+    without slowing the mirror down. Each step shows the elapsed time and an estimate of the time left
+    in the current phase.
+    """
+
+    PROCESS_EVENTS_INTERVAL = 0.05  # Seconds between two QApplication.processEvents calls
+
     def __init__(self, parentUI=None):
         super().__init__(parentUI)
         self.setWindowTitle('Mirroring Progress')
@@ -26,11 +38,83 @@ class MirrorProgressDialog(QtWidgets.QDialog):
         mainLayout.addWidget(self.progressLabel)
         mainLayout.addWidget(self.progressBar)
 
-    def updateProgress(self, value, message=""):
-        self.progressBar.setValue(value)
+        self.lastProcessEvents = 0.0
+
+        self.phaseName = ''
+        self.phaseStart = 0.0
+        self.phaseBase = 0.0
+        self.phaseProportion = 0.0
+        self.phaseSteps = 0
+        self.phaseStepsDone = 0
+        self.phaseTimings = []  # [(phaseName, seconds)]
+
+    def processEvents(self, force = False):
+        now = time.perf_counter()
+
+        if force or now - self.lastProcessEvents >= self.PROCESS_EVENTS_INTERVAL:
+            self.lastProcessEvents = now
+            QtWidgets.QApplication.processEvents()
+
+    def updateProgress(self, value, message="", force = False):
+        self.progressBar.setValue(int(value))
         if message:
             self.progressLabel.setText(message)
-        QtWidgets.QApplication.processEvents() # Process events to update UI
+
+        self.processEvents(force)  # Process events to update UI
+
+    def beginPhase(self, name, proportion, steps):
+        """
+        Starts a phase covering `proportion` percent of the bar, made of `steps` calls to `step()`.
+        """
+        self.endPhase()
+
+        self.phaseName = name
+        self.phaseStart = time.perf_counter()
+        self.phaseProportion = proportion
+        self.phaseSteps = max(steps, 1)
+        self.phaseStepsDone = 0
+
+    def step(self, message = ''):
+        """
+        Marks one step of the current phase as done and shows the phase's elapsed time and ETA.
+        """
+        self.phaseStepsDone += 1
+
+        elapsed = time.perf_counter() - self.phaseStart
+        remaining = elapsed / self.phaseStepsDone * (self.phaseSteps - self.phaseStepsDone)
+        progress = self.phaseBase + self.phaseProportion * self.phaseStepsDone / self.phaseSteps
+
+        self.updateProgress(progress, f'{self.phaseName} ({self.phaseStepsDone}/{self.phaseSteps}): {message}\n{elapsed:.1f}s elapsed, about {remaining:.1f}s left')
+
+    def endPhase(self):
+        if not self.phaseName:
+            return
+
+        self.phaseTimings.append((self.phaseName, time.perf_counter() - self.phaseStart))
+        self.phaseBase += self.phaseProportion
+        self.phaseName = ''
+
+    def finish(self, success = True):
+        """
+        Closes the last phase, reports the outcome with the time spent in each phase and closes the dialog.
+
+        Args:
+            success (bool): False if the mirror raised, the failure is reported instead of completion.
+        """
+        self.endPhase()
+
+        total = sum(seconds for _, seconds in self.phaseTimings)
+        timings = ', '.join(f'{name} {seconds:.2f}s' for name, seconds in self.phaseTimings)
+
+        if success:
+            self.updateProgress(100, "Mirroring complete!", force = True)
+            om.MGlobal.displayInfo(f'Mirroring complete in {total:.2f}s ({timings}).')
+        else:
+            self.updateProgress(self.progressBar.value(), "Mirroring failed.", force = True)
+            om.MGlobal.displayWarning(f'Mirroring failed after {total:.2f}s ({timings}).')
+
+        self.close()
+
 
 class MirrorModule(QtWidgets.QDialog):
 
@@ -97,17 +181,13 @@ class MirrorModule(QtWidgets.QDialog):
     def canModuleBeMirrored(self, module):
         blueprintsFolder = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Blueprint')
 
-        validModules = [module for module in utils.loadAllModulesFromDirectory(blueprintsFolder).keys()]
-        validModuleNames = [module['name'] for module in utils.loadAllModulesFromDirectory(blueprintsFolder).values()]
+        moduleFile = utils.loadAllModulesFromDirectory(blueprintsFolder, importModules = False).fileNameForClass(module.partition('__')[0])
 
-        moduleName = module.partition('__')[0]
-
-        if not moduleName in validModuleNames:
+        if not moduleFile:
             return False
 
-        index = validModuleNames.index(moduleName)
-        mod = importlib.import_module(f'Blueprint.{validModules[index]}')
-        importlib.reload(mod)
+        mod = importlib.import_module(f'Blueprint.{moduleFile}')
+        mod = utils.reloadModule(mod)
 
         moduleClass = getattr(mod, mod.CLASS_NAME)
         moduleInstance = moduleClass('null', None)
@@ -237,43 +317,57 @@ class MirrorModule(QtWidgets.QDialog):
         # --- Bottom Buttons (fixed, outside scroll area) ---
         buttonLayout = QtWidgets.QHBoxLayout()
         self.mirrorButton = QtWidgets.QPushButton("Accept")
+        self.dryRunButton = QtWidgets.QPushButton("Dry Run")
         self.closeButton = QtWidgets.QPushButton("Cancel")
 
         buttonLayout.addWidget(self.mirrorButton)
+        buttonLayout.addWidget(self.dryRunButton)
         buttonLayout.addWidget(self.closeButton)
         mainLayout.addLayout(buttonLayout)
 
         # --- Connections ---
         self.closeButton.clicked.connect(self.reject)
         self.mirrorButton.clicked.connect(self.accept)
+        self.dryRunButton.clicked.connect(self.dryRun)
 
-    def accept(self):
-        super().accept()
-        self.moduleInfo = []
-
+    def getMirrorRequests(self):
+        """
+        Returns one mirrorPlanner.MirrorRequest per module with the names and settings chosen in the dialog.
+        """
         self.mirrorPlane = self.mirrorPlaneButtonGroup.checkedButton().text()
+        requests = []
 
-        for i in range(len(self.modules)):
-            originalModule = self.modules[i]
-            originalModuleName = self.moduleNames[i]
+        for originalModule, originalModuleName in zip(self.modules, self.moduleNames):
+            if self.sameMirrorSettingsForAll:
+                settings = self.globalSettings
+            else:
+                settings = self.moduleSettings[originalModuleName]
 
-            originalModulePrefix = originalModule.partition("__")[0]
-            mirroredModuleUserSpecifiedName = self.mirrorNames[originalModuleName].text()
-            mirroredModuleName = f'{originalModulePrefix}__{mirroredModuleUserSpecifiedName}'
+            requests.append(mirrorPlanner.MirrorRequest(
+                originalModule = originalModule,
+                mirroredName = self.mirrorNames[originalModuleName].text(),
+                mirrorPlane = self.mirrorPlane,
+                translationFunction = settings['translationButtonGroup'].checkedButton().text(),
+                rotationFunction = settings['rotationButtonGroup'].checkedButton().text(),
+            ))
 
-            if utils.doesBlueprintUserSpecifiedNameExist(mirroredModuleUserSpecifiedName):
-                QtWidgets.QMessageBox.question(self, "Name Conflict", f'Name {mirroredModuleUserSpecifiedName} already exists, aborting mirror.', QtWidgets.QMessageBox.StandardButton.Ok)
-                return
+        return requests
 
-            if self.sameMirrorSettingsForAll:
-                translationSettingText = self.globalSettings['translationButtonGroup'].checkedButton().text()
-                rotationSettingText = self.globalSettings['rotationButtonGroup'].checkedButton().text()
+    def dryRun(self):
+        """
+        Plans the mirror without changing the scene and shows what it would do.
+        """
+        plan = mirrorPlanner.planMirror(self.getMirrorRequests(), group = self.group)
+        QtWidgets.QMessageBox.information(self, "Mirror Module(s) Dry Run", plan.report())
 
-            else:
-                translationSettingText = self.moduleSettings[originalModuleName]['translationButtonGroup'].checkedButton().text()
-                rotationSettingText = self.moduleSettings[originalModuleName]['rotationButtonGroup'].checkedButton().text()
+    def accept(self):
+        self.plan = mirrorPlanner.planMirror(self.getMirrorRequests(), group = self.group)
 
-            self.moduleInfo.append([originalModule, mirroredModuleName, self.mirrorPlane, translationSettingText, rotationSettingText])
+        if not self.plan.isValid:
+            QtWidgets.QMessageBox.warning(self, "Mirror Module(s)", f'{self.plan.report()}\n\nAborting mirror.')
+            return
+
+        super().accept()
 
         self.mirrorModules()
 
@@ -282,127 +376,48 @@ class MirrorModule(QtWidgets.QDialog):
         mirrorProgressDialog = MirrorProgressDialog(parentUI = self.parentUI)
         mirrorProgressDialog.show()
 
-        mirrorModulesProgress = 0
+        mirrorProgressDialog.updateProgress(0, "Mirroring modules...", force = True)
 
-        phase1_proportion = 15
-        phase2_proportion = 70
-        phase3_proportion = 15
+        # The whole mirror is one undo step and the viewport does not redraw until it is done.
+        success = False
 
-        mirrorProgressDialog.updateProgress(5, "Collecting module data...")
-        # time.sleep(0.1)  # Simulate a small delay
+        try:
+            with utils.sceneTransaction('mirrorModules'):
+                self.mirrorModulesPhases(mirrorProgressDialog)
 
+            success = True
+        finally:
+            mirrorProgressDialog.finish(success)
 
-        blueprintsFolder = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Blueprint')
-
-        validModules = [module for module in utils.loadAllModulesFromDirectory(blueprintsFolder).keys()]
-        validModuleNames = [module['name'] for module in utils.loadAllModulesFromDirectory(blueprintsFolder).values()]
-
-        for module in self.moduleInfo:
-            moduleName = module[0].partition('__')[0]
-
-            if moduleName in validModuleNames:
-                index = validModuleNames.index(moduleName)
-                module.append(validModules[index])
-
-        mirrorModulesProgress_increment = phase1_proportion / len(self.moduleInfo)
-
-        for module in self.moduleInfo:
-
-            userSpecifiedName = module[0].partition('__')[2]
-
-            mod = importlib.import_module(f'Blueprint.{module[5]}')
-            importlib.reload(mod)
-
-            moduleClass = getattr(mod, mod.CLASS_NAME)
-            moduleInstance = moduleClass(userSpecifiedName, None)
-
-            hookObject = moduleInstance.findHookObject()
-            newHookObject = None
-
-            hookModule = utils.stripLeadingNamespace(hookObject)[0]
-
-            hookFound = False
-
-            for m in self.moduleInfo:
-
-                if hookModule == m[0]:
-                    hookFound = True
-
-                    if m == module:
-                        continue
-
-                    hookObjectName = utils.stripLeadingNamespace(hookObject)[1]
-                    newHookObject = f'{m[1]}:{hookObjectName}'
-
-            if not hookFound:
-                newHookObject = hookObject
-
-            module.append(newHookObject)
-
-            hookConstrained = moduleInstance.isRootConstrained()
-            module.append(hookConstrained)
-
-            mirrorModulesProgress += mirrorModulesProgress_increment
-            progressMessage = f"Mirroring Phase 1: {module[0]}"
-            mirrorProgressDialog.updateProgress(mirrorModulesProgress, progressMessage)
-            # time.sleep(0.1)
-
-        mirrorModulesProgress_increment = phase2_proportion / len(self.moduleInfo)
-
-        for module in self.moduleInfo:
-            newUserSpecifiedName = module[1].partition('__')[2]
-            mod = importlib.import_module(f'Blueprint.{module[5]}')
-            importlib.reload(mod)
-
-            moduleClass = getattr(mod, mod.CLASS_NAME)
-            moduleInstance = moduleClass(newUserSpecifiedName, None)
-            moduleInstance.mirror(module[0], module[2], module[3], module[4])
+    def mirrorModulesPhases(self, mirrorProgressDialog):
+        # The plan was validated and computed in accept(), the phases here only apply it.
+        phaseProportions = {'install': 70, 'rehook': 20}
+        phaseNames = {'install': 'Installing Mirrored Modules', 'rehook': 'Rehooking Mirrored Modules'}
+        currentPhase = []
 
-            mirrorModulesProgress += mirrorModulesProgress_increment
+        def progress(phase, moduleName):
+            if currentPhase != [phase]:
+                currentPhase[:] = [phase]
+                mirrorProgressDialog.beginPhase(phaseNames[phase], phaseProportions[phase], len(self.plan.records))
 
-            progressMessage = f"Mirroring Phase 2: {module[0]}"
-            mirrorProgressDialog.updateProgress(mirrorModulesProgress, progressMessage)
-            time.sleep(0.1)
+            mirrorProgressDialog.step(moduleName)
 
-        mirrorModulesProgress_increment = phase3_proportion / len(self.moduleInfo)
-
-        for module in self.moduleInfo:
-            newUserSpecifiedName = module[1].partition('__')[2]
-            mod = importlib.import_module(f'Blueprint.{module[5]}')
-            importlib.reload(mod)
-
-            moduleClass = getattr(mod, mod.CLASS_NAME)
-            moduleInstance = moduleClass(newUserSpecifiedName, None)
-
-            moduleInstance.rehook(module[6])
-
-            hookConstrained = module[7]
-            if hookConstrained:
-                moduleInstance.constrainRootToHook()
-
-            mirrorModulesProgress += mirrorModulesProgress_increment
-            progressMessage = f"Mirroring Phase 3: {module[0]}"
-            mirrorProgressDialog.updateProgress(mirrorModulesProgress, progressMessage)
-            time.sleep(0.1)
+        mirrorPlanner.executeMirror(self.plan, progress)
 
         if self.group:
-            cmds.lockNode('Group_container', lock = False, lockUnpublished = False)
+            mirrorProgressDialog.beginPhase('Mirroring Group', 10, 1)
 
             groupParent = cmds.listRelatives(self.group, parent = True)
 
-
             if groupParent:
                 groupParent = groupParent[0]
 
-            self.processGroup(self.group, groupParent)
-
-            cmds.lockNode('Group_container', lock = True, lockUnpublished = True)
+            with utils.unlockedContainers('Group_container'):
+                self.processGroup(self.group, groupParent)
 
             cmds.select(clear = True)
 
-        mirrorProgressDialog.updateProgress(100, "Mirroring complete!")
-        time.sleep(1)  # Give user time to read "complete"
-        mirrorProgressDialog.close()
+            mirrorProgressDialog.step(self.group)
 
     def generateMirrorFunctionControls(self, parentLayout, moduleName):
         """
@@ -476,64 +491,44 @@ class MirrorModule(QtWidgets.QDialog):
 
 
     def processGroup(self, group, parent):
-        import System.groupSelected as groupSelected
-        importlib.reload(groupSelected)
-
-        tempGroup = cmds.duplicate(group, parentOnly = True, inputConnections = True)[0]
-        emptyGroup = cmds.group(empty = True)
-
-        cmds.parent(tempGroup, emptyGroup, absolute = True)
-        scaleAxis = 'scaleX'
+        """
+        Mirrors a group and all groups nested in it, links each group to its mirror and moves the mirrored modules into the mirrored groups.
 
-        if self.mirrorPlane == 'XZ':
-            scaleAxis = 'scaleY'
+        Args:
+            group (str): The top group being mirrored.
+            parent (str or None): Parent of the mirrored top group.
+        """
+        import System.groupSelected as groupSelected
+        utils.reloadModule(groupSelected)
 
-        elif self.mirrorPlane == 'XY':
-            scaleAxis = 'scaleZ'
+        mirroredGroups = groupSelected.mirrorGroupHierarchy(group, self.mirrorPlane, parent)
+        mirrorAxis = mirrorPlanner.MIRROR_AXES[self.mirrorPlane]
 
-        cmds.setAttr(f'{emptyGroup}.{scaleAxis}', -1)
+        with utils.unlockedContainers('Group_container'):
+            for originalGroup, mirroredGroup in mirroredGroups.items():
+                for linkedGroup, link in ((originalGroup, mirroredGroup), (mirroredGroup, originalGroup)):
+                    cmds.addAttr(linkedGroup, dataType = 'string', longName = 'mirrorLinks', keyable = False)
+                    cmds.setAttr(f'{linkedGroup}.mirrorLinks', f'{link}__{mirrorAxis}', type = 'string')
 
-        instance = groupSelected.GroupSelectedDialog()
-        groupSuffix = group.partition('__')[2]
-        newGroup = instance.createGroupAtSpecified(f'{groupSuffix}_mirror', tempGroup, parent)
+        # {mirroredGroup: [mirrored module transforms]} for every mirrored module sitting in a mirrored group.
+        moduleTransforms = {}
 
-        cmds.lockNode('Group_container', lock = False, lockUnpublished = False)
-        cmds.delete(emptyGroup)
+        for originalGroup, mirroredGroup in mirroredGroups.items():
+            for child in cmds.listRelatives(originalGroup, children = True, type = 'transform') or []:
+                childNamespaces = utils.stripAllNamespaces(child)
+                record = self.plan.byOriginal.get(childNamespaces[0]) if childNamespaces and childNamespaces[1] == 'module_transform' else None
 
-        for moduleLink in ((group, newGroup), (newGroup, group)):
-            attributeValue = f'{moduleLink[1]}__'
+                if record:
+                    moduleTransforms.setdefault(mirroredGroup, []).append(f'{record.mirroredModule}:module_transform')
 
-            if self.mirrorPlane == 'YZ':
-                attributeValue += 'X'
-            elif self.mirrorPlane == 'XZ':
-                attributeValue += 'Y'
-            elif self.mirrorPlane == 'XY':
-                attributeValue += 'Z'
+        moduleContainers = [f'{transform.partition(":")[0]}:module_container' for transforms in moduleTransforms.values() for transform in transforms]
 
-            cmds.addAttr(moduleLink[0], dataType = 'string', longName = 'mirrorLinks', keyable = False)
-            cmds.setAttr(f'{moduleLink[0]}.mirrorLinks', attributeValue, type = 'string')
+        with utils.unlockedContainers(moduleContainers, 'Group_container'):
+            for mirroredGroup, transforms in moduleTransforms.items():
+                cmds.parent(transforms, mirroredGroup, absolute = True)
 
         cmds.select(clear = True)
 
-        children = cmds.listRelatives(group, children = True, type = 'transform')
-
-        for child in children:
-            if child.find('Group__') == 0:
-                self.processGroup(child, newGroup)
-
-            else:
-                childNamespaces = utils.stripAllNamespaces(child)
-                if childNamespaces and childNamespaces[1] == 'module_transform':
-                    for module in self.moduleInfo:
-                        if childNamespaces[0] == module[0]:
-                            moduleContainer = f'{module[1]}:module_container'
-                            cmds.lockNode(moduleContainer, lock = False, lockUnpublished = False)
-
-                            moduleTransform = f'{module[1]}:module_transform'
-                            cmds.parent(moduleTransform, newGroup, absolute = True)
-
-                            cmds.lockNode(moduleContainer, lock = True, lockUnpublished = True)
-
 
 
 
@@ -0,0 +1,251 @@
+"""
+Mirror Planner
+
+Plans a blueprint mirror before anything in the scene is changed:
+    - validates the mirrored names against the scene index and against each other,
+    - validates the names of the mirrored groups when a group is mirrored with its modules,
+    - remaps hooks onto mirrored modules through a dictionary,
+    - collects the (source, target) control pairs of every mirrored module,
+    - creates one blueprint instance per mirrored module, reused through execution.
+
+`planMirror()` returns a `MirrorPlan` whose `report()` is the dry run. `executeMirror()` applies a
+valid plan: install every mirrored module, mirror all control positions in one `MirrorEngine` pass, then rehook.
+"""
+
+import importlib
+import os
+import re
+from typing import NamedTuple, Optional
+
+import maya.cmds as cmds
+
+import System.utils as utils
+import System.sceneIndex as sceneIndex
+import System.mirrorEngine as mirrorEngine
+import System.groupSelected as groupSelected
+
+
+BLUEPRINT_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Blueprint')
+
+_VALID_NAME = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+# mirrorLinks axis letter for each mirror plane.
+MIRROR_AXES = {'YZ': 'X', 'XZ': 'Y', 'XY': 'Z'}
+
+
+class MirrorRequest(NamedTuple):
+    """One module to mirror, as chosen in the mirror dialog."""
+    originalModule: str  # Namespace of the module to mirror, e.g. 'SingleJointSegment__instance_1'
+    mirroredName: str  # User specified name of the mirrored module
+    mirrorPlane: str  # 'YZ', 'XZ' or 'XY'
+    translationFunction: str  # 'Mirrored' or 'World Space'
+    rotationFunction: str  # 'Behavior' or 'Orientation'
+
+
+class MirrorRecord(NamedTuple):
+    """The planned mirror of one module."""
+    originalModule: str
+    mirroredModule: str
+    moduleFile: str
+    mirrorPlane: str
+    translationFunction: str
+    rotationFunction: str
+    hookObject: Optional[str]  # Hook of the mirrored module, already remapped, None if unhooked
+    hookConstrained: bool
+    pairs: tuple  # (source, target) translation controls and pole vector locators, original to mirrored module
+
+
+class MirrorPlan:
+    """
+    The validated result of `planMirror()`.
+
+    Attributes:
+        records (list[MirrorRecord]): One record per mirrored module, in request order.
+        byOriginal (dict): {originalModule: MirrorRecord}
+        instances (dict): {mirroredModule: blueprint instance} used for every execution phase.
+        groupNames (dict): {originalGroup: mirroredGroup} of the mirrored group tree, empty if no group is mirrored.
+        errors (list[str]): Validation errors. A plan with errors cannot be executed.
+    """
+
+    def __init__(self):
+        self.records = []
+        self.byOriginal = {}
+        self.instances = {}
+        self.groupNames = {}
+        self.errors = []
+
+    @property
+    def isValid(self):
+        return not self.errors and bool(self.records)
+
+    def report(self):
+        """
+        Returns a readable summary of the plan, the dry run of a mirror.
+        """
+        lines = []
+
+        for record in self.records:
+            hook = record.hookObject or 'unhooked'
+            constrained = ', root constrained' if record.hookConstrained else ''
+            lines.append(f'{record.originalModule} -> {record.mirroredModule} ({record.mirrorPlane}, {record.translationFunction}, {record.rotationFunction})')
+            lines.append(f'    hook: {hook}{constrained}, {len(record.pairs)} controls')
+
+        for group, mirroredGroup in self.groupNames.items():
+            lines.append(f'{group} -> {mirroredGroup}')
+
+        if self.errors:
+            lines.append('Errors:')
+            lines.extend(f'    {error}' for error in self.errors)
+
+        return '\n'.join(lines)
+
+
+def _remapNode(node, namespaceMap):
+    """
+    Moves a node into the mirrored namespace if its module is mirrored too, e.g. 'A__arm:wrist' -> 'A__arm_mirror:wrist'.
+    """
+    namespace, _, name = node.partition(':')
+
+    if namespace in namespaceMap:
+        return f'{namespaceMap[namespace]}:{name}'
+
+    return node
+
+
+def planMirror(requests, group = None, blueprintDirectory = BLUEPRINT_DIRECTORY):
+    """
+    Validates mirror requests and computes everything the mirror needs, reading the scene but not changing it.
+
+    Args:
+        requests (list[MirrorRequest]): The modules to mirror.
+        group (str, optional): Top group mirrored along with the modules. Its mirrored group names are checked here,
+                               so a mirror is never installed when its groups cannot be created.
+        blueprintDirectory (str): Directory of the blueprint module files.
+
+    Returns:
+        MirrorPlan: The plan, check `isValid` and `errors` before executing it.
+    """
+    plan = MirrorPlan()
+    index = sceneIndex.getSceneIndex()
+    loadedModules = utils.loadAllModulesFromDirectory(blueprintDirectory, importModules = False)
+
+    namespaceMap = {}  # {originalModule: mirroredModule}
+    plannedNames = set()
+    validRequests = []
+
+    if group:
+        plan.groupNames, existingGroups = groupSelected.getMirroredGroupNames(group)
+        plan.errors.extend(f'Group {name} already exists.' for name in existingGroups)
+
+    for request in requests:
+        moduleType = request.originalModule.partition('__')[0]
+        moduleFile = loadedModules.fileNameForClass(moduleType)
+
+        if not index.getRecord(request.originalModule):
+            plan.errors.append(f'Module {request.originalModule} does not exist.')
+            continue
+
+        if not moduleFile:
+            plan.errors.append(f'No blueprint file found for module type {moduleType}.')
+            continue
+
+        if not _VALID_NAME.match(request.mirroredName):
+            plan.errors.append(f'Name "{request.mirroredName}" is not a valid module name.')
+            continue
+
+        if index.hasUserSpecifiedName(request.mirroredName):
+            plan.errors.append(f'Name {request.mirroredName} already exists.')
+            continue
+
+        if request.mirroredName in plannedNames:
+            plan.errors.append(f'Name {request.mirroredName} is used more than once.')
+            continue
+
+        if request.mirrorPlane not in MIRROR_AXES:
+            plan.errors.append(f'Unknown mirror plane {request.mirrorPlane}.')
+            continue
+
+        plannedNames.add(request.mirroredName)
+        namespaceMap[request.originalModule] = f'{moduleType}__{request.mirroredName}'
+        validRequests.append((request, moduleFile))
+
+    if plan.errors:
+        return plan
+
+    # One instance per mirrored module. It knows the module's joints before the module exists.
+    modulePairs = []
+    for request, moduleFile in validRequests:
+        mod = importlib.import_module(f'Blueprint.{moduleFile}')
+        mod = utils.reloadModule(mod)
+
+        moduleInstance = getattr(mod, mod.CLASS_NAME)(request.mirroredName, None)
+        plan.instances[moduleInstance.moduleNamespace] = moduleInstance
+
+        modulePairs.append(moduleInstance.getMirrorPairs(request.originalModule))
+
+    for (request, moduleFile), pairs in zip(validRequests, modulePairs):
+        mirroredModule = namespaceMap[request.originalModule]
+        moduleInstance = plan.instances[mirroredModule]
+
+        # The original module's hook, moved onto the mirrored module when that module is mirrored as well.
+        hookObject = index.getRecord(request.originalModule).hook
+        if hookObject:
+            hookObject = _remapNode(hookObject, namespaceMap)
+
+        rootControl = moduleInstance.getTranslationControl(f'{request.originalModule}:{moduleInstance.jointInfo[0][0]}')
+
+        record = MirrorRecord(
+            originalModule = request.originalModule,
+            mirroredModule = mirroredModule,
+            moduleFile = moduleFile,
+            mirrorPlane = request.mirrorPlane,
+            translationFunction = request.translationFunction,
+            rotationFunction = request.rotationFunction,
+            hookObject = hookObject,
+            hookConstrained = cmds.objExists(f'{rootControl}_hookConstraint'),
+            pairs = tuple(pairs),
+        )
+
+        plan.records.append(record)
+        plan.byOriginal[record.originalModule] = record
+
+    return plan
+
+
+def executeMirror(plan, progress = None):
+    """
+    Applies a valid plan: installs all mirrored modules, mirrors every control position in one engine pass, then rehooks.
+
+    Args:
+        plan (MirrorPlan): A plan returned by `planMirror()`.
+        progress (callable, optional): Called with (phaseName, moduleName) after each module of each phase.
+    """
+    if not plan.isValid:
+        raise ValueError(f'Cannot execute an invalid mirror plan:\n{plan.report()}')
+
+    def reportProgress(phase, record):
+        if progress:
+            progress(phase, record.originalModule)
+
+    # Every module queues its control pairs, all positions are read, reflected and written together once they are installed.
+    engine = mirrorEngine.MirrorEngine()
+
+    for record in plan.records:
+        plan.instances[record.mirroredModule].mirror(record.originalModule, record.mirrorPlane, record.translationFunction, record.rotationFunction, engine = engine)
+        reportProgress('install', record)
+
+    mirroredContainers = [f'{record.mirroredModule}:module_container' for record in plan.records]
+
+    with utils.unlockedContainers(mirroredContainers):
+        engine.run()
+
+    # Unlock every container touched by the rehook phase once, instead of toggling it per rehook and constraint.
+    with utils.unlockedContainers(mirroredContainers):
+        for record in plan.records:
+            moduleInstance = plan.instances[record.mirroredModule]
+            moduleInstance.rehook(record.hookObject)
+
+            if record.hookConstrained:
+                moduleInstance.constrainRootToHook()
+
+            reportProgress('rehook', record)
@@ -0,0 +1,102 @@
+"""
+Batch Installation of Blueprint Modules
+
+This module installs many blueprint module instances in one pass without going through the
+Blueprint UI, e.g. to build a full biped from a script. All installs share a single undo chunk,
+viewport refresh is suspended while they run, and module classes are imported once per module type.
+"""
+
+import os
+
+import maya.cmds as cmds
+
+import System.utils as utils
+import System.sceneIndex as sceneIndex
+
+utils.reloadModule(utils)
+
+BLUEPRINT_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Blueprint')
+DEFAULT_BASE_NAME = 'instance_'
+
+
+def installModules(records, modulesDir = None):
+    """
+    Installs a list of blueprint modules in one undoable step.
+
+    Records are installed in order, so a record may hook to a translation control of a module
+    installed earlier in the same list.
+
+    Args:
+        records (list[tuple]): (moduleType, userSpecifiedName, jointPositions, hookObject) per module.
+            moduleType is the blueprint class name (e.g. 'SingleJointSegment').
+            userSpecifiedName may be None to allocate the next free 'instance_N' name.
+            jointPositions may be None to keep the module defaults, or a list of world positions, one per joint.
+            hookObject may be None or the name of a translation control.
+        modulesDir (str, optional): Directory containing the blueprint module files. Defaults to Modules/Blueprint.
+
+    Returns:
+        list[Blueprint]: The installed module instances, in record order.
+
+    Raises:
+        ValueError: If a module type is unknown or a user specified name is already taken.
+    """
+
+    index = sceneIndex.getSceneIndex()
+
+    if modulesDir is None:
+        modulesDir = BLUEPRINT_DIRECTORY
+
+    loadedModules = utils.loadAllModulesFromDirectory(modulesDir, importModules = False)
+
+    # Validate everything up front so a bad record does not leave a half built rig behind.
+    moduleClasses = {}
+    requestedNames = set()
+
+    for moduleType, userSpecifiedName, jointPositions, hookObject in records:
+        if moduleType not in moduleClasses:
+            moduleFile = loadedModules.fileNameForClass(moduleType)
+            moduleObject = utils.importBlueprintModule(modulesDir, moduleFile) if moduleFile else None
+
+            if not moduleObject or not hasattr(moduleObject, moduleType):
+                raise ValueError(f'Unknown blueprint module type: {moduleType}')
+
+            moduleClasses[moduleType] = getattr(moduleObject, moduleType)
+
+        if userSpecifiedName is not None:
+            if userSpecifiedName in requestedNames or index.hasUserSpecifiedName(userSpecifiedName):
+                raise ValueError(f'Name {userSpecifiedName} already exists.')
+
+            requestedNames.add(userSpecifiedName)
+
+    unnamedCount = sum(1 for record in records if record[1] is None)
+    allocatedNames = index.reserveUserSpecifiedNames(DEFAULT_BASE_NAME, unnamedCount)
+    unusedNames = iter(allocatedNames)
+
+    try:
+        # Creating the instances only sets up their joint info, so positions are checked before anything is built.
+        moduleInstances = []
+
+        for moduleType, userSpecifiedName, jointPositions, hookObject in records:
+            if userSpecifiedName is None:
+                userSpecifiedName = next(unusedNames)
+
+            moduleInstance = moduleClasses[moduleType](userSpecifiedName, hookObject)
+
+            if jointPositions is not None:
+                if len(jointPositions) != len(moduleInstance.jointInfo):
+                    raise ValueError(f'{moduleType} expects {len(moduleInstance.jointInfo)} joint positions, got {len(jointPositions)}.')
+
+                for jointInfo, position in zip(moduleInstance.jointInfo, jointPositions):
+                    jointInfo[1] = list(position)
+
+            moduleInstances.append(moduleInstance)
+
+        with utils.sceneTransaction('installModules'):
+            for moduleInstance in moduleInstances:
+                moduleInstance.install()
+
+    finally:
+        index.releaseUserSpecifiedNames(allocatedNames)
+        cmds.namespace(setNamespace = ':')
+
+    return moduleInstances
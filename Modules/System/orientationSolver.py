@@ -0,0 +1,308 @@
+"""
+Joint Orientation Solver
+
+Computes joint orients with NumPy instead of orienting joints in the scene:
+    - the joint orient a blueprint joint gets when it is locked, directly from world matrices,
+      without duplicating joints or calling makeIdentity;
+    - the aim/up joint orients of a whole chain (`computeChainOrients`), so a chain can be created
+      with its orients already set instead of calling `joint -edit -orientJoint` per joint.
+
+For a joint J under a clean parent P, with the orientation control rotated by rx about X, the lock
+result is the rotation of J relative to P, pre-multiplied by the control's X rotation (row vectors,
+as in Maya):
+
+    jointOrient = Rx(rx) * rotation(J.worldMatrix) * inverse(rotation(P.worldMatrix))
+
+decomposed into XYZ euler angles. All lock requests are collected in an `OrientationBatch`
+and solved together as one NumPy batch.
+"""
+
+import numpy as np
+
+import maya.api.OpenMaya as om
+
+
+# Stack of the active batches, innermost last.
+_activeBatches = []
+
+
+def _rotationParts(matrices):
+    """
+    Returns the rotation of a stack of 4x4 matrices, with scale removed from each row.
+    """
+    rotations = matrices[:, :3, :3]
+    lengths = np.linalg.norm(rotations, axis = 2, keepdims = True)
+
+    return rotations / np.where(lengths > 1e-12, lengths, 1.0)
+
+
+def computeJointOrients(jointMatrices, parentMatrices, rotateX):
+    """
+    Computes the XYZ joint orients, in degrees, of a batch of joints.
+
+    Args:
+        jointMatrices (array-like): (N, 4, 4) world matrices of the joints.
+        parentMatrices (array-like): (N, 4, 4) world matrices of the parents the orients are relative to.
+        rotateX (array-like): (N,) rotation about the joint's X axis, in radians.
+
+    Returns:
+        numpy.ndarray: (N, 3) joint orient values in degrees.
+    """
+    jointRotations = _rotationParts(np.asarray(jointMatrices, dtype = np.float64).reshape(-1, 4, 4))
+    parentRotations = _rotationParts(np.asarray(parentMatrices, dtype = np.float64).reshape(-1, 4, 4))
+    rotateX = np.asarray(rotateX, dtype = np.float64).reshape(-1)
+
+    cosX = np.cos(rotateX)
+    sinX = np.sin(rotateX)
+
+    twist = np.zeros((len(rotateX), 3, 3))
+    twist[:, 0, 0] = 1.0
+    twist[:, 1, 1] = cosX
+    twist[:, 1, 2] = sinX
+    twist[:, 2, 1] = -sinX
+    twist[:, 2, 2] = cosX
+
+    # The inverse of a rotation is its transpose.
+    return rotationsToEulerXYZ(twist @ jointRotations @ np.transpose(parentRotations, (0, 2, 1)))
+
+
+def rotationsToEulerXYZ(rotations):
+    """
+    Decomposes a stack of (N, 3, 3) row-vector rotation matrices into XYZ euler angles in degrees,
+    the rotation order of jointOrient.
+    """
+    # Row-vector XYZ decomposition: M = Rx(a) * Ry(b) * Rz(c).
+    sinY = np.clip(-rotations[:, 0, 2], -1.0, 1.0)
+    angleY = np.arcsin(sinY)
+
+    gimbal = np.abs(sinY) > 1.0 - 1e-9
+    angleX = np.where(gimbal, np.arctan2(-rotations[:, 2, 1], rotations[:, 1, 1]), np.arctan2(rotations[:, 1, 2], rotations[:, 2, 2]))
+    angleZ = np.where(gimbal, 0.0, np.arctan2(rotations[:, 0, 1], rotations[:, 0, 0]))
+
+    return np.degrees(np.stack([angleX, angleY, angleZ], axis = 1))
+
+
+_AXIS_INDICES = {'x': 0, 'y': 1, 'z': 2}
+_CYCLIC_AXIS_PAIRS = {('x', 'y'), ('y', 'z'), ('z', 'x')}
+
+
+def _secondaryAxisDirection(secondaryAxisOrient):
+    """
+    Returns the world direction of a secondaryAxisOrient value such as 'yup' or 'zdown'. 'none' is treated as 'yup'.
+    """
+    if not secondaryAxisOrient or secondaryAxisOrient == 'none':
+        secondaryAxisOrient = 'yup'
+
+    direction = np.zeros(3)
+    direction[_AXIS_INDICES[secondaryAxisOrient[0]]] = -1.0 if secondaryAxisOrient.endswith('down') else 1.0
+
+    return direction
+
+
+def computeChainWorldRotations(positions, orientJoint = 'xyz', secondaryAxisOrient = 'yup'):
+    """
+    Computes the world rotations of the joints of a chain, like `joint -edit -orientJoint -secondaryAxisOrient`.
+
+    The first axis of orientJoint aims at the next joint, the second points as close as possible to the
+    secondaryAxisOrient world direction and the third completes a right-handed frame. The last joint
+    takes the rotation of the joint before it.
+
+    Args:
+        positions (array-like): (N, 3) world positions of the chain, root first.
+        orientJoint (str): Axis order, e.g. 'xyz' or 'yzx'.
+        secondaryAxisOrient (str): World direction of the second axis, e.g. 'yup' or 'zdown'.
+
+    Returns:
+        numpy.ndarray: (N, 3, 3) row-vector world rotations.
+    """
+    positions = np.asarray(positions, dtype = np.float64).reshape(-1, 3)
+    count = len(positions)
+
+    if count < 2:
+        return np.tile(np.identity(3), (count, 1, 1))
+
+    aims = positions[1:] - positions[:-1]
+    aims /= np.maximum(np.linalg.norm(aims, axis = 1, keepdims = True), 1e-12)
+
+    up = _secondaryAxisDirection(secondaryAxisOrient)
+    secondary = up - (aims @ up)[:, None] * aims
+
+    # Bones parallel to the up direction turn about the world axis least aligned with them (Z first on ties),
+    # e.g. a bone straight up along +Y gets an orient of (0, 0, 90).
+    degenerate = np.linalg.norm(secondary, axis = 1) < 1e-6
+    if np.any(degenerate):
+        fallback = np.identity(3)[2 - np.argmin(np.abs(aims[degenerate])[:, ::-1], axis = 1)]
+        secondary[degenerate] = np.cross(fallback, aims[degenerate])
+
+    secondary /= np.linalg.norm(secondary, axis = 1, keepdims = True)
+
+    primaryAxis, secondaryAxis, tertiaryAxis = orientJoint[0], orientJoint[1], orientJoint[2]
+    tertiary = np.cross(aims, secondary) if (primaryAxis, secondaryAxis) in _CYCLIC_AXIS_PAIRS else np.cross(secondary, aims)
+
+    rotations = np.empty((count, 3, 3))
+    rotations[:-1, _AXIS_INDICES[primaryAxis]] = aims
+    rotations[:-1, _AXIS_INDICES[secondaryAxis]] = secondary
+    rotations[:-1, _AXIS_INDICES[tertiaryAxis]] = tertiary
+    rotations[-1] = rotations[-2]
+
+    return rotations
+
+
+def computeChainOrients(positions, axisInfo = ('xyz', 'yup'), parentRotation = None):
+    """
+    Computes the joint orients, in degrees, of a chain so it can be created with `cmds.joint(orientation = ...)`.
+
+    Args:
+        positions (array-like): (N, 3) world positions of the chain, root first.
+        axisInfo (tuple or list): One (orientJoint, secondaryAxisOrient) pair for the whole chain, or a list with
+                                  one pair per joint. Joints without a pair keep the orientation of their parent.
+        parentRotation (array-like, optional): (3, 3) world rotation of the root's parent. Defaults to the identity.
+
+    Returns:
+        numpy.ndarray: (N, 3) joint orients in degrees.
+    """
+    positions = np.asarray(positions, dtype = np.float64).reshape(-1, 3)
+    count = len(positions)
+
+    if axisInfo and isinstance(axisInfo[0], str):
+        axisInfo = [axisInfo] * max(count - 1, 0)
+
+    parentRotation = np.identity(3) if parentRotation is None else np.asarray(parentRotation, dtype = np.float64)
+    worldRotations = np.tile(parentRotation, (count, 1, 1))
+
+    # Joints sharing an axis setting are solved together.
+    for orientJoint, secondaryAxisOrient in set(tuple(info) for info in axisInfo[:count - 1]):
+        chainRotations = computeChainWorldRotations(positions, orientJoint, secondaryAxisOrient)
+        mask = np.array([index < len(axisInfo) and tuple(axisInfo[index]) == (orientJoint, secondaryAxisOrient) for index in range(count)])
+        worldRotations[mask] = chainRotations[mask]
+
+    # Joints without their own orientation follow their parent.
+    for index in range(1, count):
+        if index >= len(axisInfo) or index == count - 1:
+            worldRotations[index] = worldRotations[index - 1]
+
+    parentRotations = np.concatenate([parentRotation[None], worldRotations[:-1]])
+
+    return rotationsToEulerXYZ(worldRotations @ np.transpose(parentRotations, (0, 2, 1)))
+
+
+def _selectUnique(nodes):
+    """
+    Adds each distinct node once to a selection list (a selection list merges duplicates) and
+    returns the list with the selection index of every input node.
+    """
+    selection = om.MSelectionList()
+    selectionIndices = {}
+
+    for node in nodes:
+        if node and node not in selectionIndices:
+            selection.add(node)
+            selectionIndices[node] = len(selectionIndices)
+
+    return selection, [selectionIndices.get(node) for node in nodes]
+
+
+def _readWorldMatrices(nodes):
+    """
+    Reads the world matrices of DAG nodes through one selection list. None entries give the identity.
+    """
+    selection, selectionIndices = _selectUnique(nodes)
+    uniqueMatrices = [np.array(list(selection.getDagPath(index).inclusiveMatrix())).reshape(4, 4) for index in range(selection.length())]
+
+    matrices = np.tile(np.identity(4), (len(nodes), 1, 1))
+
+    for index, selectionIndex in enumerate(selectionIndices):
+        if selectionIndex is not None:
+            matrices[index] = uniqueMatrices[selectionIndex]
+
+    return matrices
+
+
+def _readRotateX(nodes):
+    """
+    Reads rotateX, in radians, of several nodes through one selection list.
+    """
+    selection, selectionIndices = _selectUnique(nodes)
+    uniqueValues = [om.MFnDependencyNode(selection.getDependNode(index)).findPlug('rotateX', False).asDouble() for index in range(selection.length())]
+
+    return np.array([uniqueValues[selectionIndex] for selectionIndex in selectionIndices])
+
+
+class OrientationBatch:
+    """
+    Collects joint orientation requests and solves them in one vectorized pass.
+
+    While a batch is active (used as a context manager), `getJointOrientation` returns a
+    three-element list that is filled in when the batch is solved on exit.
+
+    Example:
+        with orientationSolver.OrientationBatch():
+            moduleInfos = [module.lockPhase1() for module in modules]
+        # Every orientation in moduleInfos holds its solved values here.
+    """
+
+    def __init__(self):
+        self.requests = []  # [(joint, parent, orientationControl, result)]
+
+    def add(self, joint, parent, orientationControl):
+        """
+        Adds a request and returns the list the (x, y, z) joint orient is written into by `solve()`.
+        """
+        result = [0.0, 0.0, 0.0]
+        self.requests.append((joint, parent, orientationControl, result))
+
+        return result
+
+    def solve(self):
+        if not self.requests:
+            return
+
+        joints, parents, orientationControls, results = zip(*self.requests)
+
+        orients = computeJointOrients(_readWorldMatrices(joints), _readWorldMatrices(parents), _readRotateX(orientationControls))
+
+        for result, orient in zip(results, orients.tolist()):
+            result[:] = orient
+
+        self.requests = []
+
+    def __enter__(self):
+        _activeBatches.append(self)
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        _activeBatches.remove(self)
+
+        if excType is None:
+            self.solve()
+
+        return False
+
+
+def getActiveBatch():
+    """
+    Returns the innermost active `OrientationBatch`, or None.
+    """
+    return _activeBatches[-1] if _activeBatches else None
+
+
+def getJointOrientation(joint, parent, orientationControl):
+    """
+    Returns the joint orient `joint` gets under `parent` with the X rotation of `orientationControl` applied.
+
+    Inside an active `OrientationBatch` the returned list is filled when the batch is solved;
+    otherwise the request is solved right away.
+
+    Returns:
+        list[float]: The (x, y, z) joint orient in degrees.
+    """
+    batch = getActiveBatch()
+
+    if batch:
+        return batch.add(joint, parent, orientationControl)
+
+    batch = OrientationBatch()
+    result = batch.add(joint, parent, orientationControl)
+    batch.solve()
+
+    return result
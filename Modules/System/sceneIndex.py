@@ -0,0 +1,363 @@
+"""
+Scene Index of Installed Blueprint Modules
+
+This module keeps an index of the blueprint module namespaces in the current scene
+(`ModuleName__userSpecifiedName`), so lookups by namespace or user specified name do not
+have to list and parse every namespace in the scene. The index is built once and then kept
+current through Maya callbacks for namespace, node, parent and connection changes.
+"""
+
+import re
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+
+
+_TRAILING_NUMBER = re.compile(r'^(.*?)(\d+)$')
+
+
+def splitTrailingNumber(name):
+    """
+    Splits a name into its base name and trailing number, e.g. 'instance_12' -> ('instance_', 12).
+
+    Returns:
+        tuple[str, int or None]: The base name and the trailing number, or (name, None) if there is none.
+    """
+    match = _TRAILING_NUMBER.match(name)
+
+    if not match:
+        return name, None
+
+    return match.group(1), int(match.group(2))
+
+
+class ModuleRecord:
+    """
+    Index entry for one installed blueprint module.
+
+    The module type and user specified name are parsed from the namespace once. The hook,
+    group and mirror link are queried from the scene on first access and cached until the
+    scene index invalidates the record.
+    """
+
+    __slots__ = ('namespace', 'moduleType', 'userSpecifiedName', '_details')
+
+    def __init__(self, namespace):
+        self.namespace = namespace
+        self.moduleType, _, self.userSpecifiedName = namespace.partition('__')
+        self._details = None
+
+    def invalidate(self):
+        self._details = None
+
+    def _getDetails(self):
+        if self._details is None:
+            self._details = {
+                'hook': self._queryHook(),
+                'group': self._queryGroup(),
+                'mirrorLink': self._queryMirrorLink(),
+            }
+
+        return self._details
+
+    def _queryHook(self):
+        hookConstraint = f'{self.namespace}:hook_pointConstraint'
+
+        if not cmds.objExists(hookConstraint):
+            return None
+
+        sourceAttr = cmds.connectionInfo(f'{hookConstraint}.target[0].targetParentMatrix', sourceFromDestination = True)
+        sourceNode = str(sourceAttr).rpartition('.')[0]
+
+        if not sourceNode or sourceNode == f'{self.namespace}:unhookedTarget':
+            return None
+
+        return sourceNode
+
+    def _queryGroup(self):
+        moduleTransform = f'{self.namespace}:module_transform'
+
+        if not cmds.objExists(moduleTransform):
+            return None
+
+        parent = cmds.listRelatives(moduleTransform, parent = True)
+
+        if parent and parent[0].startswith('Group__'):
+            return parent[0]
+
+        return None
+
+    def _queryMirrorLink(self):
+        moduleGrp = f'{self.namespace}:module_grp'
+
+        if not cmds.objExists(moduleGrp) or not cmds.attributeQuery('mirrorLinks', node = moduleGrp, exists = True):
+            return None
+
+        return cmds.getAttr(f'{moduleGrp}.mirrorLinks')
+
+    @property
+    def hook(self):
+        """str or None: The hook object of the module, or None if the module is unhooked."""
+        return self._getDetails()['hook']
+
+    @property
+    def group(self):
+        """str or None: The Group__ transform the module transform is parented under."""
+        return self._getDetails()['group']
+
+    @property
+    def mirrorLink(self):
+        """str or None: The raw mirrorLinks value ('linkedNamespace__axis') of the module."""
+        return self._getDetails()['mirrorLink']
+
+
+class SceneIndex:
+    """
+    Maps blueprint module namespaces to their `ModuleRecord`.
+
+    Use `getSceneIndex()` to get the shared, callback-maintained instance.
+    """
+
+    def __init__(self):
+        self.records = {}  # {namespace: ModuleRecord}
+        self.userSpecifiedNameCounts = {}  # {userSpecifiedName: number of namespaces using it}
+        self.usedSuffixes = {}  # {baseName: {suffix: number of namespaces using it}}
+        self.highestSuffixes = {}  # {baseName: highest suffix in use}
+        self.reservedNames = set()  # Names handed out by reserveUserSpecifiedNames() and not installed yet
+        self.callbackIds = []
+        self.built = False
+
+    # BUILDING AND MAINTENANCE
+    def build(self):
+        """
+        Scans the root namespaces of the scene once and rebuilds all records.
+        """
+        self.records = {}
+        self.userSpecifiedNameCounts = {}
+        self.usedSuffixes = {}
+        self.highestSuffixes = {}
+
+        for namespace in cmds.namespaceInfo(':', listOnlyNamespaces = True) or []:
+            self._addNamespace(namespace)
+
+        self.built = True
+
+    def ensureBuilt(self):
+        if not self.built:
+            self.build()
+
+    def _addNamespace(self, namespace):
+        namespace = namespace.lstrip(':')
+
+        if ':' in namespace or '__' not in namespace or namespace in self.records:
+            return
+
+        record = ModuleRecord(namespace)
+        self.records[namespace] = record
+        self.userSpecifiedNameCounts[record.userSpecifiedName] = self.userSpecifiedNameCounts.get(record.userSpecifiedName, 0) + 1
+        self.reservedNames.discard(record.userSpecifiedName)
+
+        baseName, suffix = splitTrailingNumber(record.userSpecifiedName)
+
+        if suffix is not None:
+            suffixes = self.usedSuffixes.setdefault(baseName, {})
+            suffixes[suffix] = suffixes.get(suffix, 0) + 1
+            self.highestSuffixes[baseName] = max(self.highestSuffixes.get(baseName, 0), suffix)
+
+        return record
+
+    def _removeNamespace(self, namespace):
+        record = self.records.pop(namespace.lstrip(':'), None)
+
+        if not record:
+            return
+
+        count = self.userSpecifiedNameCounts.get(record.userSpecifiedName, 0) - 1
+
+        if count > 0:
+            self.userSpecifiedNameCounts[record.userSpecifiedName] = count
+        else:
+            self.userSpecifiedNameCounts.pop(record.userSpecifiedName, None)
+
+        baseName, suffix = splitTrailingNumber(record.userSpecifiedName)
+        suffixes = self.usedSuffixes.get(baseName)
+
+        if suffix is not None and suffixes and suffix in suffixes:
+            suffixes[suffix] -= 1
+
+            if suffixes[suffix] == 0:
+                del suffixes[suffix]
+
+                # Only the removal of the highest suffix moves the high-water mark back down.
+                if suffix == self.highestSuffixes.get(baseName):
+                    if suffixes:
+                        self.highestSuffixes[baseName] = max(suffixes)
+                    else:
+                        del self.usedSuffixes[baseName]
+                        del self.highestSuffixes[baseName]
+
+        return record
+
+    def invalidate(self, namespace = None):
+        """
+        Drops the cached hook, group and mirror link of one module, or of all modules if no namespace is given.
+        Call this after edits the callbacks do not see, such as adding or changing the mirrorLinks attribute.
+        """
+        if namespace is None:
+            for record in self.records.values():
+                record.invalidate()
+            return
+
+        record = self.records.get(namespace)
+        if record:
+            record.invalidate()
+
+    def _invalidateNodeName(self, nodeName):
+        namespace, sep, _ = nodeName.lstrip(':').partition(':')
+
+        if sep:
+            self.invalidate(namespace)
+
+    # CALLBACKS
+    def installCallbacks(self):
+        """
+        Registers the Maya callbacks that keep the index current. Safe to call more than once.
+        """
+        if self.callbackIds:
+            return
+
+        # The cached details only come from transforms (module_transform, module_grp, Group__ parents) and the
+        # hook pointConstraint, which is a transform too, so utility nodes created by the thousands never call back.
+        self.callbackIds = [
+            om.MNamespaceMessage.addNamespaceAddedCallback(self._namespaceAdded),
+            om.MNamespaceMessage.addNamespaceRemovedCallback(self._namespaceRemoved),
+            om.MDGMessage.addNodeAddedCallback(self._nodeChanged, 'transform'),
+            om.MDGMessage.addNodeRemovedCallback(self._nodeChanged, 'transform'),
+            om.MDGMessage.addConnectionCallback(self._connectionChanged),
+            om.MDagMessage.addParentAddedCallback(self._parentChanged),
+            om.MSceneMessage.addCallback(om.MSceneMessage.kAfterNew, self._sceneChanged),
+            om.MSceneMessage.addCallback(om.MSceneMessage.kAfterOpen, self._sceneChanged),
+            om.MSceneMessage.addCallback(om.MSceneMessage.kAfterImport, self._sceneChanged),
+        ]
+
+    def removeCallbacks(self):
+        if self.callbackIds:
+            om.MMessage.removeCallbacks(self.callbackIds)
+
+        self.callbackIds = []
+
+    def _namespaceAdded(self, namespace, *args):
+        if self.built:
+            self._addNamespace(namespace)
+
+    def _namespaceRemoved(self, namespace, *args):
+        if self.built:
+            self._removeNamespace(namespace)
+
+    def _nodeChanged(self, node, *args):
+        if self.built and self.records:
+            self._invalidateNodeName(om.MFnDependencyNode(node).name())
+
+    def _connectionChanged(self, sourcePlug, destinationPlug, made, *args):
+        # Only the hook pointConstraint's target connections matter, every other connection is skipped before its name is read.
+        if self.built and self.records and destinationPlug.node().hasFn(om.MFn.kPointConstraint):
+            self._invalidateNodeName(om.MFnDependencyNode(destinationPlug.node()).name())
+
+    def _parentChanged(self, child, parent, *args):
+        if self.built and self.records:
+            self._invalidateNodeName(om.MFnDependencyNode(child.node()).name())
+
+    def _sceneChanged(self, *args):
+        self.built = False
+        self.reservedNames = set()
+
+    # QUERIES
+    def getRecord(self, namespace):
+        """
+        Returns the `ModuleRecord` for a module namespace, or None if it is not installed.
+        """
+        self.ensureBuilt()
+        return self.records.get(namespace)
+
+    def getRecords(self):
+        """
+        Returns the records of all installed modules.
+        """
+        self.ensureBuilt()
+        return list(self.records.values())
+
+    def hasUserSpecifiedName(self, name):
+        """
+        Returns True if any installed module uses the given user specified name.
+        """
+        self.ensureBuilt()
+        return name in self.userSpecifiedNameCounts
+
+    def getUserSpecifiedNames(self):
+        self.ensureBuilt()
+        return list(self.userSpecifiedNameCounts)
+
+    # NAME ALLOCATION
+    def getHighestSuffix(self, baseName):
+        """
+        Returns the highest trailing number used by an installed module or a pending reservation with the given base name.
+        """
+        self.ensureBuilt()
+        highestSuffix = self.highestSuffixes.get(baseName, 0)
+
+        for name in self.reservedNames:
+            reservedBaseName, suffix = splitTrailingNumber(name)
+
+            if reservedBaseName == baseName and suffix is not None:
+                highestSuffix = max(highestSuffix, suffix)
+
+        return highestSuffix
+
+    def reserveUserSpecifiedNames(self, baseName, count = 1):
+        """
+        Hands out `count` unique user specified names (`baseName` + number) above the current high-water mark.
+
+        The names stay reserved until a module with that name is installed or they are released, so several
+        names can be handed out before any of the modules exist.
+
+        Args:
+            baseName (str): Base name prefix, e.g. 'instance_'.
+            count (int): Number of names to reserve.
+
+        Returns:
+            list[str]: The reserved names, in ascending order.
+        """
+        firstSuffix = self.getHighestSuffix(baseName) + 1
+        names = [f'{baseName}{suffix}' for suffix in range(firstSuffix, firstSuffix + count)]
+
+        self.reservedNames.update(names)
+
+        return names
+
+    def reserveUserSpecifiedName(self, baseName):
+        return self.reserveUserSpecifiedNames(baseName, 1)[0]
+
+    def releaseUserSpecifiedNames(self, names):
+        """
+        Returns reserved names that were not used, e.g. after a failed or cancelled install.
+        """
+        self.reservedNames.difference_update(names)
+
+
+# Shared instance, kept across importlib.reload so only one set of callbacks is registered.
+_sceneIndex = globals().get('_sceneIndex')
+
+
+def getSceneIndex():
+    """
+    Returns the shared scene index, building it and registering its callbacks on first use.
+    """
+    global _sceneIndex
+
+    if _sceneIndex is None:
+        _sceneIndex = SceneIndex()
+
+    _sceneIndex.installCallbacks()
+    _sceneIndex.ensureBuilt()
+
+    return _sceneIndex
@@ -1,8 +1,18 @@
+import ast
+import hashlib
 import os
 from dis import Positions
+from collections.abc import Mapping
+from contextlib import contextmanager
+from types import MappingProxyType
 
 import maya.cmds as cmds
+import maya.mel as mel
+import maya.api.OpenMaya as om
 import importlib
+import importlib.util
+
+import System.sceneIndex as sceneIndex
 
 
 def getPythonFiles(directory):
@@ -41,47 +51,301 @@ def importModuleFromPath(moduleName, filePath):
     spec.loader.exec_module(module)
     return module
 
-def loadAllModulesFromDirectory(directory):
+# Development mode reloads modules on every use so source edits are picked up immediately.
+# Production mode only reloads a module when the hash of its source file has changed.
+# The mode defaults to the RIGGING_TOOL_MODE environment variable and survives importlib.reload.
+_developmentMode = globals().get('_developmentMode', os.environ.get('RIGGING_TOOL_MODE', 'development').lower() != 'production')
+_sourceHashes = globals().get('_sourceHashes', {})  # {filePath: (fileStamp, sourceHash)}
+
+
+def setDevelopmentMode(enabled):
+    """
+    Switches between development mode (always reload) and production mode (reload only changed sources).
+
+    Args:
+        enabled (bool): True for development mode, False for production mode.
+    """
+    global _developmentMode
+    _developmentMode = bool(enabled)
+
+
+def isDevelopmentMode():
+    """
+    Returns True if modules are reloaded on every use, False in production mode.
+    """
+    return _developmentMode
+
+
+def _hashSourceFile(filePath):
+    with open(filePath, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def reloadModule(module):
+    """
+    Reloads a module according to the current mode.
+
+    In development mode the module is always reloaded. In production mode it is reloaded only
+    when its source hash differs from the one recorded at the last reload. The source is only
+    hashed when the file's mtime or size changed, so an unchanged module costs a single stat call.
+
+    Args:
+        module (module): The module to reload.
+
+    Returns:
+        module: The (possibly reloaded) module object.
+    """
+    filePath = getattr(module, '__file__', None)
+
+    if not filePath or not os.path.isfile(filePath):
+        return importlib.reload(module) if _developmentMode else module
+
+    fileStamp = getFileStamp(filePath)
+    cached = _sourceHashes.get(filePath)
+
+    if not _developmentMode:
+        if cached is None:
+            # First use in this session: the imported module is taken as current.
+            _sourceHashes[filePath] = (fileStamp, _hashSourceFile(filePath))
+            return module
+
+        if cached[0] == fileStamp:
+            return module
+
+        sourceHash = _hashSourceFile(filePath)
+        if sourceHash == cached[1]:
+            _sourceHashes[filePath] = (fileStamp, sourceHash)
+            return module
+
+    module = importlib.reload(module)
+    _sourceHashes[filePath] = (fileStamp, _hashSourceFile(filePath))
+
+    return module
+
+
+# Process-wide registry of loaded blueprint files. Kept across importlib.reload so the cache
+# survives the reload cascade: {(directory, importModules): (table, {fileName: (fileStamp, entry)})}
+_moduleRegistry = globals().get('_moduleRegistry', {})
+_importedModules = globals().get('_importedModules', {})  # {filePath: (fileStamp, module)}
+
+
+class ModuleTable(Mapping):
+    """
+    Immutable metadata table of the blueprint modules found in a directory.
+
+    Indexing the table directly uses the module file name (without .py extension),
+    `byClassName` indexes the same entries by their CLASS_NAME.
+    """
+
+    def __init__(self, entries):
+        self._byFileName = MappingProxyType(dict(entries))
+        self.byClassName = MappingProxyType({entry['name']: entry for entry in self._byFileName.values()})
+
+    def __getitem__(self, fileName):
+        return self._byFileName[fileName]
+
+    def __iter__(self):
+        return iter(self._byFileName)
+
+    def __len__(self):
+        return len(self._byFileName)
+
+    def fileNameForClass(self, className):
+        """
+        Returns the module file name that defines the given CLASS_NAME, or None if unknown.
+        """
+        entry = self.byClassName.get(className)
+        return entry['fileName'] if entry else None
+
+
+def getFileStamp(filePath):
+    """
+    Returns a (mtime, size) stamp used to detect modified files without reading them.
+    """
+    stat = os.stat(filePath)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+MODULE_METADATA_NAMES = ('CLASS_NAME', 'MODULE_DESCRIPTION', 'MODULE_ICON')
+
+
+def _evaluateStaticExpression(node, names):
+    """
+    Evaluates the small subset of expressions blueprint files use for their metadata constants:
+    literals, string concatenation, f-strings, previously assigned constants, os.environ lookups
+    and os.path helpers. Anything else raises ValueError.
+    """
+    if isinstance(node, ast.Constant):
+        return node.value
+
+    if isinstance(node, ast.Name):
+        if node.id in names:
+            return names[node.id]
+        raise ValueError(f'Unresolved name: {node.id}')
+
+    if isinstance(node, ast.JoinedStr):
+        return ''.join(str(_evaluateStaticExpression(value, names)) for value in node.values)
+
+    if isinstance(node, ast.FormattedValue):
+        return _evaluateStaticExpression(node.value, names)
+
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        return _evaluateStaticExpression(node.left, names) + _evaluateStaticExpression(node.right, names)
+
+    dottedName = ast.unparse(node.value if isinstance(node, ast.Subscript) else getattr(node, 'func', node))
+
+    if isinstance(node, ast.Subscript) and dottedName == 'os.environ':
+        return os.environ[_evaluateStaticExpression(node.slice, names)]
+
+    if isinstance(node, ast.Call) and not node.keywords:
+        functions = {
+            'os.path.join': os.path.join,
+            'os.path.dirname': os.path.dirname,
+            'os.path.abspath': os.path.abspath,
+            'os.path.normpath': os.path.normpath,
+            'os.environ.get': os.environ.get,
+            'os.getenv': os.getenv,
+        }
+
+        if dottedName in functions:
+            return functions[dottedName](*[_evaluateStaticExpression(arg, names) for arg in node.args])
+
+    raise ValueError(f'Unsupported expression: {ast.unparse(node)}')
+
+
+def readModuleMetadata(filePath):
+    """
+    Reads CLASS_NAME, MODULE_DESCRIPTION and MODULE_ICON from a blueprint file by parsing its AST,
+    without importing or executing it.
+
+    Args:
+        filePath (str): The full path to the Python file.
+
+    Returns:
+        dict: The metadata constants that could be resolved statically, keyed by constant name.
+    """
+    with open(filePath, 'r', encoding = 'utf-8') as f:
+        tree = ast.parse(f.read(), filename = filePath)
+
+    names = {'__file__': filePath}
+    metadata = {}
+
+    for statement in tree.body:
+        if not isinstance(statement, ast.Assign) or len(statement.targets) != 1 or not isinstance(statement.targets[0], ast.Name):
+            continue
+
+        name = statement.targets[0].id
+
+        try:
+            names[name] = _evaluateStaticExpression(statement.value, names)
+        except (ValueError, KeyError, TypeError):
+            continue
+
+        if name in MODULE_METADATA_NAMES:
+            metadata[name] = names[name]
+
+    return metadata
+
+
+def loadAllModulesFromDirectory(directory, importModules = True):
     """
     Loads all Python modules from the specified directory and returns their metadata.
     Each module is expected to potentially have CLASS_NAME, MODULE_DESCRIPTION, and MODULE_ICON attributes.
 
+    Files are only read the first time they are seen or when their mtime or size changed,
+    otherwise the cached entry from the process-wide registry is reused.
+
     Args:
         directory (str): Path to the directory containing Python files.
+        importModules (bool): If False, the metadata is read by parsing each file without executing it
+                              and 'module' is None until `importBlueprintModule` is called. Files whose
+                              CLASS_NAME cannot be resolved statically are still imported.
 
     Returns:
-        dict: A dictionary where keys are module filenames (without .py extension)
-              and values are dictionaries containing:
-              - 'module': The imported module object.
+        ModuleTable: A read-only mapping where keys are module filenames (without .py extension)
+              and values are read-only dictionaries containing:
+              - 'module': The imported module object, or None if it was not imported.
               - 'name': The CLASS_NAME attribute from the module, or the filename if not found.
               - 'description': The MODULE_DESCRIPTION attribute, or a default string.
               - 'icon': The MODULE_ICON attribute, or an empty string.
+              - 'fileName': The module filename (without .py extension).
+              The same entries are available by CLASS_NAME through `byClassName`.
     """
     if not directory or not os.path.isdir(directory):
         print(f"Error: Invalid module directory: {directory}")
-        return {}
+        return ModuleTable({})
+
+    directory = os.path.normpath(os.path.abspath(directory))
+    cachedTable, cachedFiles = _moduleRegistry.get((directory, importModules), (None, {}))
 
-    loadedModules = {}
+    files = {}
+    changed = False
 
     for fileName in getPythonFiles(directory):
         modulePath = os.path.join(directory, fileName)
         moduleName = os.path.splitext(fileName)[0] # Get module name without .py extension
 
         try:
-            mod = importModuleFromPath(moduleName, modulePath)
+            fileStamp = getFileStamp(modulePath)
+            cached = cachedFiles.get(moduleName)
 
-            loadedModules[moduleName] = {
-                'name' : getattr(mod, 'CLASS_NAME', moduleName),
+            if cached and cached[0] == fileStamp:
+                files[moduleName] = cached
+                continue
+
+            mod = None
+            metadata = {} if importModules else readModuleMetadata(modulePath)
+
+            if 'CLASS_NAME' not in metadata:
+                mod = importBlueprintModule(directory, moduleName)
+                metadata = {name: getattr(mod, name) for name in MODULE_METADATA_NAMES if hasattr(mod, name)}
+
+            entry = MappingProxyType({
+                'name' : metadata.get('CLASS_NAME', moduleName),
                 'module': mod,
-                'description': getattr(mod, 'MODULE_DESCRIPTION', 'No description available'),
-                'icon': getattr(mod, 'MODULE_ICON', '')
-            }
+                'description': metadata.get('MODULE_DESCRIPTION', 'No description available'),
+                'icon': metadata.get('MODULE_ICON', ''),
+                'fileName': moduleName
+            })
+
+            files[moduleName] = (fileStamp, entry)
+            changed = True
 
         except Exception as e:
             print(f'Error loading module {moduleName}: {str(e)}')
 
-    return loadedModules
+    if cachedTable is not None and not changed and files.keys() == cachedFiles.keys():
+        return cachedTable
 
+    table = ModuleTable({moduleName: entry for moduleName, (fileStamp, entry) in files.items()})
+    _moduleRegistry[(directory, importModules)] = (table, files)
+
+    return table
+
+
+def importBlueprintModule(directory, moduleName):
+    """
+    Imports a blueprint file on demand, re-executing it only when its mtime or size changed
+    since the last import.
+
+    Args:
+        directory (str): Path to the directory containing the blueprint files.
+        moduleName (str): The module filename (without .py extension).
+
+    Returns:
+        module: The imported module object.
+    """
+    modulePath = os.path.join(os.path.normpath(os.path.abspath(directory)), f'{moduleName}.py')
+    fileStamp = getFileStamp(modulePath)
+
+    cached = _importedModules.get(modulePath)
+    if cached and cached[0] == fileStamp:
+        return cached[1]
+
+    mod = importModuleFromPath(moduleName, modulePath)
+    _importedModules[modulePath] = (fileStamp, mod)
+
+    return mod
 
 
 def findHighestTrailingNumber(names, baseName):
@@ -147,7 +411,81 @@ def stripLeadingNamespace(nodeName):
     return [namespace, baseName]
 
 
-def basicStretchyIK(rootJoint, endJoint, container = None, lockMinimumLength = True, poleVectorObject = None, scaleCorrectionAttribute = None):
+def getJointChain(rootJoint, endJoint):
+    """
+    Returns the joints below rootJoint down to endJoint, read from the DAG path of endJoint.
+
+    The transforms on the path are filtered with a single `ls` query. Transforms between the joints are part of
+    the path but not of the chain, they are left out.
+
+    Args:
+        rootJoint (str): The first joint of the chain (not included in the result).
+        endJoint (str): The last joint of the chain.
+
+    Returns:
+        list[str] or None: The long names of the child joints from the first child of rootJoint to endJoint, in DAG
+                           order, or None if endJoint is not below rootJoint.
+    """
+
+    endPath = cmds.ls(endJoint, long = True)
+
+    if len(endPath) != 1:
+        return None
+
+    names = endPath[0].split('|')[1:]
+    paths = [f'|{"|".join(names[:index + 1])}' for index in range(len(names))]
+
+    rootName = rootJoint.lstrip('|')
+    rootIndex = next((index for index, path in enumerate(paths[:-1]) if path.endswith(f'|{rootName}')), None)
+
+    if rootIndex is None:
+        return None
+
+    paths = paths[rootIndex + 1:]
+    joints = set(cmds.ls(paths, type = 'joint', long = True))
+
+    return [path for path in paths if path in joints]
+
+
+def getTranslateXValues(nodes):
+    """
+    Reads translateX of several nodes through one OpenMaya selection list instead of one getAttr per node.
+    """
+
+    selection = om.MSelectionList()
+
+    for node in nodes:
+        selection.add(node)
+
+    values = []
+
+    for index in range(selection.length()):
+        dependNode = om.MFnDependencyNode(selection.getDependNode(index))
+        values.append(dependNode.findPlug('translateX', False).asDouble())
+
+    return values
+
+
+def basicStretchyIK(rootJoint, endJoint, container = None, lockMinimumLength = True, poleVectorObject = None, scaleCorrectionAttribute = None, compactNetwork = False):
+    """
+    Creates an RP IK handle from rootJoint to endJoint whose child joints stretch along X with the root to end distance.
+
+    Args:
+        rootJoint (str): First joint of the chain.
+        endJoint (str): Last joint of the chain.
+        container (str, optional): Container to add the created nodes to.
+        lockMinimumLength (bool): Unused, kept for compatibility.
+        poleVectorObject (str, optional): Pole vector object. A locator above the root joint is created if None.
+        scaleCorrectionAttribute (str, optional): Unused, kept for compatibility.
+        compactNetwork (bool): If True, the chain is read in one query and the stretch is driven by multiplyDivide
+                               nodes that each drive three joints (distance * translateX / total length per channel),
+                               the first of them being the scaleFactor node. Otherwise one scaleFactor node and one
+                               multiplyDivide per child joint are created.
+
+    Returns:
+        dict: The ikHandle, ikEffector, rootLocator, endLocator, poleVectorObject, ikHandlePointConstraint and
+              rootLocatorPointConstraint nodes.
+    """
 
     containedNodes = []
 
@@ -155,23 +493,31 @@ def basicStretchyIK(rootJoint, endJoint, container = None, lockMinimumLength = T
     done = False
     parent = rootJoint
 
-    childJoints = []
+    childJoints = getJointChain(rootJoint, endJoint) if compactNetwork else None
+    originalLengths = []
+
+    if childJoints:
+        originalLengths = getTranslateXValues(childJoints)
+        totalOriginalLength = sum(abs(length) for length in originalLengths)
+
+    else:
+        childJoints = []
 
-    while True:
-        children = cmds.listRelatives(parent, children = True, type = 'joint')
+        while True:
+            children = cmds.listRelatives(parent, children = True, type = 'joint')
 
-        if not children:
-            break
+            if not children:
+                break
 
-        child = children[0]
-        childJoints.append(child)
+            child = children[0]
+            childJoints.append(child)
 
-        totalOriginalLength += abs(cmds.getAttr(f'{child}.translateX'))
+            totalOriginalLength += abs(cmds.getAttr(f'{child}.translateX'))
 
-        if child == endJoint:
-            break
+            if child == endJoint:
+                break
 
-        parent = child
+            parent = child
 
     ikNodes = cmds.ikHandle(startJoint = rootJoint, endEffector = endJoint, solver = 'ikRPsolver', name = f'{rootJoint}_ikHandle')
     ikNodes[1] = cmds.rename(ikNodes[1], f'{rootJoint}_ikEffector')
@@ -219,22 +565,42 @@ def basicStretchyIK(rootJoint, endJoint, container = None, lockMinimumLength = T
 
     scaleAttr = f'{distNode}.distance'
 
-    scaleFactor = cmds.createNode('multiplyDivide', name = f'{ikHandle}_scaleFactor')
-    containedNodes.append(scaleFactor)
+    if compactNetwork and originalLengths:
+        # Each channel computes distance * (originalTx / totalLength), so three joints share one node.
+        for index in range(0, len(childJoints), 3):
+            joints = childJoints[index:index + 3]
+            lengths = originalLengths[index:index + 3]
+            channels = 'XYZ'[:len(joints)]
+
+            nodeName = f'{ikHandle}_scaleFactor' if index == 0 else f'{ikHandle}_scaleFactor{index // 3}'
+            scaleFactor = cmds.createNode('multiplyDivide', name = nodeName)
+            containedNodes.append(scaleFactor)
 
-    cmds.setAttr(f'{scaleFactor}.operation', 2)
-    cmds.connectAttr(scaleAttr, f'{scaleFactor}.input1X')
-    cmds.setAttr(f'{scaleFactor}.input2X', totalOriginalLength)
+            coefficients = [length / totalOriginalLength if totalOriginalLength else 0.0 for length in lengths]
+            coefficients += [0.0] * (3 - len(coefficients))
+            cmds.setAttr(f'{scaleFactor}.input2', *coefficients, type = 'double3')
 
-    translationDriver = f'{scaleFactor}.outputX'
+            for channel, joint in zip(channels, joints):
+                cmds.connectAttr(scaleAttr, f'{scaleFactor}.input1{channel}')
+                cmds.connectAttr(f'{scaleFactor}.output{channel}', f'{joint}.translateX')
+
+    else:
+        scaleFactor = cmds.createNode('multiplyDivide', name = f'{ikHandle}_scaleFactor')
+        containedNodes.append(scaleFactor)
 
-    for joint in childJoints:
-        multNode = cmds.createNode('multiplyDivide', name = f'{joint}_scaleMultiply')
-        containedNodes.append(multNode)
+        cmds.setAttr(f'{scaleFactor}.operation', 2)
+        cmds.connectAttr(scaleAttr, f'{scaleFactor}.input1X')
+        cmds.setAttr(f'{scaleFactor}.input2X', totalOriginalLength)
 
-        cmds.setAttr(f'{multNode}.input1X', cmds.getAttr(f'{joint}.translateX'))
-        cmds.connectAttr(translationDriver, f'{multNode}.input2X')
-        cmds.connectAttr(f'{multNode}.outputX', f'{joint}.translateX')
+        translationDriver = f'{scaleFactor}.outputX'
+
+        for joint in childJoints:
+            multNode = cmds.createNode('multiplyDivide', name = f'{joint}_scaleMultiply')
+            containedNodes.append(multNode)
+
+            cmds.setAttr(f'{multNode}.input1X', cmds.getAttr(f'{joint}.translateX'))
+            cmds.connectAttr(translationDriver, f'{multNode}.input2X')
+            cmds.connectAttr(f'{multNode}.outputX', f'{joint}.translateX')
 
 
 
@@ -253,6 +619,81 @@ def basicStretchyIK(rootJoint, endJoint, container = None, lockMinimumLength = T
     }
 
 
+def matrixAimSegment(rootJoint, endJoint, rootTarget, endTarget, upObject, container = None, secondaryAxis = (0.0, -1.0, 0.0)):
+    """
+    Drives the orientation of rootJoint and the length of the segment from matrix utility nodes instead of an IK handle.
+
+    An aimMatrix aims the root joint's X axis from rootTarget at endTarget, with the secondary axis aimed at
+    upObject (the role of the RP solver's pole vector). The result is brought into the joint's parent space with
+    a multMatrix and decomposed into the joint's rotate, so jointOrient is zeroed. A distanceBetween of the two
+    targets drives endJoint.translateX.
+
+    Args:
+        rootJoint (str): Joint to aim.
+        endJoint (str): Child joint whose translateX follows the segment length.
+        rootTarget (str): Transform the segment starts at, e.g. the root translation control.
+        endTarget (str): Transform the segment aims at, e.g. the child translation control.
+        upObject (str): Transform the secondary axis aims at.
+        container (str, optional): Container to add the created nodes to.
+        secondaryAxis (tuple[float, float, float]): Axis of rootJoint that aims at upObject.
+
+    Returns:
+        dict: The aimMatrix, multMatrix, decomposeMatrix and distanceBetween nodes.
+    """
+
+    containedNodes = []
+
+    # A mirrored (behaviour) joint points down its negative X axis, with a negative translateX on the child.
+    direction = -1.0 if cmds.getAttr(f'{endJoint}.translateX') < 0 else 1.0
+
+    aimMatrix = cmds.createNode('aimMatrix', name = f'{rootJoint}_aimMatrix')
+    cmds.connectAttr(f'{rootTarget}.worldMatrix[0]', f'{aimMatrix}.inputMatrix')
+    cmds.connectAttr(f'{endTarget}.worldMatrix[0]', f'{aimMatrix}.primaryTargetMatrix')
+    cmds.connectAttr(f'{upObject}.worldMatrix[0]', f'{aimMatrix}.secondaryTargetMatrix')
+    cmds.setAttr(f'{aimMatrix}.primaryInputAxis', direction, 0.0, 0.0, type = 'double3')
+    cmds.setAttr(f'{aimMatrix}.secondaryInputAxis', *secondaryAxis, type = 'double3')
+    cmds.setAttr(f'{aimMatrix}.secondaryMode', 1)  # Aim
+    containedNodes.append(aimMatrix)
+
+    localMatrix = cmds.createNode('multMatrix', name = f'{rootJoint}_aimLocalMatrix')
+    cmds.connectAttr(f'{aimMatrix}.outputMatrix', f'{localMatrix}.matrixIn[0]')
+    cmds.connectAttr(f'{rootJoint}.parentInverseMatrix[0]', f'{localMatrix}.matrixIn[1]')
+    containedNodes.append(localMatrix)
+
+    decompose = cmds.createNode('decomposeMatrix', name = f'{rootJoint}_aimDecomposeMatrix')
+    cmds.connectAttr(f'{localMatrix}.matrixSum', f'{decompose}.inputMatrix')
+    cmds.connectAttr(f'{rootJoint}.rotateOrder', f'{decompose}.inputRotateOrder')
+    containedNodes.append(decompose)
+
+    cmds.setAttr(f'{rootJoint}.jointOrient', 0.0, 0.0, 0.0, type = 'double3')
+    cmds.connectAttr(f'{decompose}.outputRotate', f'{rootJoint}.rotate', force = True)
+
+    distNode = cmds.createNode('distanceBetween', name = f'{rootJoint}_segmentLength')
+    cmds.connectAttr(f'{rootTarget}.worldMatrix[0]', f'{distNode}.inMatrix1')
+    cmds.connectAttr(f'{endTarget}.worldMatrix[0]', f'{distNode}.inMatrix2')
+    containedNodes.append(distNode)
+
+    if direction < 0:
+        negate = cmds.createNode('multDoubleLinear', name = f'{endJoint}_segmentLengthNegate')
+        cmds.connectAttr(f'{distNode}.distance', f'{negate}.input1')
+        cmds.setAttr(f'{negate}.input2', -1.0)
+        cmds.connectAttr(f'{negate}.output', f'{endJoint}.translateX', force = True)
+        containedNodes.append(negate)
+
+    else:
+        cmds.connectAttr(f'{distNode}.distance', f'{endJoint}.translateX', force = True)
+
+    if container:
+        addNodeToContainer(container = container, nodesIn = containedNodes)
+
+    return {
+        'aimMatrix': aimMatrix,
+        'multMatrix': localMatrix,
+        'decomposeMatrix': decompose,
+        'distanceBetween': distNode
+    }
+
+
 # totalOriginalLength = 0.0
     # parent = rootJoint
     #
@@ -361,20 +802,385 @@ def basicStretchyIK(rootJoint, endJoint, container = None, lockMinimumLength = T
     # }
 
 
-def forceSceneUpdate():
+
+def _formatMelValue(value):
+    if isinstance(value, bool):
+        return '1' if value else '0'
+
+    if isinstance(value, str):
+        return f'"{value}"'
+
+    return repr(value)
+
+
+class NodeNetwork:
+    """
+    Collects the nodes, attribute values and connections of a utility node network and
+    creates them with a single MEL evaluation, instead of one createNode, setAttr or
+    connectAttr round-trip per call.
+
+    Example:
+        network = NodeNetwork()
+        addNode = network.createNode('plusMinusAverage', f'{joint}_addTx')
+        network.connectAttr(f'{addNode}.output1D', f'{joint}.translateX')
+        network.build()
+    """
+
+    def __init__(self):
+        self.nodes = []  # [(nodeType, name)]
+        self.statements = []
+
+    def createNode(self, nodeType, name):
+        """
+        Adds a node to the network and returns its name. Names must be unique, they are not resolved by Maya.
+        """
+        self.nodes.append((nodeType, name))
+        self.statements.append(f'createNode "{nodeType}" -name "{name}" -skipSelect;')
+
+        return name
+
+    def setAttr(self, attribute, *values, type = None, lock = False):
+        flags = ' -lock true' if lock else ''
+        typeFlag = f' -type "{type}"' if type else ''
+        valueString = ' '.join(_formatMelValue(value) for value in values)
+
+        self.statements.append(f'setAttr{flags} "{attribute}"{typeFlag} {valueString};')
+
+    def connectAttr(self, source, destination, force = True):
+        forceFlag = ' -force' if force else ''
+        self.statements.append(f'connectAttr{forceFlag} "{source}" "{destination}";')
+
+    def disconnectAttr(self, source, destination):
+        self.statements.append(f'disconnectAttr "{source}" "{destination}";')
+
+    def build(self):
+        """
+        Creates the network in the scene.
+
+        Returns:
+            list[str]: The names of the created nodes, in the order they were added.
+
+        Raises:
+            RuntimeError: If a node name is already taken in the scene.
+        """
+        names = [name for _, name in self.nodes]
+
+        existing = cmds.ls(names) if names else []
+        if existing:
+            raise RuntimeError(f'Cannot build node network, nodes already exist: {", ".join(existing)}')
+
+        if self.statements:
+            mel.eval('\n'.join(self.statements))
+
+        self.statements = []
+
+        return names
+
+
+
+_CHOICE_CHANNELS = ('translate', 'rotate', 'scale')
+
+
+def getControlModuleNames(moduleNamespace):
+    """
+    Returns the entries of the activeModule enum of a locked module, index 0 being 'None' (the creation pose).
+    """
+    enumString = cmds.attributeQuery('activeModule', node = f'{moduleNamespace}:SETTINGS', listEnum = True)[0]
+    return [name for name in enumString.split(':') if name]
+
+
+def _addModuleChoice(joint, settingsLocator, network):
+    """
+    Adds the choice network of one blueprint joint to `network`.
+
+    The joint's current channel values or drivers (the creation pose) become choice input 0, and the
+    joint's translate, rotate and scale are driven by the selected input from then on.
+    """
+    composeNode = network.createNode('composeMatrix', f'{joint}_creationPoseMatrix')
+    choiceNode = network.createNode('choice', f'{joint}_moduleChoice')
+    decomposeNode = network.createNode('decomposeMatrix', f'{joint}_moduleDecompose')
+
+    for channel in _CHOICE_CHANNELS:
+        composeInput = f'{composeNode}.input{channel.capitalize()}'
+
+        # (jointPlug, sourcePlug) pairs. Listing the compound also lists the connections into its child plugs,
+        # e.g. an `_original_Tx` multiply driving translateX, so each pair is moved exactly as it is connected.
+        connections = cmds.listConnections(f'{joint}.{channel}', source = True, destination = False, plugs = True, connections = True, skipConversionNodes = False) or []
+        connections = list(zip(connections[::2], connections[1::2]))
+
+        if not any(jointPlug.rpartition('.')[2] == channel for jointPlug, _ in connections):
+            network.setAttr(composeInput, *cmds.getAttr(f'{joint}.{channel}')[0], type = 'double3')
+
+        for jointPlug, sourcePlug in connections:
+            attribute = jointPlug.rpartition('.')[2]
+
+            network.disconnectAttr(sourcePlug, jointPlug)
+            network.connectAttr(sourcePlug, composeInput if attribute == channel else f'{composeInput}{attribute[-1].upper()}')
+
+        network.connectAttr(f'{decomposeNode}.output{channel.capitalize()}', f'{joint}.{channel}')
+
+    network.connectAttr(f'{joint}.rotateOrder', f'{composeNode}.inputRotateOrder')
+    network.connectAttr(f'{joint}.rotateOrder', f'{decomposeNode}.inputRotateOrder')
+
+    network.connectAttr(f'{composeNode}.outputMatrix', f'{choiceNode}.input[0]')
+    network.connectAttr(f'{settingsLocator}.activeModule', f'{choiceNode}.selector')
+    network.connectAttr(f'{choiceNode}.output', f'{decomposeNode}.inputMatrix')
+
+    return choiceNode
+
+
+def registerControlModule(moduleNamespace, controlModuleName, drivers):
+    """
+    Registers a control module on a locked blueprint module and switches its joints through `choice` nodes.
+
+    Each driven joint gets one choice node selected by SETTINGS.activeModule. Input 0 is the creation pose and
+    input n is the n-th control module, so only the active module's network is pulled during evaluation, however
+    many control modules are installed. Inputs of modules that do not drive a joint hold the creation pose. The
+    creationPoseWeight attribute keeps driving the creation pose input.
+
+    Control modules call this when they are installed on a locked module. The lock network drives the joints straight
+    from the creation pose, and those connections become input 0 of the choice nodes. No control modules ship with
+    the tool yet, so nothing in the tree calls this; it is the entry point they install through.
+
+    Args:
+        moduleNamespace (str): Namespace of the locked blueprint module.
+        controlModuleName (str): Name of the control module, added to the activeModule enum.
+        drivers (dict): {joint: matrixPlug}. The matrix holds the translate, rotate and scale channel values the
+                        control module wants on that blueprint joint (not including its joint orient).
+
+    Returns:
+        int: The activeModule index of the control module.
+    """
+    settingsLocator = f'{moduleNamespace}:SETTINGS'
+    moduleContainer = f'{moduleNamespace}:module_container'
+
+    moduleNames = getControlModuleNames(moduleNamespace)
+
+    if controlModuleName in moduleNames:
+        moduleIndex = moduleNames.index(controlModuleName)
+    else:
+        moduleNames.append(controlModuleName)
+        moduleIndex = len(moduleNames) - 1
+
+    with unlockedContainers(moduleContainer):
+        cmds.addAttr(f'{settingsLocator}.activeModule', edit = True, enumName = ':'.join(moduleNames) + ':')
+
+        network = NodeNetwork()
+
+        # {choiceNode: connected input indices} of the joints already switched by earlier control modules.
+        choiceInputs = {choiceNode: set(cmds.getAttr(f'{choiceNode}.input', multiIndices = True) or []) for choiceNode in cmds.ls(f'{moduleNamespace}:*_moduleChoice', type = 'choice') or []}
+
+        for joint, matrixPlug in drivers.items():
+            choiceNode = f'{joint}_moduleChoice'
+
+            if choiceNode not in choiceInputs:
+                _addModuleChoice(joint, settingsLocator, network)
+                choiceInputs[choiceNode] = {0}
+
+            network.connectAttr(matrixPlug, f'{choiceNode}.input[{moduleIndex}]')
+            choiceInputs[choiceNode].add(moduleIndex)
+
+        # An unconnected choice input outputs the identity matrix, so modules that do not drive a joint hold it in its creation pose.
+        for choiceNode, connectedInputs in choiceInputs.items():
+            creationPoseMatrix = f'{choiceNode.rpartition("_moduleChoice")[0]}_creationPoseMatrix'
+
+            for index in range(1, len(moduleNames)):
+                if index not in connectedInputs:
+                    network.connectAttr(f'{creationPoseMatrix}.outputMatrix', f'{choiceNode}.input[{index}]')
+
+        newNodes = network.build()
+
+        if newNodes:
+            addNodeToContainer(moduleContainer, newNodes)
+
+        cmds.setAttr(f'{moduleNamespace}:blueprint_joints_grp.controlModulesInstalled', True)
+
+    return moduleIndex
+
+
+_transactionDepth = globals().get('_transactionDepth', 0)  # Kept across reloads, a module may reload utils inside a transaction
+
+
+@contextmanager
+def sceneTransaction(chunkName):
+    """
+    Groups a batch of scene edits into one undoable step and suspends viewport refresh while they run.
+
+    Transactions can be nested; only the outermost one resumes refresh. Refresh is resumed and
+    the undo chunk is closed even if the edits raise.
+
+    Args:
+        chunkName (str): Name of the undo chunk, shown in Maya's undo history.
+    """
+
+    global _transactionDepth
+
+    cmds.undoInfo(openChunk = True, chunkName = chunkName)
+
+    if _transactionDepth == 0:
+        cmds.refresh(suspend = True)
+
+    _transactionDepth += 1
+
+    try:
+        yield
+
+    finally:
+        _transactionDepth -= 1
+
+        if _transactionDepth == 0:
+            cmds.refresh(suspend = False)
+
+        cmds.undoInfo(closeChunk = True)
+
+
+_unlockedContainers = globals().get('_unlockedContainers', {})  # {uuid: [depth, wasLocked, wasLockedUnpublished]}, kept across reloads
+
+
+@contextmanager
+def unlockedContainers(*containers):
     """
-    Forces Maya's scene graph to update by cycling selection and tool context.
-    This can help ensure scene elements evaluate or refresh visually.
+    Unlocks containers for the duration of an operation and restores their original lock state afterwards.
+
+    The context is reentrant: a container that is already unlocked by an outer `unlockedContainers` block
+    is not touched again, and only the outermost block restores its state, on exit or on exception.
+    Containers are tracked by UUID, so a container renamed inside the block (e.g. by moving its namespace)
+    is still restored. Containers that do not exist are ignored, as are containers deleted inside the block.
+
+    Args:
+        *containers (str): Container names. Nested lists are flattened and None entries are skipped.
+
+    Example:
+        with utils.unlockedContainers(self.containerName, 'Group_container'):
+            cmds.parent(moduleTransform, group, absolute = True)
     """
 
-    cmds.setToolTo('moveSuperContext')
+    uuids = []
+
+    for container in flattenNodeList([container for container in containers if container]):
+        uuid = cmds.ls(container, uuid = True)
+
+        if not uuid or uuid[0] in uuids:
+            continue
+
+        uuid = uuid[0]
+        uuids.append(uuid)
+
+        if uuid in _unlockedContainers:
+            _unlockedContainers[uuid][0] += 1
+            continue
+
+        wasLocked = cmds.lockNode(container, query = True, lock = True)[0]
+        wasLockedUnpublished = cmds.lockNode(container, query = True, lockUnpublished = True)[0]
+
+        if wasLocked or wasLockedUnpublished:
+            cmds.lockNode(container, lock = False, lockUnpublished = False)
+
+        _unlockedContainers[uuid] = [1, wasLocked, wasLockedUnpublished]
+
+    try:
+        yield
+
+    finally:
+        for uuid in reversed(uuids):
+            state = _unlockedContainers[uuid]
+            state[0] -= 1
+
+            if state[0] > 0:
+                continue
+
+            del _unlockedContainers[uuid]
+
+            container = cmds.ls(uuid)
+
+            if container and (state[1] or state[2]):
+                cmds.lockNode(container[0], lock = state[1], lockUnpublished = state[2])
+
+
+def getContainerNodes(container, recursive = True):
+    """
+    Lists the nodes inside a container, including the contents of nested containers.
+
+    Args:
+        container (str): Name of the container.
+        recursive (bool): If True, nested containers are listed together with their contents.
+
+    Returns:
+        list[str]: The container node followed by its contents, without duplicates.
+    """
 
-    for node in cmds.ls():
-        cmds.select(node, replace = True)
+    nodes = []
+    visited = set()
+    pending = [container]
 
-    cmds.select(clear = True)
+    while pending:
+        current = pending.pop()
 
-    cmds.setToolTo('selectSuperContext')
+        if current in visited or not cmds.objExists(current):
+            continue
+
+        visited.add(current)
+        nodes.append(current)
+
+        for node in cmds.container(current, query = True, nodeList = True) or []:
+            if recursive and cmds.objectType(node, isAType = 'containerBase'):
+                pending.append(node)
+
+            elif node not in visited:
+                visited.add(node)
+                nodes.append(node)
+
+    return nodes
+
+
+def forceSceneUpdate(nodes):
+    """
+    Forces the dependency graph to re-evaluate the given nodes, e.g. the contents of one module
+    container from `getContainerNodes()`. Selection and tool context are left untouched, so no
+    SelectionChanged events are fired.
+
+    Args:
+        nodes (str or list[str]): Node(s) to dirty and evaluate. Nodes that no longer exist are skipped.
+    """
+
+    nodes = cmds.ls(nodes)
+
+    if not nodes:
+        return
+
+    cmds.dgdirty(nodes)
+    cmds.dgeval(nodes)
+
+
+def flattenNodeList(nodesIn):
+    """
+    Flattens arbitrarily nested lists and tuples of node names into a single list.
+
+    Args:
+        nodesIn (str or list): A node name or a (nested) list of node names.
+
+    Returns:
+        list[str]: The node names in their original order.
+    """
+
+    if isinstance(nodesIn, str):
+        return [nodesIn]
+
+    result = []
+    pending = [iter(nodesIn)]
+
+    while pending:
+        for item in pending[-1]:
+            if isinstance(item, (list, tuple)):
+                pending.append(iter(item))
+                break
+
+            result.append(item)
+
+        else:
+            pending.pop()
+
+    return result
 
 
 def addNodeToContainer(container, nodesIn, includeHierarchyBelow = False, includeShapes = True, includeShaders = True, force = False):
@@ -383,42 +1189,25 @@ def addNodeToContainer(container, nodesIn, includeHierarchyBelow = False, includ
 
     Args:
         container (str): The name of the container node to add nodes to.
-        nodesIn (list or str): A single node name or a list of node names to add.
+        nodesIn (list or str): A single node name or a (nested) list of node names to add.
         includeHierarchyBelow (bool): If True, includes the entire hierarchy below the specified nodes.
         includeShapes (bool): If True, includes shape nodes associated with the specified nodes.
         includeShaders (bool): If True, includes shader nodes connected to the specified nodes.
         force (bool): If True, forces the addition even if some nodes are already in the container.
     """
 
-    # Ensure nodesIn is a list for consistent processing
-    nodes = nodesIn if isinstance(nodesIn, list) else [nodesIn]
-
-    def flatten(inputList):
-        """Flattens a nested list to a single list of strings (non-recursive)."""
-        result = []
-        for item in inputList:
-            if isinstance(item, list):
-                result.extend(item)
-            else:
-                result.append(item)
-        return result
-
-    if isinstance(nodesIn, str):
-        nodes = [nodesIn]
-    elif isinstance(nodesIn, list):
-        nodes = flatten(nodesIn)
-    else:
-        raise TypeError("nodesIn must be a string or a list of strings.")
+    nodes = _normalizeNodeList(nodesIn)
 
-    conversionNodes = []
+    if not nodes:
+        return
 
-    for node in nodes:
-        node_conversionNodes = cmds.listConnections(node, source = True, destination = True)
-        node_conversionNodes = cmds.ls(node_conversionNodes, type = 'unitConversion')
+    transaction = getActiveContainerTransaction()
 
-        conversionNodes.extend(node_conversionNodes)
+    if transaction:
+        transaction.addNodes(container, nodes, includeHierarchyBelow = includeHierarchyBelow, includeShapes = includeShapes, includeShaders = includeShaders, force = force)
+        return
 
-    nodes.extend(conversionNodes)
+    nodes.extend(_findConversionNodes(nodes))
 
     cmds.container(container,
                    edit = True,
@@ -428,6 +1217,89 @@ def addNodeToContainer(container, nodesIn, includeHierarchyBelow = False, includ
                    includeShaders = includeShaders,
                    force = force)
 
+
+def _normalizeNodeList(nodesIn):
+    if isinstance(nodesIn, str):
+        return [nodesIn]
+    elif isinstance(nodesIn, (list, tuple)):
+        return list(dict.fromkeys(flattenNodeList(nodesIn)))  # Flatten and drop duplicates, keeping order.
+    else:
+        raise TypeError("nodesIn must be a string or a list of strings.")
+
+
+def _findConversionNodes(nodes):
+    """
+    Returns the unitConversion nodes connected to any of the given nodes that are not in the list already.
+    Uses one connection query for the whole list instead of one per node.
+    """
+
+    knownNodes = set(nodes)
+    conversionNodes = []
+
+    for conversionNode in cmds.listConnections(nodes, source = True, destination = True, type = 'unitConversion') or []:
+        if conversionNode not in knownNodes:
+            knownNodes.add(conversionNode)
+            conversionNodes.append(conversionNode)
+
+    return conversionNodes
+
+
+def removeNodeFromContainer(container, nodesIn):
+    """
+    Removes nodes from a container. Inside a `ContainerTransaction`, a pending addition of the nodes is cancelled instead.
+
+    Args:
+        container (str): The name of the container node.
+        nodesIn (list or str): A single node name or a (nested) list of node names to remove.
+    """
+
+    nodes = _normalizeNodeList(nodesIn)
+    transaction = getActiveContainerTransaction()
+
+    if transaction and nodes:
+        nodes = transaction.cancelNodes(container, nodes)
+
+    if nodes:
+        cmds.container(container, edit = True, removeNode = nodes)
+
+
+def publishAndBind(container, attribute, name):
+    """
+    Publishes an attribute on a container under the given name and binds it to the node attribute.
+    Inside a `ContainerTransaction`, the request is applied when the transaction closes.
+
+    Args:
+        container (str): The name of the container node.
+        attribute (str): The node attribute to publish, e.g. 'joint.rotate'.
+        name (str): The published attribute name on the container.
+    """
+
+    transaction = getActiveContainerTransaction()
+
+    if transaction:
+        transaction.publishAndBind(container, attribute, name)
+        return
+
+    cmds.container(container, edit = True, publishAndBind = (attribute, name))
+
+
+def deleteContainer(container):
+    """
+    Deletes a container and its contents, including nodes still waiting to be added by an open `ContainerTransaction`.
+    """
+
+    nodes = [container]
+    transaction = getActiveContainerTransaction()
+
+    if transaction:
+        nodes.extend(transaction.discardContainer(container))
+
+    nodes = cmds.ls(nodes)
+
+    if nodes:
+        cmds.delete(nodes)
+
+
 def createContainer(name, nodesIn = None, includeHierarchyBelow = True, includeShaders = True, includeTransform = True, includeShapes = True, force = True):
     """
     Creates a new Maya container node and optionally adds specified nodes to it.
@@ -449,6 +1321,19 @@ def createContainer(name, nodesIn = None, includeHierarchyBelow = True, includeS
     # Ensure nodesIn is a list for consistent processing
     nodes = nodesIn if isinstance(nodesIn, list) else [nodesIn] if nodesIn else []
 
+    transaction = getActiveContainerTransaction()
+
+    if transaction:
+        # Create the container right away so its name can be used, the additions and hyperLayout rename are buffered.
+        container = cmds.container(name = name)
+
+        if nodes:
+            transaction.addNodes(container, nodes, includeHierarchyBelow = includeHierarchyBelow, includeShaders = includeShaders, includeTransform = includeTransform, includeShapes = includeShapes, force = force)
+
+        transaction.renameHyperLayout(container)
+
+        return container
+
     # Create the container and add initial nodes
     container = cmds.container(name = name,
                                addNode = nodes,
@@ -465,14 +1350,291 @@ def createContainer(name, nodesIn = None, includeHierarchyBelow = True, includeS
 
     return container
 
+
+class ContainerTransaction:
+    """
+    Buffers container edits and applies them in as few `cmds.container` calls as possible when the transaction closes.
+
+    While a transaction is open, `addNodeToContainer`, `createContainer`, `publishAndBind`, `removeNodeFromContainer`
+    and `deleteContainer` go through it. On close, node additions are applied first (one edit per container and
+    flag combination), then publish/bind requests (one edit per container, ordered so an attribute published on a
+    sub-container exists before the parent container publishes it), then hyperLayout renames.
+
+    Nodes are tracked by UUID, so renaming or reparenting them before the transaction closes is fine, and nodes
+    deleted in the meantime are skipped. The hierarchy below a node is captured when the addition is requested,
+    as the unbuffered call would.
+
+    Example:
+        with utils.ContainerTransaction():
+            container = utils.createContainer('module_container', nodesIn = [moduleGrp])
+            utils.publishAndBind(container, f'{joint}.rotate', 'joint_Rotate')
+    """
+
+    def __init__(self):
+        self.pendingNodes = {}  # {uuid: (container, flags)}, the last requested container wins
+        self.pendingPublishes = []  # [(container, attribute, name)] in request order
+        self.pendingRenames = []  # [container] whose hyperLayout gets renamed
+
+    def __enter__(self):
+        _containerTransactions.append(self)
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        if self in _containerTransactions:
+            _containerTransactions.remove(self)
+
+        # A failed body leaves its containers half built, its buffered edits are dropped so the original error surfaces.
+        if excType is None:
+            self.flush()
+
+        return False
+
+    # BUFFERING
+    def addNodes(self, container, nodes, includeHierarchyBelow = False, includeShapes = True, includeShaders = True, includeTransform = False, force = False):
+        flags = (includeShapes, includeShaders, includeTransform, force)
+
+        uuids = cmds.ls(nodes, uuid = True)
+
+        if includeHierarchyBelow:
+            uuids.extend(cmds.ls(nodes, dag = True, uuid = True))
+
+        for uuid in uuids:
+            self.pendingNodes.pop(uuid, None)  # Re-insert so the node moves to its latest container.
+            self.pendingNodes[uuid] = (container, flags)
+
+    def cancelNodes(self, container, nodes):
+        """
+        Cancels pending additions of nodes to a container.
+
+        Returns:
+            list[str]: The nodes that had no pending addition to the container and still have to be removed from it.
+        """
+
+        remaining = []
+
+        for node in nodes:
+            uuid = (cmds.ls(node, uuid = True) or [None])[0]
+
+            if uuid in self.pendingNodes and self.pendingNodes[uuid][0] == container:
+                del self.pendingNodes[uuid]
+            else:
+                remaining.append(node)
+
+        return remaining
+
+    def publishAndBind(self, container, attribute, name):
+        self.pendingPublishes.append((container, attribute, name))
+
+    def renameHyperLayout(self, container):
+        self.pendingRenames.append(container)
+
+    def discardContainer(self, container):
+        """
+        Drops every pending edit of a container that is about to be deleted.
+
+        Returns:
+            list[str]: The nodes that were waiting to be added to it.
+        """
+
+        uuids = [uuid for uuid, (target, flags) in self.pendingNodes.items() if target == container]
+
+        for uuid in uuids:
+            del self.pendingNodes[uuid]
+
+        self.pendingPublishes = [publish for publish in self.pendingPublishes if publish[0] != container]
+        self.pendingRenames = [target for target in self.pendingRenames if target != container]
+
+        return cmds.ls(uuids) if uuids else []
+
+    # APPLYING
+    def flush(self):
+        """
+        Applies all buffered edits. Called automatically when the transaction closes without an error.
+        """
+
+        self._flushNodes()
+        self._flushPublishes()
+        self._flushRenames()
+
+    def _flushNodes(self):
+        groups = {}  # {(container, flags): [uuid]} in order of first request
+
+        for uuid, key in self.pendingNodes.items():
+            groups.setdefault(key, []).append(uuid)
+
+        self.pendingNodes = {}
+        claimedNodes = set()
+
+        for (container, (includeShapes, includeShaders, includeTransform, force)), uuids in groups.items():
+            if not cmds.objExists(container):
+                continue
+
+            nodes = [node for node in cmds.ls(uuids) if node not in claimedNodes]
+
+            if not nodes:
+                continue
+
+            claimedNodes.update(nodes)
+
+            conversionNodes = [node for node in _findConversionNodes(nodes) if node not in claimedNodes]
+            claimedNodes.update(conversionNodes)
+
+            cmds.container(container,
+                           edit = True,
+                           addNode = nodes + conversionNodes,
+                           includeShapes = includeShapes,
+                           includeShaders = includeShaders,
+                           includeTransform = includeTransform,
+                           force = force)
+
+    def _flushPublishes(self):
+        # A publish of 'subContainer.attr' has to wait for the publish that creates 'attr' on the sub-container.
+        sources = {(container, name): attribute for container, attribute, name in self.pendingPublishes}
+        levels = {}  # {(container, name): level}
+
+        def getLevel(key, depth = 0):
+            if key not in levels:
+                node, _, attributeName = sources[key].partition('.')
+                source = (node, attributeName)
+                levels[key] = getLevel(source, depth + 1) + 1 if source in sources and depth < len(sources) else 0
+
+            return levels[key]
+
+        batches = {}  # {level: {container: [(attribute, name)]}}
+
+        for container, attribute, name in self.pendingPublishes:
+            level = getLevel((container, name))
+            batches.setdefault(level, {}).setdefault(container, []).append((attribute, name))
+
+        self.pendingPublishes = []
+
+        for level in sorted(batches):
+            for container, publishes in batches[level].items():
+                publishes = [publish for publish in publishes if cmds.objExists(publish[0].partition('.')[0])]
+
+                if publishes and cmds.objExists(container):
+                    cmds.container(container, edit = True, publishAndBind = publishes)
+
+    def _flushRenames(self):
+        if not self.pendingRenames:
+            return
+
+        containers = cmds.ls(self.pendingRenames)
+        self.pendingRenames = []
+
+        if not containers:
+            return
+
+        # One query for all containers: [container.attr, hyperLayout, ...]
+        connections = cmds.listConnections(containers, type = 'hyperLayout', connections = True, plugs = False) or []
+
+        renamed = set()
+
+        for containerPlug, hyperLayout in zip(connections[::2], connections[1::2]):
+            container = containerPlug.partition('.')[0]
+
+            if container not in renamed:
+                renamed.add(container)
+                cmds.rename(hyperLayout, f':{container}_hyperLayout')
+
+
+_containerTransactions = globals().get('_containerTransactions', [])  # Stack of open ContainerTransactions, the last one receives container edits, kept across reloads.
+
+
+def getActiveContainerTransaction():
+    """
+    Returns the innermost open `ContainerTransaction`, or None if no transaction is open.
+    """
+
+    return _containerTransactions[-1] if _containerTransactions else None
+
+
+MATERIAL_POOL_PREFIX = 'controlMaterial'
+
+_materialPool = globals().get('_materialPool', {})  # {(color, diffuse): material uuid}, kept across reloads
+
+
+@contextmanager
+def rootNamespace():
+    """
+    Makes the root namespace current for the duration of the block and restores the previous current namespace afterwards.
+    """
+
+    currentNamespace = cmds.namespaceInfo(currentNamespace = True, absoluteName = True)
+    cmds.namespace(setNamespace = ':')
+
+    try:
+        yield
+
+    finally:
+        cmds.namespace(setNamespace = currentNamespace)
+
+
+def getPooledMaterial(color = (1, 0, 0), diffuse = 0.2):
+    """
+    Returns the shared lambert, shading group and materialInfo for a color, creating them in the root namespace on first use.
+
+    Pooled materials are shared by every control of that color in the scene, so they must not be added to
+    module containers (deleting a container would delete them for everyone).
+
+    Args:
+        color (tuple): (R, G, B) diffuse color, values from 0 to 1.
+        diffuse (float): Diffuse intensity, from 0 to 1.
+
+    Returns:
+        list: [materialNode (str), shadingGroup (str), materialInfoNode (str)].
+    """
+
+    key = (tuple(round(channel, 4) for channel in color), round(diffuse, 4))
+
+    uuid = _materialPool.get(key)
+    material = cmds.ls(uuid) if uuid else None
+
+    if material:
+        material = material[0]
+
+    else:
+        channels = '_'.join(str(int(round(channel * 255))) for channel in key[0])
+        materialName = f'{MATERIAL_POOL_PREFIX}_{channels}_d{int(round(key[1] * 100))}_m'
+
+        # Reuse the pooled material of a reopened scene, otherwise create it.
+        if cmds.objExists(f':{materialName}'):
+            material = materialName
+
+        else:
+            with rootNamespace():
+                material = cmds.shadingNode("lambert", asShader = True, name = materialName)
+                cmds.setAttr(f"{material}.color", *color, type = "double3")
+                cmds.setAttr(f"{material}.diffuse", diffuse)
+
+                # Create a shading group for the material
+                shadingGroup = cmds.sets(renderable = True, noSurfaceShader = True, empty = True, name = f"{material}SG")
+                # Connect the material's outColor to the shading group's surfaceShader
+                cmds.connectAttr(f"{material}.outColor", f"{shadingGroup}.surfaceShader", force = True)
+
+                materialInfo = cmds.listConnections(material, type = "materialInfo")
+
+                if materialInfo:
+                    cmds.rename(materialInfo[0], f'{material}Info')
+
+        _materialPool[key] = cmds.ls(material, uuid = True)[0]
+
+    shadingGroup = (cmds.listConnections(f"{material}.outColor", type = "shadingEngine") or [None])[0]
+    materialInfo = (cmds.listConnections(material, type = "materialInfo") or [None])[0]
+
+    return [material, shadingGroup, materialInfo]
+
+
 def assignMaterial(obj, color = (1, 0, 0), diffuse = 0.2):
     """
-    Creates a Lambert material with specified color and diffuse properties,
-    assigns it to the given Maya object, and returns the material and its materialInfo node.
-    If a material with the generated name already exists, it will be reused.
+    Assigns the pooled Lambert material of the given color and diffuse to an object and returns the material
+    and its materialInfo node. All objects with the same color share one material and shading group.
+
+    The pooled nodes live in the root namespace and are not meant to be added to containers, so pass
+    includeShaders = False when containing the object.
 
     Args:
-        obj (str): The name of the object (e.g., a transform node) to assign the material to.
+        obj (str or list[str]): The object(s) (e.g., a transform node or some of its shapes) to assign the material to.
         color (tuple): A tuple (R, G, B) representing the diffuse color (values from 0 to 1).
                        Defaults to red (1, 0, 0).
         diffuse (float): The diffuse intensity of the material (value from 0 to 1).
@@ -481,35 +1643,13 @@ def assignMaterial(obj, color = (1, 0, 0), diffuse = 0.2):
     Returns:
         list: A list containing [materialNode (str), materialInfoNode (str)].
     """
-    # Generate a material name based on the object name
-    # If obj is namespaced, the material will also be namespaced, which is fine for modularity.
-    materialName = f'{obj}_m'
-
-    # Create material if it doesn't exist, otherwise reuse existing
-    if not cmds.objExists(materialName):
-        material = cmds.shadingNode("lambert", asShader = True, name = materialName)
-    else:
-        material = materialName # Use the existing material
 
-    # Set color and diffuse attributes
-    cmds.setAttr(f"{material}.color", *color, type = "double3")
-    cmds.setAttr(f"{material}.diffuse", diffuse)
-
-    # Create a shading group for the material
-    shadingGroup = cmds.sets(renderable = True, noSurfaceShader = True, empty = True, name = f"{material}SG")
-    # Connect the material's outColor to the shading group's surfaceShader
-    cmds.connectAttr(f"{material}.outColor", f"{shadingGroup}.surfaceShader", force = True)
+    material, shadingGroup, materialInfo = getPooledMaterial(color, diffuse)
 
     # Assign the material to the specified object
     cmds.sets(obj, edit = True, forceElement = shadingGroup)
 
-    # Find and rename the associated materialInfo node for clarity
-    materialInfo = cmds.listConnections(material, type = "materialInfo")
-    materialInfoNode = materialInfo[0] if materialInfo else None # Get the first materialInfo node
-    if materialInfoNode:
-        materialInfoNode = cmds.rename(materialInfoNode, f'{obj}_mInfo')
-
-    return [material, materialInfoNode]
+    return [material, materialInfo]
 
 
 def createTranslationControl(name):
@@ -535,182 +1675,107 @@ def createTranslationControl(name):
     # if called from a namespaced context (e.g., 'moduleNamespace:jointName').
     control = cmds.sphere(name = f'{name}_translation_control', ax = (0, 1, 0), ch = False)[0]
 
-    # Assign a red material to the control
-    material, materialInfo = assignMaterial(control, color = (1, 0, 0))
+    # Assign the pooled red material to the control
+    assignMaterial(control, color = (1, 0, 0))
 
-    # Create a container for the control and its associated nodes (material, materialInfo)
+    # Create a container for the control. The pooled material is shared and stays outside of it.
     # The container name will also be formed using the 'name' argument.
     container = createContainer(name = f'{name}_translation_container',
-                                nodesIn = [control, material, materialInfo],
+                                nodesIn = [control],
                                 includeHierarchyBelow = True,
-                                includeShaders = True,
+                                includeShaders = False,
                                 includeTransform = True,
                                 includeShapes = True)
 
     return [container, control]
 
 
-def createOrientationConnector(name):
+# Control shape files in `ControlObjects/` for each control type. These are the shipped assets, not copies of the
+# geometry the tool used to model per control, so the controls look different from those:
+#   - hierarchy_representation is a NURBS cylinder with a child arrow mesh transform,
+#   - hook_representation uses display type reference, the hook connector cannot be selected in the viewport,
+#   - controlGroup_control is a single 20 vertex, 9 face mesh instead of a cube with three crossing slabs.
+CONTROL_SHAPE_FILES = {
+    'orientationConnector': 'Blueprint/orientation_control',
+    'hierarchyConnector': 'Blueprint/hierarchy_representation',
+    'hookConnector': 'Blueprint/hook_representation',
+    'moduleTransform': 'Blueprint/controlGroup_control',
+}
+
+
+def createControlFromShapeFile(controlType, name, parent = None, assignMaterials = False):
     """
-    Creates a translation control as a red sphere, assigns a material, and adds it to a container.
+    Creates a control from its shape file in the control shape library. Nothing is kept in the scene between calls,
+    the shapes are built from the library's cached arrays.
 
     Args:
-        name (str): Name of the control object.
+        controlType (str): One of the keys of `CONTROL_SHAPE_FILES`.
+        name (str): Name of the new control transform.
+        parent (str, optional): Transform to parent the control under. The control is parented to the world if None.
+        assignMaterials (bool): Assign the materials stored in the shape file.
 
     Returns:
-        tuple: (controlObject, materialNode, materialInfoNode, containerNode)
+        tuple[str, list[str]]: The control transform and every shape below it.
     """
+    import System.controlShapeLibrary as controlShapeLibrary
 
-    # Create Y axis object
-    y_cube = cmds.polyCube(name = f'{name}_y_cube', width = 1, height = 1, depth = 0.3, ch = False)[0]
-    cmds.move(0.5, 0, 0, f'{y_cube}.f[5]', relative = True)
-    cmds.move(0.5, 0, 0, f'{y_cube}.f[4]', relative = True)
-
-
-    y_cone = cmds.polyCone(name = f'{name}_y_cone', sx = 8, sy = 1, sz = 0, r = 0.15, h = 0.3, heightBaseline = -1, ch = False)[0]
-    y_coneShape = cmds.listRelatives(y_cone, shapes = True, fullPath = True)
-    cmds.move(0.5, 0.5, 0, f'{y_cone}.vtx[0:8]', relative = True)
-
-    cmds.parent(y_coneShape, y_cube, shape = True, relative = True, noConnections = True)
-    cmds.delete(y_cone)
+    control = controlShapeLibrary.createControlShape(CONTROL_SHAPE_FILES[controlType], name = name, parent = parent, assignMaterials = assignMaterials)[0]
+    shapes = cmds.listRelatives(control, allDescendents = True, type = controlShapeLibrary.SHAPE_TYPES, fullPath = True) or []
 
-    y_material, y_materialInfo = assignMaterial(y_cube, color = (0, 1, 0), diffuse = 0.2)
+    return control, shapes
 
-    # Create Z axis object
-    z_cube = cmds.polyCube(name = f'{name}_z_cube', width = 1, height = 1, depth = 0.3, ch = False)[0]
-    cmds.rotate(90, 0, 0, f'{z_cube}.vtx[0:7]', relative = True)
-    cmds.move(0.5, 0, 0, f'{z_cube}.vtx[0:7]', relative = True)
 
+def createOrientationConnector(name):
+    """
+    Creates an orientation connector (green Y and blue Z axis arrows) from its shape file and adds it to a container.
 
-    z_cone = cmds.polyCone(name = f'{name}_z_cone', sx = 8, sy = 1, sz = 0, r = 0.15, h = 0.3, heightBaseline = -1, ch = False)[0]
-    z_coneShape = cmds.listRelatives(z_cone, shapes = True, fullPath = True)
-    cmds.rotate(90, 0, 0, f'{z_cone}.vtx[0:8]', relative = True, pivot = (0, 0, 0))
-    cmds.move(0.5 , 0, 0.5, f'{z_cone}.vtx[0:8]', relative = True)
-
-    cmds.parent(z_coneShape, z_cube, shape = True, relative = True, noConnections = True)
-
+    Args:
+        name (str): Base name of the connector, usually the joint name.
 
-    z_material, z_materialInfo = assignMaterial(z_cube, color = (0, 0, 1), diffuse = 0.2)
-    for shape in cmds.listRelatives(z_cube, shapes = True, fullPath = True):
-        cmds.parent(shape, y_cube, shape = True, relative = True, noConnections = True)
+    Returns:
+        list: [containerNode, connector, constrainedGrp]
+    """
 
-    cmds.delete(z_cube, z_cone)
-    connector = cmds.rename(y_cube, f'{name}_orientation_connector', ignoreShape = True)
+    constrainedGrp = cmds.group(empty = True, name = f'{name}_orientation_connector_parentConstrainedGrp')
 
-    constrainedGrp = cmds.group(empty = True, name = f'{connector}_parentConstrainedGrp')
-    cmds.parent(connector, constrainedGrp, absolute = True)
+    # The shape file assigns the green and blue materials per face
+    connector, shapes = createControlFromShapeFile('orientationConnector', f'{name}_orientation_connector', parent = constrainedGrp, assignMaterials = True)
 
-    # Create container and add nodes
-    container = createContainer(name = f'{name}_orientation_container', nodesIn = [connector, constrainedGrp, y_material, y_materialInfo, z_material, z_materialInfo], includeHierarchyBelow = True,
-                                includeShaders = True, includeTransform = True, includeShapes = True)
+    # Create container and add nodes, the pooled materials stay outside of it
+    container = createContainer(name = f'{name}_orientation_container', nodesIn = [connector, constrainedGrp], includeHierarchyBelow = True,
+                                includeShaders = False, includeTransform = True, includeShapes = True)
 
     return [container, connector, constrainedGrp]
 
 def createHierarchyConnector(name):
-    cylinder = cmds.polyCylinder(name = f'{name}_cylinder', sx = 8, sy = 1, sz = 1, height = 1, radius = 0.2, heightBaseline = -1, ch = False)[0]
-    cmds.delete(f'{cylinder}.f[8:23]')
+    constrainedGrp = cmds.group(empty = True, name = f'{name}_hierarchy_connector_parentConstrainedGrp')
+    connector, shapes = createControlFromShapeFile('hierarchyConnector', f'{name}_hierarchy_connector', parent = constrainedGrp)
 
-    cmds.rotate(0, 0, -90, f'{cylinder}.vtx[0:15]', relative = True, pivot = (0, 0, 0))
+    assignMaterial(shapes, color = (1.0, 0.8, 0), diffuse = 0.2)
 
-
-    cone = cmds.polyCone(name = f'{name}_cone', sx = 8, sy = 1, sz = 0, r = 0.75, h = 0.2, heightBaseline = -1, ch = False)[0]
-    coneShape = cmds.listRelatives(cone, shapes = True, fullPath = True)[0]
-
-    cmds.rotate(0, 0, -90, f'{cone}.vtx[0:8]', relative = True)
-
-    cmds.move(0.4, 0, 0, f'{cone}.vtx[0:8]', relative = True)
-
-    cmds.parent(coneShape, cylinder, shape = True, relative = True, noConnections = True)
-
-    material, materialInfo = assignMaterial(cylinder, color = (1.0, 0.8, 0), diffuse = 0.2)
-
-    cmds.delete(cone)
-    connector = cmds.rename(cylinder, f'{name}_hierarchy_connector', ignoreShape = True)
-
-    constrainedGrp = cmds.group(empty = True, name = f'{connector}_parentConstrainedGrp')
-    cmds.parent(connector, constrainedGrp, absolute = True)
-
-    # Create container and add nodes
-    container = createContainer(name = f'{name}_hierarchy_container', nodesIn = [connector, material, materialInfo, constrainedGrp], includeHierarchyBelow = True, includeShaders = True, includeTransform = True,
+    # Create container and add nodes, the pooled material stays outside of it
+    container = createContainer(name = f'{name}_hierarchy_container', nodesIn = [connector, constrainedGrp], includeHierarchyBelow = True, includeShaders = False, includeTransform = True,
                                 includeShapes = True)
 
     return [container, connector, constrainedGrp]
 
 def createHookConnector(name):
-    cylinder = cmds.cylinder(name = f'{name}_cylinder', radius = 0.2, heightRatio = 5, ch = False)[0]
+    constrainedGrp = cmds.group(empty = True, name = f'{name}_hook_connector_parentConstrainedGrp')
+    connector, shapes = createControlFromShapeFile('hookConnector', f'{name}_hook_connector', parent = constrainedGrp)
 
-    cmds.move(0.5, 0, 0, f'{cylinder}.cv[0:3][0:7]', relative = True)
+    assignMaterial(shapes, color = (0.5, 0.8, 0.8), diffuse = 0.2)
 
-    material, materialInfo = assignMaterial(cylinder, color = (0.5, 0.8, 0.8), diffuse = 0.2)
-
-    connector = cmds.rename(cylinder, f'{name}_hook_connector', ignoreShape = True)
-
-    constrainedGrp = cmds.group(empty = True, name = f'{connector}_parentConstrainedGrp')
-    cmds.parent(connector, constrainedGrp, absolute = True)
-
-    # Create container and add nodes
-    container = createContainer(name = f'{name}_hook_container', nodesIn = [connector, constrainedGrp, material, materialInfo], includeHierarchyBelow = True, includeShaders = True, includeTransform = True,
+    # Create container and add nodes, the pooled material stays outside of it
+    container = createContainer(name = f'{name}_hook_container', nodesIn = [connector, constrainedGrp], includeHierarchyBelow = True, includeShaders = False, includeTransform = True,
                                 includeShapes = True)
 
     return [container, connector, constrainedGrp]
 
 
 def createModuleTransformControl(name):
-    control = cmds.polyCube(name = name, width = 2, height = 2, depth = 2, ch = False)[0]
-
-    cubeX = cmds.polyCube(name = f'{name}_cubeX', width = 3, height = 3, depth = 3, ch = False)[0]
-    cubeXShape = cmds.listRelatives(cubeX, shapes = True, fullPath = True)[0]
-    cmds.move(0, 0, -1.5, f'{cubeXShape}.f[0]', relative = True)
-    cmds.move(0, 0, 1.5, f'{cubeXShape}.f[2]', relative = True)
-    cmds.move(0, -1.5, 0, f'{cubeXShape}.f[1]', relative = True)
-    cmds.move(0, 1.5, 0, f'{cubeXShape}.f[3]', relative = True)
-
-    cubeY = cmds.polyCube(name = f'{name}_cubeY', width = 3, height = 3, depth = 3, ch = False)[0]
-    cubeYShape = cmds.listRelatives(cubeY, shapes = True, fullPath = True)[0]
-    cmds.move(-1.5, 0, 0, f'{cubeYShape}.f[4]', relative = True)
-    cmds.move(1.5, 0, 0, f'{cubeYShape}.f[5]', relative = True)
-    cmds.move(0, 0, -1.5, f'{cubeYShape}.f[0]', relative = True)
-    cmds.move(0, 0, 1.5, f'{cubeYShape}.f[2]', relative = True)
-
-    cubeZ = cmds.polyCube(name = f'{name}_cubeZ', width = 3, height = 3, depth = 3, ch = False)[0]
-    cubeZShape = cmds.listRelatives(cubeZ, shapes = True, fullPath = True)[0]
-    cmds.move(-1.5, 0, 0, f'{cubeZShape}.f[4]', relative = True)
-    cmds.move(1.5, 0, 0, f'{cubeZShape}.f[5]', relative = True)
-    cmds.move(0, -1.5, 0, f'{cubeZShape}.f[1]', relative = True)
-    cmds.move(0, 1.5, 0, f'{cubeZShape}.f[3]', relative = True)
-
-    combined = cmds.polyUnite(control, cubeX, cubeY, cubeZ, ch = False, mergeUVSets = True)
-    control = cmds.rename(combined, name)
-    # cmds.parent(cubeXShape, cubeYShape, cubeZShape, control, shape = True, relative = True, noConnections = True)
-    # cmds.delete(cubeX, cubeY, cubeZ)
-
-    # for shape in cmds.listRelatives(name, shapes = True, fullPath = True):
-    #     cmds.setAttr(f'{shape}.overrideEnabled', 1)
-    #     cmds.setAttr(f'{shape}.overrideShading', 0)
-
-    shapes = cmds.listRelatives(control, shapes = True, fullPath = True) or []
-    for shape in shapes:
-        # Clean up unused groupId connections
-        connections = cmds.listConnections(shape, type = "groupId") or []
-        for conn in connections:
-            try:
-                cmds.delete(conn)
-            except:
-                pass
-
-        cmds.setAttr(f'{shape}.overrideEnabled', 1)
-        cmds.setAttr(f'{shape}.overrideShading', 0)
+    control, shapes = createControlFromShapeFile('moduleTransform', name)
 
     return control
 
 def doesBlueprintUserSpecifiedNameExist(name):
-    cmds.namespace(setNamespace = ':')
-    namespaces = cmds.namespaceInfo(listOnlyNamespaces = True)
-
-    names = []
-
-    for namespace in namespaces:
-        if namespace.find('__') != -1:
-            names.append(namespace.partition('__')[2])
-
-    return name in names # Returns bool
\ No newline at end of file
+    return sceneIndex.getSceneIndex().hasUserSpecifiedName(name) # Returns bool
\ No newline at end of file